@@ -1,19 +1,26 @@
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, List, Tuple
 import os
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import hashlib
+import time
 
 import boto3
-from strands import Agent
+from boto3.dynamodb.conditions import Attr
 from bedrock_agentcore import BedrockAgentCoreApp
 
 from logging_config import get_logger
-from tools import _make_mcp_client
+from pipeline import Node, Pipeline
+from sections import segment, tool_views
+from tools import call_mcp_tool, get_mcp_tools
 from utils import (
     safe_json_loads,
     extract_tool_text,
     extract_required_skill_names,
     denormalize_dynamodb_item,
+    record_version,
+    update_item_fields,
+    VersionConflict,
 )
 
 app = BedrockAgentCoreApp()
@@ -24,23 +31,333 @@ JD_TABLE_NAME = os.getenv("JD_TABLE_NAME", "jobs")
 _dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
 _jd_table = _dynamodb.Table(JD_TABLE_NAME)
 
+# Bump when any JD tool prompt changes so batch runs re-process otherwise unchanged JDs
+JD_PROMPT_VERSION = os.getenv("JD_PROMPT_VERSION", "1")
+BATCH_MAX_JDS = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+MAX_INFLIGHT_TOOL_CALLS = int(os.getenv("MAX_INFLIGHT_TOOL_CALLS", "12"))
+_tool_slots = asyncio.Semaphore(MAX_INFLIGHT_TOOL_CALLS)
 
-def _json_from_call(callable_fn, kwargs: Dict[str, Any]) -> Any:
-    r = callable_fn(**kwargs)
+# When set, list-producing tools write each item to the partial-results table as it
+# streams from Bedrock, keyed "<record id>#<result field>", so the webapp can show it early.
+PARTIAL_RESULTS_ENABLED = os.getenv("PARTIAL_RESULTS_ENABLED", "false").lower() == "true"
+
+# Write each result attribute as soon as its tool completes instead of once at the end.
+# Every UpdateItem is billed on the full item size, so this trades WCU for earlier reads.
+PERSIST_EACH_TOOL = os.getenv("PERSIST_EACH_TOOL", "false").lower() == "true"
+
+# Per tool-call node limits in the JD pipeline (see pipeline.py)
+TOOL_TIMEOUT_SECONDS = float(os.getenv("TOOL_TIMEOUT_SECONDS", "120"))
+TOOL_RETRIES = int(os.getenv("TOOL_RETRIES", "1"))
+
+# Segment each JD once (sections.py) and send every tool only the sections it reads, tagged
+# with canonical section names; benefits, company blurb and EEO text go to no tool
+JD_SECTION_ROUTING = os.getenv("JD_SECTION_ROUTING", "true").lower() == "true"
+
+JD_TOOL_NAMES = [
+    "extractskills___jd_extract_jd_skills",
+    "responsibilities___jd_responsibility_extractor",
+    "desiredexperienceeducation___jd_desired_experience_education",
+]
+
+
+async def _json_from_call(tool_name: str, kwargs: Dict[str, Any]) -> Any:
+    async with _tool_slots:
+        r = await call_mcp_tool(tool_name, kwargs)
     text = extract_tool_text(r)
+    if r.get("status") == "error":
+        raise RuntimeError(text or f"{tool_name} failed")
     return safe_json_loads(text) if text else {}
 
 
+def _with_partial_key(kwargs: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Ask a list-producing tool to also stream its items under `key` (see PARTIAL_RESULTS_ENABLED)."""
+    return {**kwargs, "partial_results_key": key} if PARTIAL_RESULTS_ENABLED else kwargs
+
+
+def _fingerprint(jd_text: str) -> str:
+    """Identifies a JD text + prompt version pair that has already been processed."""
+    return hashlib.sha256(f"{JD_PROMPT_VERSION}\x1f{jd_text}".encode("utf-8")).hexdigest()
+
+
+def _tool_event(jd_id: Any, key: str, results: Dict[str, Any], errors: Dict[str, str], t0: float) -> Dict[str, Any]:
+    event: Dict[str, Any] = {"type": "tool", "id": jd_id, "tool": key}
+    if key in results:
+        event["result"] = results[key]
+    else:
+        event["error"] = errors.get(key)
+    event["elapsed_ms"] = round((time.perf_counter() - t0) * 1000)
+    return event
+
+
+def _field_value(key: str, value: Any) -> Any:
+    if key == "responsibilities":
+        return value["responsibilities"]
+    return value
+
+
+def _jd_pipeline(item: Dict[str, Any], jd_text: str, jd_id: Any) -> Pipeline:
+    """The JD tool DAG; add a stage by adding a Node.
+
+    Responsibilities and education/desired experience wait for skills (to pass the
+    required skill names) but still run without them if skill extraction fails.
+    """
+    title = item.get("title") or "Unknown"
+    views = {"skills": jd_text, "responsibilities": jd_text, "education_desired_experience": jd_text}
+    if JD_SECTION_ROUTING:
+        sections = segment(jd_text)
+        views = tool_views(jd_text, sections)
+        _logger.info(
+            f"JD sections jd_id={jd_id} sections={','.join(s['name'] for s in sections)} len={len(jd_text)} "
+            + " ".join(f"{k}={len(v)}" for k, v in views.items())
+        )
+
+    async def skills(_inputs: Dict[str, Any]) -> Any:
+        return await _json_from_call("extractskills___jd_extract_jd_skills", {"jd": views["skills"]})
+
+    def required_skills(inputs: Dict[str, Any]) -> List[str]:
+        return extract_required_skill_names(inputs["skills"]) if "skills" in inputs else []
+
+    async def responsibilities(inputs: Dict[str, Any]) -> Any:
+        return await _json_from_call(
+            "responsibilities___jd_responsibility_extractor",
+            _with_partial_key(
+                {
+                    "title": title,
+                    "years_of_experience": str(item.get("years_of_experience") or "unknown"),
+                    "seniority_level": item.get("seniority_level") or "unknown",
+                    "jd": views["responsibilities"],
+                    "must_have_skills": required_skills(inputs),
+                },
+                f"{jd_id}#responsibilities",
+            ),
+        )
+
+    async def education_desired_experience(inputs: Dict[str, Any]) -> Any:
+        return await _json_from_call(
+            "desiredexperienceeducation___jd_desired_experience_education",
+            {"title": title, "jd": views["education_desired_experience"], "must_have_skills": required_skills(inputs)},
+        )
+
+    limits = {"timeout_s": TOOL_TIMEOUT_SECONDS, "retries": TOOL_RETRIES}
+    return Pipeline([
+        Node("skills", skills, **limits),
+        Node("responsibilities", responsibilities, soft_deps=["skills"], **limits),
+        Node("education_desired_experience", education_desired_experience, soft_deps=["skills"], **limits),
+    ])
+
+
+async def _iter_jd(item: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    """Run skills -> (responsibilities || education/desired experience) for one JD and persist.
+
+    Yields a "tool" event per tool as soon as it finishes, then a "summary" event once
+    the JD record is persisted (or a single "error" event if it cannot start).
+    """
+    t0 = time.perf_counter()
+    jd_id = item.get("id")
+    jd_text = item.get("jd_text") or item.get("text") or ""
+    if not jd_text:
+        _logger.error(f"JD has no text jd_id={jd_id}")
+        yield {"type": "error", "id": jd_id, "error": f"JD '{jd_id}' has no text"}
+        return
+    _logger.info(f"Loaded JD text jd_id={jd_id} jd_len={len(jd_text)}")
+
+    # Resolve MCP tools from the runtime-wide session (reconnects only when unhealthy)
+    t_setup = time.perf_counter()
+    _, warm = await asyncio.to_thread(get_mcp_tools, JD_TOOL_NAMES)
+    _logger.info(f"Resolved MCP tools warm={warm} setup_ms={(time.perf_counter() - t_setup) * 1000:.0f}")
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+
+    # Results are written with field-level UpdateItem guarded by the record's version
+    # attribute, so jd_text is never rewritten and a concurrent run cannot be clobbered
+    version = record_version(item)
+    persisted: List[str] = []
+
+    async def persist(fields: Dict[str, Any]) -> None:
+        nonlocal version
+        if not fields or "persist" in errors:
+            return
+        t_write = time.perf_counter()
+        try:
+            version, wcu = await asyncio.to_thread(update_item_fields, _jd_table, {"id": str(jd_id)}, fields, version)
+        except VersionConflict as e:
+            errors["persist"] = str(e)
+            _logger.warning(f"JD changed since load, not persisting jd_id={jd_id} error={e}")
+            return
+        persisted.extend(fields)
+        _logger.info(f"Persisted JD fields jd_id={jd_id} fields={list(fields)} version={version} wcu={wcu} write_ms={(time.perf_counter() - t_write) * 1000:.0f}")
+
+    pipeline = _jd_pipeline(item, jd_text, jd_id)
+    _logger.info(f"Running JD pipeline nodes={list(pipeline.nodes)}")
+    async for res in pipeline.run():
+        key = res.name
+        if res.ok:
+            results[key] = res.value
+            _logger.info(f"Tool completed tool={key} jd_id={jd_id} attempts={res.attempts}")
+            # Skills are persisted as soon as they arrive; the rest per PERSIST_EACH_TOOL
+            if key == "skills" or PERSIST_EACH_TOOL:
+                await persist({key: _field_value(key, res.value)})
+        else:
+            _logger.error(f"Tool call failed tool={key} jd_id={jd_id} attempts={res.attempts} error={res.error}")
+            errors[key] = res.error or "failed"
+        yield _tool_event(jd_id, key, results, errors, t0)
+    timing = pipeline.report()
+    _logger.info(f"JD pipeline done jd_id={jd_id} total_ms={timing['total_ms']} critical_path={timing['critical_path']}")
+
+    update_fields: Dict[str, Any] = {}
+    if not PERSIST_EACH_TOOL:
+        for key in ("education_desired_experience", "responsibilities"):
+            if key in results:
+                update_fields[key] = _field_value(key, results[key])
+    if not errors:
+        update_fields["processed_fingerprint"] = _fingerprint(jd_text)
+    await persist(update_fields)
+
+    yield {
+        "type": "summary",
+        "id": jd_id,
+        "updated": bool(persisted),
+        "completed": sorted(results),
+        "errors": errors,
+        "elapsed_ms": round((time.perf_counter() - t0) * 1000),
+        "timing": timing,
+    }
+
+
+async def _process_jd(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Non-streaming form of `_iter_jd`: one combined result for the JD."""
+    results: Dict[str, Any] = {}
+    async for event in _iter_jd(item):
+        if event["type"] == "error":
+            return {"error": event["error"]}
+        if event["type"] == "tool" and "result" in event:
+            results[event["tool"]] = event["result"]
+        if event["type"] == "summary":
+            return {"id": event["id"], "updated": event["updated"], "results": results, "errors": event["errors"]}
+    return {"error": "JD processing ended without a summary"}
+
+
+def _batch_get_jds(ids: List[str]) -> List[Dict[str, Any]]:
+    """BatchGetItem in chunks of 100, retrying UnprocessedKeys with backoff."""
+    items: List[Dict[str, Any]] = []
+    for i in range(0, len(ids), 100):
+        request: Dict[str, Any] = {JD_TABLE_NAME: {"Keys": [{"id": jid} for jid in ids[i:i + 100]]}}
+        attempt = 0
+        while request:
+            resp = _dynamodb.batch_get_item(RequestItems=request)
+            items.extend(denormalize_dynamodb_item(it) for it in resp.get("Responses", {}).get(JD_TABLE_NAME, []))
+            request = resp.get("UnprocessedKeys") or {}
+            if request:
+                attempt += 1
+                time.sleep(min(0.05 * (2 ** attempt), 2.0))
+    return items
+
+
+def _scan_segment(segment: int, total_segments: int, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    kwargs: Dict[str, Any] = {"Segment": segment, "TotalSegments": total_segments}
+    condition = None
+    for name, value in (filters or {}).items():
+        cond = Attr(name).eq(value)
+        condition = cond if condition is None else condition & cond
+    if condition is not None:
+        kwargs["FilterExpression"] = condition
+    items: List[Dict[str, Any]] = []
+    while True:
+        resp = _jd_table.scan(**kwargs)
+        items.extend(denormalize_dynamodb_item(it) for it in resp.get("Items", []))
+        if not resp.get("LastEvaluatedKey"):
+            return items
+        kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+
+async def _scan_jds(scan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Parallel segment scan: {"filter": {attr: value, ...}, "segments": N}."""
+    segments = max(1, int(scan.get("segments") or 4))
+    parts = await asyncio.gather(
+        *(asyncio.to_thread(_scan_segment, seg, segments, scan.get("filter") or {}) for seg in range(segments))
+    )
+    return [it for part in parts for it in part]
+
+
+async def _iter_batch(payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    """Process many JDs; yields one record per JD, then a summary."""
+    t0 = time.perf_counter()
+    force = bool(payload.get("force"))
+    if payload.get("jd_ids"):
+        items = await asyncio.to_thread(_batch_get_jds, list(dict.fromkeys(str(i) for i in payload["jd_ids"])))
+    else:
+        items = await _scan_jds(payload.get("scan") or {})
+
+    todo: List[Dict[str, Any]] = []
+    skipped = 0
+    for item in items:
+        jd_text = item.get("jd_text") or item.get("text") or ""
+        if not force and jd_text and item.get("processed_fingerprint") == _fingerprint(jd_text):
+            skipped += 1
+            yield {"type": "jd", "id": item.get("id"), "skipped": True}
+            continue
+        todo.append(item)
+    _logger.info(f"JD batch start total={len(items)} to_process={len(todo)} skipped_unchanged={skipped}")
+
+    processed = failed = 0
+    slots = asyncio.Semaphore(BATCH_MAX_JDS)
+
+    async def run(item: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        async with slots:
+            try:
+                return item.get("id"), await _process_jd(item)
+            except Exception as e:
+                return item.get("id"), {"error": str(e)}
+
+    tasks = [asyncio.ensure_future(run(item)) for item in todo]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            jd_id, out = await next_done
+            ok = "error" not in out and not out.get("errors")
+            processed += 1
+            failed += 0 if ok else 1
+            yield {
+                "type": "jd",
+                "id": jd_id,
+                "skipped": False,
+                "updated": bool(out.get("updated")),
+                "error": out.get("error"),
+                "errors": out.get("errors") or {},
+            }
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    elapsed = time.perf_counter() - t0
+    _logger.info(f"JD batch done processed={processed} failed={failed} skipped={skipped} elapsed_s={elapsed:.1f}")
+    yield {
+        "type": "summary",
+        "processed": processed,
+        "failed": failed,
+        "skipped": skipped,
+        "elapsed_s": round(elapsed, 2),
+        "jds_per_minute": round(processed / elapsed * 60, 1) if elapsed > 0 else 0.0,
+    }
+
+
+# Async entrypoint: the runtime serves every session on one event loop, so concurrent
+# sessions share the MCP session, DynamoDB client and OAuth token without a thread each.
 @app.entrypoint
-def handler(payload: Dict[str, Any]) -> Dict[str, Any]:
-    jd_id = (payload or {}).get("jd_id")
+async def handler(payload: Dict[str, Any]):
+    payload = payload or {}
+    if payload.get("jd_ids") or payload.get("scan") is not None:
+        # Batch mode streams one completion record per JD
+        return _iter_batch(payload)
+
+    jd_id = payload.get("jd_id")
     if not jd_id:
         return {"error": "Missing 'jd_id' in payload"}
     _logger.info(f"Received JD processing request jd_id={jd_id}")
 
     # Fetch JD record
     _logger.info(f"Fetching JD from DynamoDB table={JD_TABLE_NAME}")
-    resp = _jd_table.get_item(Key={"id": str(jd_id)})
+    resp = await asyncio.to_thread(_jd_table.get_item, Key={"id": str(jd_id)})
     item = resp.get("Item")
     if not item:
         _logger.error(f"JD not found jd_id={jd_id}")
@@ -48,95 +365,10 @@ def handler(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     # Convert AV-shaped items to plain Python types if needed
     item = denormalize_dynamodb_item(item)
-
-    jd_text = item.get("jd_text") or item.get("text") or ""
-    if not jd_text:
-        _logger.error(f"JD has no text jd_id={jd_id}")
-        return {"error": f"JD '{jd_id}' has no text"}
-    _logger.info(f"Loaded JD text jd_id={jd_id} jd_len={len(jd_text)}")
-
-    # Resolve MCP tools and keep session open for all operations
-    _logger.info("Resolving MCP tools")
-    with _make_mcp_client() as mcp_client:
-        all_tools = mcp_client.list_tools_sync()
-        def by_name(name: str):
-            for t in all_tools:
-                tool_obj = getattr(t, "mcp_tool", t)
-                tname = getattr(tool_obj, "name", None) or (tool_obj.get("name") if isinstance(tool_obj, dict) else None)
-                if tname == name:
-                    return t
-            raise RuntimeError(f"MCP tool '{name}' not found")
-
-        skills_tool = by_name("extractskills___jd_extract_jd_skills")
-        resp_tool = by_name("responsibilities___jd_responsibility_extractor")
-        expedu_tool = by_name("desiredexperienceeducation___jd_desired_experience_education")
-        _logger.info("Resolved MCP tools")
-
-        agent = Agent(tools=[skills_tool, resp_tool, expedu_tool])
-
-        # 1) Call skills tool first and persist
-        results: Dict[str, Any] = {}
-        errors: Dict[str, str] = {}
-        try:
-            _logger.info("Invoking skills tool")
-            skills_json = _json_from_call(agent.tool.extractskills___jd_extract_jd_skills, {"jd": jd_text})
-            results["skills"] = skills_json
-            # Persist raw skills (or nested under 'skills' key)
-            _jd_table.put_item(Item={**item, "skills": skills_json})
-            item = {**item, "skills": skills_json}
-            _logger.info(f"Persisted skills jd_id={jd_id} has_skills_key={isinstance(skills_json, dict) and ('skills' in skills_json)}")
-        except Exception as e:
-            _logger.error(f"jd_extract_jd_skills failed jd_id={jd_id} error={str(e)}")
-            errors["skills"] = str(e)
-
-        # Derive required skill names for downstream tools
-        required_skill_names = extract_required_skill_names(results.get("skills")) if "skills" in results else []
-
-        # 2) Call remaining tools in parallel
-        _logger.info(f"Invoking remaining tools in parallel required_skills_count={len(required_skill_names)}")
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            futures = {
-                "responsibilities": executor.submit(
-                    _json_from_call,
-                    agent.tool.responsibilities___jd_responsibility_extractor,
-                    {
-                        "title": item.get("title") or "Unknown",
-                        "years_of_experience": str(item.get("years_of_experience") or "unknown"),
-                        "seniority_level": item.get("seniority_level") or "unknown",
-                        "jd": jd_text,
-                        "must_have_skills": required_skill_names  or [],
-                    },
-                ),
-                "education_desired_experience": executor.submit(
-                    _json_from_call,
-                    agent.tool.desiredexperienceeducation___jd_desired_experience_education,
-                    {
-                        "title": item.get("title") or "Unknown",
-                        "jd": jd_text,
-                        "must_have_skills": required_skill_names  or [],
-                    },
-                ),
-            }
-            for key, fut in futures.items():
-                try:
-                    results[key] = fut.result()
-                    _logger.info(f"Tool completed tool={key} jd_id={jd_id}")
-                except Exception as e:
-                    _logger.error(f"Tool call failed tool={key} jd_id={jd_id} error={str(e)}")
-                    errors[key] = str(e)
-
-        update_fields: Dict[str, Any] = {}
-        if "education_desired_experience" in results:
-            update_fields["education_desired_experience"] = results["education_desired_experience"]
-        if "responsibilities" in results:
-            resp_val = results["responsibilities"]
-            update_fields["responsibilities"] = resp_val["responsibilities"]
-
-        if update_fields:
-            _logger.info(f"Persisting updates jd_id={jd_id} fields={list(update_fields.keys())}")
-            _jd_table.put_item(Item={**item, **update_fields})
-
-    return {"id": jd_id, "updated": bool(update_fields) or ("skills" in results), "results": results, "errors": errors}
+    if payload.get("stream"):
+        # Streaming mode: per-tool events followed by a summary
+        return _iter_jd(item)
+    return await _process_jd(item)
 
 if __name__ == "__main__":
     app.run()
@@ -0,0 +1,99 @@
+from typing import Any, Dict, List, Optional, Sequence
+import re
+
+
+# Deterministic JD segmentation: short lines matching a known heading (optionally "#"/"**"
+# decorated, ":"-suffixed or followed by inline content) start a section, named with the
+# canonical source_section names the JD tool prompts use. Text before the first heading is
+# the "Job Summary".
+_HEADINGS = (
+    ("Responsibilities", r"(?:key |main |core |primary |your |job |role )?(?:responsibilities|duties)"
+                         r"|what you(?:'ll| will) (?:do|be doing|work on)|the role|your role|in this role(?: you will)?"
+                         r"|day[\s-]to[\s-]day|what the job involves|your impact|you will"),
+    ("Must Have", r"must[\s-]haves?|must have (?:skills|requirements|qualifications)|non[\s-]negotiables"),
+    ("Preferred", r"(?:preferred|desired|additional|bonus) (?:qualifications|skills|requirements|experience)"
+                  r"|nice[\s-]to[\s-]haves?|bonus points|pluses|good to have|preferred"),
+    ("Qualifications", r"(?:basic |minimum |required |key |your )?qualifications|education(?: (?:and|&) experience)?"
+                       r"|certifications?"),
+    ("Requirements", r"(?:key |job |minimum |technical )?requirements|what you(?:'ll| will)? (?:need|bring|have)"
+                     r"|what we(?:'re| are) looking for|skills(?: (?:and|&) (?:experience|qualifications))?"
+                     r"|(?:required |technical |key )skills|experience|(?:skills|experience) required"),
+    ("About You", r"about you|who you are|you are|you have|your profile|ideal candidate|the ideal candidate"),
+    ("Job Summary", r"(?:job |role |position )?(?:summary|overview|description)|about the (?:role|job|position|opportunity)"),
+    ("Benefits", r"benefits|perks(?: (?:and|&) benefits)?|what we offer|what's in it for you|compensation(?: (?:and|&) benefits)?"
+                 r"|salary(?: range)?|pay range|why join us|why work (?:with|for) us"),
+    ("About Company", r"about (?:us|the company|the team|our company)|who we are|our (?:company|mission|story|culture)"
+                      r"|company overview"),
+    ("Legal", r"equal (?:employment )?opportunity(?: employer)?|eeo(?: statement)?|diversity (?:and|&) inclusion"
+              r"|how to apply|application process|accommodations?"),
+)
+_NAMES = [name for name, _ in _HEADINGS]
+_HEADING = re.compile(
+    r"^\s*(?:#+\s*|\*\*)?(?:" + "|".join(f"(?P<g{i}>{rx})" for i, (_, rx) in enumerate(_HEADINGS))
+    + r")\s*(?:\*\*)?\s*(?::\s*(?:\*\*)?\s*(?P<inline>.*))?$",
+    re.IGNORECASE,
+)
+_HEADING_MAX_CHARS = 60
+# Never sent to any JD tool: nothing in them is a skill, responsibility or requirement
+DROPPED = ("Benefits", "About Company", "Legal")
+
+
+def _heading_name(line: str) -> Optional[str]:
+    stripped = line.strip().strip("=-_|").strip()
+    if not stripped or len(stripped) > 400:
+        return None
+    m = _HEADING.match(stripped)
+    if not m or len(stripped) - len(m.group("inline") or "") > _HEADING_MAX_CHARS:
+        return None
+    return next(_NAMES[i] for i in range(len(_NAMES)) if m.group(f"g{i}"))
+
+
+def segment(jd_text: str) -> List[Dict[str, Any]]:
+    """Sections in reading order: {name, heading, start, end} with character offsets."""
+    sections: List[Dict[str, Any]] = []
+    current: Dict[str, Any] = {"name": "Job Summary", "heading": "", "start": 0}
+    offset = 0
+    for line in jd_text.splitlines(keepends=True):
+        name = _heading_name(line)
+        if name:
+            current["end"] = offset
+            sections.append(current)
+            current = {"name": name, "heading": line.strip(), "start": offset}
+        offset += len(line)
+    current["end"] = len(jd_text)
+    sections.append(current)
+    return [s for s in sections if jd_text[s["start"]:s["end"]].strip()]
+
+
+def view(jd_text: str, sections: List[Dict[str, Any]], keep: Optional[Sequence[str]], require: Sequence[str] = ()) -> str:
+    """The JD restricted to `keep` sections (None = all but DROPPED), each under a
+    "[<canonical name>]" tag line; the full text when no heading was found or none of
+    `require` is present."""
+    names = {s["name"] for s in sections}
+    if not any(s["heading"] for s in sections) or (require and not names.intersection(require)):
+        return jd_text
+    parts: List[str] = []
+    for s in sections:
+        if s["name"] in DROPPED or (keep is not None and s["name"] not in keep):
+            continue
+        parts.append(f"[{s['name']}]\n{jd_text[s['start']:s['end']].strip()}")
+    return "\n\n".join(parts) if parts else jd_text
+
+
+# Sections each JD tool reads, and the ones that must be present to narrow its input at all
+TOOL_SECTIONS: Dict[str, Dict[str, Any]] = {
+    # Required vs preferred is decided from the section a skill appears in, so only boilerplate is dropped
+    "skills": {"keep": None, "require": ()},
+    "responsibilities": {"keep": ("Job Summary", "Responsibilities"), "require": ("Responsibilities",)},
+    "education_desired_experience": {
+        "keep": ("Job Summary", "Requirements", "Qualifications", "Must Have", "Preferred", "About You"),
+        "require": ("Requirements", "Qualifications", "Must Have", "About You"),
+    },
+}
+
+
+def tool_views(jd_text: str, sections: Optional[List[Dict[str, Any]]] = None) -> Dict[str, str]:
+    """Per-tool JD text for the tools in TOOL_SECTIONS."""
+    if sections is None:
+        sections = segment(jd_text)
+    return {tool: view(jd_text, sections, spec["keep"], spec["require"]) for tool, spec in TOOL_SECTIONS.items()}
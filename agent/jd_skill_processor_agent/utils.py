@@ -1,16 +1,13 @@
-import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+from decimal import Decimal
+
+from json_repair import extract_json
 
 
 def safe_json_loads(text: str) -> Any:
-    try:
-        return json.loads(text)
-    except Exception:
-        import re
-        m = re.search(r"(\{[\s\S]*\}|\[[\s\S]*\])", text)
-        if m:
-            return json.loads(m.group(1))
-        raise
+    """Tool output as JSON: the first complete object/array in it, with truncated output
+    closed (json_repair.py). Raises ValueError when there is none."""
+    return extract_json(text)
 
 
 def extract_tool_text(result: Dict[str, Any]) -> str:
@@ -110,3 +107,70 @@ def denormalize_dynamodb_item(item: Dict[str, Any]) -> Dict[str, Any]:
     return {k: _denormalize_attr(v) for k, v in item.items()} if needs else item
 
 
+def to_dynamodb_compatible(value: Any) -> Any:
+    """Recursively convert floats to Decimal and leave other types as-is for DynamoDB.
+
+    - dict: convert values
+    - list/tuple: convert each item
+    - float: Decimal(str(x)) to avoid binary float issues
+    - int/str/bool/None: unchanged
+    """
+    if isinstance(value, dict):
+        return {k: to_dynamodb_compatible(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [to_dynamodb_compatible(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(to_dynamodb_compatible(v) for v in value)
+    if isinstance(value, float):
+        return Decimal(str(value))
+    return value
+
+
+class VersionConflict(Exception):
+    """The record changed (its version attribute moved) since this run loaded it."""
+
+
+def record_version(item: Dict[str, Any], version_attr: str = "version") -> Optional[int]:
+    value = (item or {}).get(version_attr)
+    return int(value) if value is not None else None
+
+
+def update_item_fields(
+    table: Any,
+    key: Dict[str, Any],
+    fields: Dict[str, Any],
+    expected_version: Optional[int],
+    version_attr: str = "version",
+) -> Tuple[int, float]:
+    """UpdateItem that SETs only `fields` and bumps `version_attr`.
+
+    The write is conditional on the stored version still being `expected_version` (None:
+    the record has never been versioned). Returns (new_version, consumed WCU); raises
+    VersionConflict when another writer got there first.
+    """
+    names = {"#v": version_attr}
+    values: Dict[str, Any] = {":one": 1, ":zero": 0}
+    sets = ["#v = if_not_exists(#v, :zero) + :one"]
+    for i, (name, value) in enumerate(fields.items()):
+        names[f"#f{i}"] = name
+        values[f":f{i}"] = to_dynamodb_compatible(value)
+        sets.append(f"#f{i} = :f{i}")
+    if expected_version is None:
+        condition = "attribute_not_exists(#v)"
+    else:
+        condition = "#v = :expected"
+        values[":expected"] = expected_version
+    try:
+        resp = table.update_item(
+            Key=key,
+            UpdateExpression="SET " + ", ".join(sets),
+            ConditionExpression=condition,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ReturnValues="UPDATED_NEW",
+            ReturnConsumedCapacity="TOTAL",
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException as e:
+        raise VersionConflict(f"{key} is no longer at {version_attr}={expected_version}") from e
+    wcu = float((resp.get("ConsumedCapacity") or {}).get("CapacityUnits") or 0)
+    return int(resp["Attributes"][version_attr]), wcu
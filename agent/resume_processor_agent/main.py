@@ -1,19 +1,24 @@
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import os
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import time
 
 import boto3
-from strands import Agent
 from bedrock_agentcore import BedrockAgentCoreApp
 
 from logging_config import get_logger
-from tools import _make_mcp_client
+from pipeline import Node, Pipeline
+from sections import segment, tool_views
+from skill_index import SkillIndex
+from tools import call_mcp_tool, get_mcp_tools
 from utils import (
     safe_json_loads,
     extract_tool_text,
     denormalize_dynamodb_item,
-    to_dynamodb_compatible,
+    record_version,
+    update_item_fields,
+    VersionConflict,
 )
 
 
@@ -28,13 +33,57 @@ _dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
 _jobs = _dynamodb.Table(JOBS_TABLE)
 _cands = _dynamodb.Table(CAND_TABLE)
 
+# Batch mode: candidates processed at once, and a global cap on in-flight MCP tool calls
+# shared by every candidate (and every session) served by this runtime's event loop.
+CAND_JOB_INDEX = os.getenv("CANDIDATE_JOB_INDEX_NAME", "GSI1")
+BATCH_MAX_CANDIDATES = int(os.getenv("BATCH_MAX_CONCURRENCY", "8"))
+MAX_INFLIGHT_TOOL_CALLS = int(os.getenv("MAX_INFLIGHT_TOOL_CALLS", "24"))
+_tool_slots = asyncio.Semaphore(MAX_INFLIGHT_TOOL_CALLS)
 
-def _json_from_call(callable_fn, kwargs: Dict[str, Any]) -> Any:
-    r = callable_fn(**kwargs)
+# When set, list-producing tools write each item to the partial-results table as it
+# streams from Bedrock, keyed "<record id>#<result field>", so the webapp can show it early.
+PARTIAL_RESULTS_ENABLED = os.getenv("PARTIAL_RESULTS_ENABLED", "false").lower() == "true"
+
+# Write each result attribute as soon as its tool completes instead of once at the end.
+# Every UpdateItem is billed on the full item size, so this trades WCU for earlier reads.
+PERSIST_EACH_TOOL = os.getenv("PERSIST_EACH_TOOL", "false").lower() == "true"
+
+# Per tool-call node limits in the candidate pipeline (see pipeline.py)
+TOOL_TIMEOUT_SECONDS = float(os.getenv("TOOL_TIMEOUT_SECONDS", "120"))
+TOOL_RETRIES = int(os.getenv("TOOL_RETRIES", "1"))
+
+# Send resume_skills_scorer the matched resume lines per skill (skill_index.py) so it
+# scores from a compact evidence pack instead of reading the whole resume
+SKILL_EVIDENCE_PACK = os.getenv("SKILL_EVIDENCE_PACK", "true").lower() == "true"
+
+# Segment each resume once (sections.py) and send the PI extractor, sparse checker and
+# education evaluator only the sections they read; the other tools get the full resume
+RESUME_SECTION_ROUTING = os.getenv("RESUME_SECTION_ROUTING", "true").lower() == "true"
+
+RESUME_TOOL_NAMES = [
+    "skillscorer___resume_skills_scorer",
+    "sparsecheck___resume_sparse_checker",
+    "pi___resume_pi_extractor",
+    "desirediexpeval___resume_desired_experience_scorer",
+    "educationeval___resume_education_evaluator",
+    "summarizer___resume_summarizer",
+]
+
+
+async def _json_from_call(tool_name: str, kwargs: Dict[str, Any]) -> Any:
+    async with _tool_slots:
+        r = await call_mcp_tool(tool_name, kwargs)
     text = extract_tool_text(r)
+    if r.get("status") == "error":
+        raise RuntimeError(text or f"{tool_name} failed")
     return safe_json_loads(text) if text else {}
 
 
+def _with_partial_key(kwargs: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Ask a list-producing tool to also stream its items under `key` (see PARTIAL_RESULTS_ENABLED)."""
+    return {**kwargs, "partial_results_key": key} if PARTIAL_RESULTS_ENABLED else kwargs
+
+
 def _build_skills_with_context(job: Dict[str, Any]) -> List[Dict[str, str]]:
     # Expect skills object like in JD agent; fallback to empty
     skills = job.get("skills") or {}
@@ -60,114 +109,319 @@ def _build_skills_with_context(job: Dict[str, Any]) -> List[Dict[str, str]]:
     return items
 
 
+def _job_inputs(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Job-derived tool inputs; computed once per job and shared by all its candidates."""
+    skills_with_context = _build_skills_with_context(job)
+    ede = job.get("education_desired_experience") or {}
+    desired_experience = [d.get("experience") for d in (ede.get("desired_experience") or []) if isinstance(d, dict) and d.get("experience")] if isinstance(ede, dict) else []
+    jd_edu_list = []
+    edu = ede.get("education_preference") if isinstance(ede, dict) else []
+    for x in (edu or []):
+        if isinstance(x, dict) and x.get("education"):
+            jd_edu_list.append(x.get("education"))
+    return {
+        "skills_with_context": skills_with_context,
+        "skill_index": SkillIndex([s["skill"] for s in skills_with_context]),
+        "desired_experience": desired_experience,
+        "jd_edu_list": jd_edu_list,
+        "jd_text": job.get("jd_text") or job.get("text") or "",
+    }
+
+
+def _load_job(job_id: Optional[str]) -> Dict[str, Any]:
+    if not job_id:
+        return {}
+    _logger.info(f"Fetching job table={JOBS_TABLE} id={job_id}")
+    j = _jobs.get_item(Key={"id": str(job_id)}).get("Item")
+    return denormalize_dynamodb_item(j or {})
+
+
+# Candidate record field each tool's result is persisted under
+RESULT_FIELDS = {
+    "pi": "pi_details",
+    "sparse": "sparse_resume",
+    "resume_summary": "resume_summary",
+    "skills": "skills_eval",
+    "desired_exp_eval": "desired_exp_eval",
+    "education_eval": "education_eval",
+}
+
+
+def _field_value(k: str, value: Any) -> Any:
+    if k == "sparse" and isinstance(value, dict):
+        return value.get("sparse_resume")
+    return value
+
+
+def _candidate_pipeline(cand_id: Any, resume_text: str, job_in: Dict[str, Any]) -> Pipeline:
+    """The resume tool DAG; add a stage by adding a Node (and its RESULT_FIELDS entry)."""
+
+    def call(tool_name: str, kwargs: Dict[str, Any]) -> Any:
+        return lambda _inputs: _json_from_call(tool_name, kwargs)
+
+    skills_with_context = job_in["skills_with_context"]
+    desired_experience = job_in["desired_experience"]
+    jd_edu_list = job_in["jd_edu_list"]
+    skills_in: Dict[str, Any] = {"resume_text": resume_text, "skills_with_context": skills_with_context}
+    if SKILL_EVIDENCE_PACK:
+        skills_in["evidence_pack"] = job_in["skill_index"].evidence_pack(resume_text)
+    views = {"pi": resume_text, "sparse": resume_text, "education_eval": resume_text}
+    if RESUME_SECTION_ROUTING:
+        sections = segment(resume_text)
+        views = tool_views(resume_text, sections)
+        _logger.info(
+            f"Resume sections id={cand_id} sections={','.join(s['type'] for s in sections)} len={len(resume_text)} "
+            + " ".join(f"{k}={len(v)}" for k, v in views.items())
+        )
+    limits = {"timeout_s": TOOL_TIMEOUT_SECONDS, "retries": TOOL_RETRIES}
+    return Pipeline([
+        Node("sparse", call("sparsecheck___resume_sparse_checker", {"resume_text": views["sparse"]}), **limits),
+        Node("pi", call("pi___resume_pi_extractor", {"resume_text": views["pi"]}), **limits),
+        Node("skills", call("skillscorer___resume_skills_scorer", _with_partial_key(skills_in, f"{cand_id}#skills_eval")), **limits),
+        Node("desired_exp_eval", call("desirediexpeval___resume_desired_experience_scorer", _with_partial_key({"resume_text": resume_text, "desired_experience": desired_experience}, f"{cand_id}#desired_exp_eval")), **limits),
+        Node("education_eval", call("educationeval___resume_education_evaluator", _with_partial_key({"jd_education_and_certifications": jd_edu_list, "resume_text": views["education_eval"]}, f"{cand_id}#education_eval")), **limits),
+        # The summarizer's optional inputs are the JD requirement lists (not scorer outputs),
+        # so it needs no upstream node and runs alongside the scorers
+        Node("resume_summary", call("summarizer___resume_summarizer", {
+            "jd_text": job_in["jd_text"],
+            "resume_text": resume_text,
+            "skills": [s["skill"] for s in skills_with_context],
+            "desired_experience": desired_experience,
+            "education": jd_edu_list,
+        }), **limits),
+    ])
+
+
+async def _iter_candidate(c: Dict[str, Any], job_in: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    """Run all resume tools for one loaded candidate and persist the results.
+
+    Yields a "tool" event per tool as soon as it finishes, then a "summary" event once
+    the candidate record is persisted (or a single "error" event if it cannot start).
+    """
+    t0 = time.perf_counter()
+    cand_id = c.get("id")
+    resume_text = c.get("resume_text") or ""
+    if not resume_text:
+        _logger.error(f"Candidate has no resume_text id={cand_id}")
+        yield {"type": "error", "id": cand_id, "error": f"Candidate '{cand_id}' has no resume_text"}
+        return
+    _logger.info(f"Loaded resume text id={cand_id} len={len(resume_text)}")
+
+    # Resolve MCP tools from the runtime-wide session (reconnects only when unhealthy)
+    t_setup = time.perf_counter()
+    _, warm = await asyncio.to_thread(get_mcp_tools, RESUME_TOOL_NAMES)
+    _logger.info(f"Resolved MCP tools for resume processing warm={warm} setup_ms={(time.perf_counter() - t_setup) * 1000:.0f}")
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+
+    # Results are written with field-level UpdateItem guarded by the record's version
+    # attribute, so resume_text is never rewritten and a concurrent run cannot be clobbered
+    version = record_version(c)
+    persisted: List[str] = []
+
+    async def persist(fields: Dict[str, Any]) -> None:
+        nonlocal version
+        if not fields or "persist" in errors:
+            return
+        t_write = time.perf_counter()
+        try:
+            version, wcu = await asyncio.to_thread(update_item_fields, _cands, {"id": str(cand_id)}, fields, version)
+        except VersionConflict as e:
+            errors["persist"] = str(e)
+            _logger.warning(f"Candidate changed since load, not persisting id={cand_id} error={e}")
+            return
+        persisted.extend(fields)
+        _logger.info(f"Persisted candidate fields id={cand_id} fields={list(fields)} version={version} wcu={wcu} write_ms={(time.perf_counter() - t_write) * 1000:.0f}")
+
+    pipeline = _candidate_pipeline(cand_id, resume_text, job_in)
+    _logger.info(f"Running candidate pipeline nodes={list(pipeline.nodes)}")
+    async for res in pipeline.run():
+        k = res.name
+        event: Dict[str, Any] = {"type": "tool", "id": cand_id, "tool": k, "field": RESULT_FIELDS[k]}
+        if res.ok:
+            results[k] = res.value
+            event["result"] = res.value
+            _logger.info(f"Tool completed tool={k} id={cand_id} attempts={res.attempts}")
+            if PERSIST_EACH_TOOL:
+                await persist({RESULT_FIELDS[k]: _field_value(k, res.value)})
+        else:
+            errors[k] = res.error or "failed"
+            event["error"] = errors[k]
+            _logger.error(f"Tool failed tool={k} id={cand_id} attempts={res.attempts} error={res.error}")
+        event["elapsed_ms"] = round((time.perf_counter() - t0) * 1000)
+        yield event
+    timing = pipeline.report()
+    _logger.info(f"Candidate pipeline done id={cand_id} total_ms={timing['total_ms']} critical_path={timing['critical_path']}")
+
+    if not PERSIST_EACH_TOOL:
+        await persist({RESULT_FIELDS[k]: _field_value(k, value) for k, value in results.items()})
+
+    yield {
+        "type": "summary",
+        "id": cand_id,
+        "updated": bool(persisted),
+        "completed": sorted(results),
+        "errors": errors,
+        "elapsed_ms": round((time.perf_counter() - t0) * 1000),
+        "timing": timing,
+    }
+
+
+async def _process_candidate(c: Dict[str, Any], job_in: Dict[str, Any]) -> Dict[str, Any]:
+    """Non-streaming form of `_iter_candidate`: one combined result for the candidate."""
+    results: Dict[str, Any] = {}
+    async for event in _iter_candidate(c, job_in):
+        if event["type"] == "error":
+            return {"error": event["error"]}
+        if event["type"] == "tool" and "result" in event:
+            results[event["tool"]] = event["result"]
+        if event["type"] == "summary":
+            return {"id": event["id"], "updated": event["updated"], "results": results, "errors": event["errors"]}
+    return {"error": "Candidate processing ended without a summary"}
+
+
+def _candidate_ids_for_job(job_id: str) -> List[str]:
+    ids: List[str] = []
+    kwargs: Dict[str, Any] = {
+        "IndexName": CAND_JOB_INDEX,
+        "KeyConditionExpression": "GSI1PK = :pk",
+        "ExpressionAttributeValues": {":pk": str(job_id)},
+        "ProjectionExpression": "id",
+    }
+    while True:
+        resp = _cands.query(**kwargs)
+        ids.extend(str(it["id"]) for it in resp.get("Items", []) if it.get("id"))
+        if not resp.get("LastEvaluatedKey"):
+            return ids
+        kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+
+def _batch_get_candidates(ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """BatchGetItem in chunks of 100, retrying UnprocessedKeys with backoff."""
+    found: Dict[str, Dict[str, Any]] = {}
+    for i in range(0, len(ids), 100):
+        request: Dict[str, Any] = {CAND_TABLE: {"Keys": [{"id": cid} for cid in ids[i:i + 100]]}}
+        attempt = 0
+        while request:
+            resp = _dynamodb.batch_get_item(RequestItems=request)
+            for it in resp.get("Responses", {}).get(CAND_TABLE, []):
+                item = denormalize_dynamodb_item(it)
+                found[str(item.get("id"))] = item
+            request = resp.get("UnprocessedKeys") or {}
+            if request:
+                attempt += 1
+                time.sleep(min(0.05 * (2 ** attempt), 2.0))
+    return found
+
+
+async def _iter_batch(payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    """Process many candidates; yields one record per candidate, then a summary."""
+    t0 = time.perf_counter()
+    job_id = payload.get("job_id")
+    ids = [str(i) for i in (payload.get("ids") or [])]
+    if not ids and job_id:
+        ids = await asyncio.to_thread(_candidate_ids_for_job, job_id)
+    ids = list(dict.fromkeys(ids))
+    _logger.info(f"Resume batch start job_id={job_id} candidates={len(ids)}")
+
+    candidates = await asyncio.to_thread(_batch_get_candidates, ids)
+    jobs_in: Dict[str, Dict[str, Any]] = {}
+    processed = failed = 0
+    slots = asyncio.Semaphore(BATCH_MAX_CANDIDATES)
+
+    async def run(cid: str) -> Tuple[str, Dict[str, Any]]:
+        c = candidates.get(cid)
+        if not c:
+            return cid, {"error": f"Candidate '{cid}' not found"}
+        async with slots:
+            try:
+                return cid, await _process_candidate(c, jobs_in[str(c.get("job_id") or "")])
+            except Exception as e:
+                return cid, {"error": str(e)}
+
+    # Each distinct job is loaded and turned into tool inputs once for the whole batch
+    for c in candidates.values():
+        jid = str(c.get("job_id") or "")
+        if jid not in jobs_in:
+            jobs_in[jid] = _job_inputs(await asyncio.to_thread(_load_job, jid))
+
+    tasks = [asyncio.ensure_future(run(cid)) for cid in ids]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            cid, out = await next_done
+            ok = "error" not in out and not out.get("errors")
+            processed += 1
+            failed += 0 if ok else 1
+            yield {
+                "type": "candidate",
+                "id": cid,
+                "updated": bool(out.get("updated")),
+                "error": out.get("error"),
+                "errors": out.get("errors") or {},
+            }
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    elapsed = time.perf_counter() - t0
+    per_minute = processed / elapsed * 60 if elapsed > 0 else 0.0
+    _logger.info(f"Resume batch done candidates={processed} failed={failed} elapsed_s={elapsed:.1f} candidates_per_minute={per_minute:.1f}")
+    yield {
+        "type": "summary",
+        "job_id": job_id,
+        "processed": processed,
+        "failed": failed,
+        "elapsed_s": round(elapsed, 2),
+        "candidates_per_minute": round(per_minute, 1),
+    }
+
+
+def _load_candidate(cand_id: str) -> Optional[Dict[str, Any]]:
+    _logger.info(f"Fetching candidate table={CAND_TABLE} id={cand_id}")
+    c = _cands.get_item(Key={"id": str(cand_id)}).get("Item")
+    return denormalize_dynamodb_item(c) if c else None
+
+
+async def _iter_single(cand_id: str) -> AsyncIterator[Dict[str, Any]]:
+    """Streaming single-candidate mode: per-tool events followed by a summary."""
+    c = await asyncio.to_thread(_load_candidate, cand_id)
+    if not c:
+        _logger.error(f"Candidate not found id={cand_id}")
+        yield {"type": "error", "id": cand_id, "error": f"Candidate '{cand_id}' not found"}
+        return
+    job_in = _job_inputs(await asyncio.to_thread(_load_job, c.get("job_id")))
+    async for event in _iter_candidate(c, job_in):
+        yield event
+
+
+# Async entrypoint: the runtime serves every session on one event loop, so concurrent
+# sessions share the MCP session, DynamoDB client and OAuth token without a thread each.
 @app.entrypoint
-def handler(payload: Dict[str, Any]) -> Dict[str, Any]:
-    cand_id = (payload or {}).get("id")
+async def handler(payload: Dict[str, Any]):
+    payload = payload or {}
+    if payload.get("ids") or (payload.get("job_id") and not payload.get("id")):
+        # Batch mode streams one completion record per candidate
+        return _iter_batch(payload)
+
+    cand_id = payload.get("id")
     if not cand_id:
         return {"error": "Missing 'id' in payload"}
-    _logger.info(f"Resume processor start id={cand_id}")
+    _logger.info(f"Resume processor start id={cand_id} stream={bool(payload.get('stream'))}")
+    if payload.get("stream"):
+        return _iter_single(cand_id)
 
     # Load candidate
-    _logger.info(f"Fetching candidate table={CAND_TABLE} id={cand_id}")
-    c = _cands.get_item(Key={"id": str(cand_id)}).get("Item")
+    c = await asyncio.to_thread(_load_candidate, cand_id)
     if not c:
         _logger.error(f"Candidate not found id={cand_id}")
         return {"error": f"Candidate '{cand_id}' not found"}
-    c = denormalize_dynamodb_item(c)
-    resume_text = c.get("resume_text") or ""
-    if not resume_text:
-        _logger.error(f"Candidate has no resume_text id={cand_id}")
-        return {"error": f"Candidate '{cand_id}' has no resume_text"}
-    _logger.info(f"Loaded resume text id={cand_id} len={len(resume_text)}")
 
-    # Load job (optional)
-    job_id = c.get("job_id")
-    job = {}
-    if job_id:
-        _logger.info(f"Fetching job table={JOBS_TABLE} id={job_id}")
-        j = _jobs.get_item(Key={"id": str(job_id)}).get("Item")
-        job = denormalize_dynamodb_item(j or {})
+    # Load job (optional) and build inputs from it
+    job_in = _job_inputs(await asyncio.to_thread(_load_job, c.get("job_id")))
+    _logger.info(f"Built skills_with_context count={len(job_in['skills_with_context'])}")
 
-    # Build inputs from job
-    skills_with_context = _build_skills_with_context(job)
-    _logger.info(f"Built skills_with_context count={len(skills_with_context)}")
-
-    # Resolve MCP tools and run within active session
-    _logger.info("Resolving MCP tools")
-    with _make_mcp_client() as mcp:
-        tools = mcp.list_tools_sync()
-        def by_name(name: str):
-            for t in tools:
-                tool_obj = getattr(t, "mcp_tool", t)
-                tname = getattr(tool_obj, "name", None) or (tool_obj.get("name") if isinstance(tool_obj, dict) else None)
-                if tname == name:
-                    return t
-            raise RuntimeError(f"MCP tool '{name}' not found")
-
-        t_skills = by_name("skillscorer___resume_skills_scorer")
-        t_sparse = by_name("sparsecheck___resume_sparse_checker")
-        t_pi = by_name("pi___resume_pi_extractor")
-        t_exp = by_name("desirediexpeval___resume_desired_experience_scorer")
-        t_edu = by_name("educationeval___resume_education_evaluator")
-        t_sum = by_name("summarizer___resume_summarizer")
-        _logger.info("Resolved MCP tools for resume processing")
-
-        agent = Agent(tools=[t_skills, t_sparse, t_pi, t_exp, t_edu, t_sum])
-
-        results: Dict[str, Any] = {}
-        errors: Dict[str, str] = {}
-
-        # Prepare job-derived inputs
-        ede = job.get("education_desired_experience") or {}
-        desired_experience = [d.get("experience") for d in (ede.get("desired_experience") or []) if isinstance(d, dict) and d.get("experience")] if isinstance(ede, dict) else []
-        jd_edu_list = []
-        edu = ede.get("education_preference") if isinstance(ede, dict) else []
-        for x in (edu or []):
-            if isinstance(x, dict) and x.get("education"):
-                jd_edu_list.append(x.get("education"))
-        jd_text = job.get("jd_text") or job.get("text") or ""
-
-        # Run ALL tools in parallel
-        _logger.info("Invoking tools in parallel (6)")
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            future_map = {
-                executor.submit(_json_from_call, agent.tool.sparsecheck___resume_sparse_checker, {"resume_text": resume_text}): "sparse",
-                executor.submit(_json_from_call, agent.tool.pi___resume_pi_extractor, {"resume_text": resume_text}): "pi",
-                executor.submit(_json_from_call, agent.tool.skillscorer___resume_skills_scorer, {"resume_text": resume_text, "skills_with_context": skills_with_context}): "skills",
-                executor.submit(_json_from_call, agent.tool.desirediexpeval___resume_desired_experience_scorer, {"resume_text": resume_text, "desired_experience": desired_experience}): "desired_exp_eval",
-                executor.submit(_json_from_call, agent.tool.educationeval___resume_education_evaluator, {"jd_education_and_certifications": jd_edu_list, "resume_text": resume_text}): "education_eval",
-                executor.submit(_json_from_call, agent.tool.summarizer___resume_summarizer, {"jd_text": jd_text, "resume_text": resume_text}): "resume_summary",
-            }
-            for fut in as_completed(list(future_map.keys())):
-                k = future_map[fut]
-                try:
-                    results[k] = fut.result()
-                    _logger.info(f"Tool completed tool={k} id={cand_id}")
-                except Exception as e:
-                    errors[k] = str(e)
-                    _logger.error(f"Tool failed tool={k} id={cand_id} error={str(e)}")
-
-    # Persist back to candidates
-    update: Dict[str, Any] = {}
-    if "pi" in results:
-        update["pi_details"] = results["pi"]
-    if "sparse" in results:
-        update["sparse_resume"] = results["sparse"].get("sparse_resume") if isinstance(results["sparse"], dict) else results["sparse"]
-    if "resume_summary" in results:
-        update["resume_summary"] = results["resume_summary"]
-    if "skills" in results:
-        update["skills_eval"] = results["skills"]
-    if "desired_exp_eval" in results:
-        update["desired_exp_eval"] = results["desired_exp_eval"]
-    if "education_eval" in results:
-        update["education_eval"] = results["education_eval"]
-
-    if update:
-        _logger.info(f"Persisting candidate updates id={cand_id} fields={list(update.keys())}")
-        safe_item = to_dynamodb_compatible({**c, **update})
-        _cands.put_item(Item=safe_item)
-
-    return {"id": cand_id, "updated": bool(update), "results": results, "errors": errors}
+    return await _process_candidate(c, job_in)
 
 if __name__ == "__main__":
     app.run()
@@ -0,0 +1,174 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+import asyncio
+import time
+
+from logging_config import get_logger
+
+
+_logger = get_logger(__name__)
+
+
+class Node:
+    """One pipeline stage, usually a single MCP tool call.
+
+    `fn` is a coroutine function receiving a dict of the results of the dependencies that succeeded. `deps` must
+    all succeed for the node to run; `soft_deps` are waited for but may fail (their
+    results are simply absent from the inputs).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[Dict[str, Any]], Awaitable[Any]],
+        deps: Iterable[str] = (),
+        soft_deps: Iterable[str] = (),
+        timeout_s: Optional[float] = None,
+        retries: int = 0,
+    ) -> None:
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+        self.soft_deps = tuple(soft_deps)
+        self.timeout_s = timeout_s
+        self.retries = retries
+
+    @property
+    def all_deps(self) -> tuple:
+        return self.deps + self.soft_deps
+
+
+class NodeResult:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.ok = False
+        self.value: Any = None
+        self.error: Optional[str] = None
+        self.attempts = 0
+        self.start_ms = 0.0
+        self.end_ms = 0.0
+
+
+class Pipeline:
+    """Runs a DAG of nodes on the event loop, starting each one as soon as its
+    dependencies are done.
+
+    Timed-out attempts are cancelled and count against the node's retries. One run per
+    instance.
+    """
+
+    def __init__(self, nodes: List[Node], retry_backoff_s: float = 0.5) -> None:
+        self.nodes: Dict[str, Node] = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"Duplicate pipeline node '{node.name}'")
+            self.nodes[node.name] = node
+        for node in nodes:
+            missing = [d for d in node.all_deps if d not in self.nodes]
+            if missing:
+                raise ValueError(f"Node '{node.name}' depends on unknown node(s) {missing}")
+        self._check_acyclic()
+        self.retry_backoff_s = retry_backoff_s
+        self.results: Dict[str, NodeResult] = {}
+        self._t0 = 0.0
+
+    def _check_acyclic(self) -> None:
+        state: Dict[str, int] = {}
+
+        def visit(name: str) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Pipeline has a cycle through '{name}'")
+            state[name] = 1
+            for dep in self.nodes[name].all_deps:
+                visit(dep)
+            state[name] = 2
+
+        for name in self.nodes:
+            visit(name)
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000
+
+    async def run(self) -> AsyncIterator[NodeResult]:
+        """Yield each node's result as it finishes (skipped nodes included)."""
+        self._t0 = time.perf_counter()
+        pending: Set[str] = set(self.nodes)
+        running: Dict["asyncio.Task[NodeResult]", str] = {}
+        try:
+            while pending or running:
+                # Start every node whose dependencies are all finished
+                for name in sorted(pending):
+                    node = self.nodes[name]
+                    if any(d not in self.results for d in node.all_deps):
+                        continue
+                    pending.discard(name)
+                    failed = [d for d in node.deps if not self.results[d].ok]
+                    if failed:
+                        res = NodeResult(name)
+                        res.error = f"skipped: dependency failed {failed}"
+                        res.start_ms = res.end_ms = self._now_ms()
+                        self.results[name] = res
+                        _logger.warning(f"Pipeline node skipped node={name} failed_deps={failed}")
+                        yield res
+                        continue
+                    running[asyncio.ensure_future(self._run_node(node))] = name
+                if not running:
+                    continue
+                done, _ = await asyncio.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    running.pop(task)
+                    res = task.result()
+                    self.results[res.name] = res
+                    yield res
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _run_node(self, node: Node) -> NodeResult:
+        """One node with its timeout/retry policy; never raises."""
+        res = NodeResult(node.name)
+        inputs = {d: self.results[d].value for d in node.all_deps if self.results[d].ok}
+        res.start_ms = self._now_ms()
+        while True:
+            res.attempts += 1
+            try:
+                res.value = await asyncio.wait_for(node.fn(inputs), timeout=node.timeout_s)
+                res.ok, res.error = True, None
+                break
+            except asyncio.TimeoutError:
+                res.error = f"timed out after {node.timeout_s}s"
+            except Exception as e:
+                res.error = str(e) or type(e).__name__
+            if res.attempts > node.retries:
+                break
+            _logger.warning(f"Pipeline node retry node={node.name} attempt={res.attempts} error={res.error}")
+            await asyncio.sleep(self.retry_backoff_s * (2 ** (res.attempts - 1)))
+        res.end_ms = self._now_ms()
+        return res
+
+    def report(self) -> Dict[str, Any]:
+        """Per-node timings plus the critical path (the dependency chain that ended last)."""
+        if not self.results:
+            return {"total_ms": 0, "critical_path": [], "nodes": {}}
+        last = max(self.results.values(), key=lambda r: r.end_ms)
+        path = [last.name]
+        while True:
+            deps = [self.results[d] for d in self.nodes[path[-1]].all_deps if d in self.results]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda r: r.end_ms).name)
+        return {
+            "total_ms": round(last.end_ms),
+            "critical_path": list(reversed(path)),
+            "nodes": {
+                r.name: {
+                    "ok": r.ok,
+                    "attempts": r.attempts,
+                    "start_ms": round(r.start_ms),
+                    "end_ms": round(r.end_ms),
+                    "duration_ms": round(r.end_ms - r.start_ms),
+                }
+                for r in self.results.values()
+            },
+        }
@@ -0,0 +1,113 @@
+from typing import Any, Dict, List, Optional, Sequence
+import re
+
+
+# Deterministic resume segmentation: a line is a section heading when it is short and matches
+# one of the known heading names (optionally "#"-prefixed, ":"-suffixed or followed by inline
+# content, e.g. "Skills: Python, SQL"). Everything before the first heading is the header.
+SECTION_TYPES = ("header", "summary", "experience", "education", "certifications", "skills", "projects", "other")
+
+_HEADINGS = (
+    ("summary", r"(?:professional |career |executive )?(?:summary|profile|objective|overview)|about me"),
+    ("experience", r"(?:professional |work |relevant |employment |career )?(?:experience|employment(?: history)?)"
+                   r"|work history|career history|professional background"),
+    ("certifications", r"certifications?(?: (?:&|and) licen[sc]es?)?|licen[sc]es?(?: (?:&|and) certifications?)?"
+                       r"|certificates|courses|training|professional development"),
+    ("education", r"education(?: (?:&|and) (?:certifications?|training|qualifications))?"
+                  r"|academic (?:background|qualifications|history)|qualifications"),
+    ("skills", r"(?:technical |core |key |professional )?(?:skills|competencies|expertise)(?: (?:&|and) \w+)?"
+               r"|technologies|tools(?: (?:&|and) technologies)?|tech stack"),
+    ("projects", r"(?:personal |key |selected |academic |side )?projects"),
+    ("other", r"awards?(?: (?:&|and) \w+)?|achievements|honou?rs|publications|references?|referees|"
+              r"volunteer(?:ing)?(?: experience)?|interests|hobbies|languages|activities|extracurricular activities"),
+)
+_HEADING = re.compile(
+    r"^\s*#*\s*(?:" + "|".join(f"(?P<{name}>{rx})" for name, rx in _HEADINGS) + r")\s*(?::\s*(?P<inline>.*))?$",
+    re.IGNORECASE,
+)
+_HEADING_MAX_CHARS = 48
+
+
+def _heading_type(line: str) -> Optional[str]:
+    stripped = line.strip().strip("=-_*|").strip()
+    m = _HEADING.match(stripped)
+    if not m:
+        return None
+    # Inline content ("Skills: Python, SQL") may run long; the heading part itself must be short
+    head_len = len(stripped) - len(m.group("inline") or "")
+    if head_len > _HEADING_MAX_CHARS:
+        return None
+    return next(name for name, _ in _HEADINGS if m.group(name))
+
+
+def segment(resume_text: str) -> List[Dict[str, Any]]:
+    """Typed sections in reading order: {type, heading, start, end} with character offsets.
+
+    Sections of the same type stay separate (e.g. two "Experience" blocks); the header is the
+    text before the first heading and is omitted when empty.
+    """
+    sections: List[Dict[str, Any]] = []
+    current: Dict[str, Any] = {"type": "header", "heading": "", "start": 0}
+    offset = 0
+    for line in resume_text.splitlines(keepends=True):
+        kind = _heading_type(line) if len(line) < 400 else None
+        if kind:
+            current["end"] = offset
+            sections.append(current)
+            current = {"type": kind, "heading": line.strip(), "start": offset}
+        offset += len(line)
+    current["end"] = len(resume_text)
+    sections.append(current)
+    if not resume_text[sections[0]["start"]:sections[0]["end"]].strip():
+        sections.pop(0)
+    return sections
+
+
+def view(
+    resume_text: str,
+    sections: List[Dict[str, Any]],
+    keep: Sequence[str],
+    require: Sequence[str] = (),
+) -> str:
+    """Resume text with only the `keep` section bodies; other sections shrink to their heading
+    and a line count, so the outline of the resume is preserved.
+
+    The full text is returned when no heading was found, or none of `require` is present.
+    """
+    types = {s["type"] for s in sections}
+    if types <= {"header"} or (require and not types.intersection(require)):
+        return resume_text
+    parts: List[str] = []
+    for s in sections:
+        body = resume_text[s["start"]:s["end"]]
+        if s["type"] in keep:
+            parts.append(body.rstrip("\n"))
+            continue
+        lines = sum(1 for line in body.splitlines()[1 if s["heading"] else 0:] if line.strip())
+        omitted = f"[{lines} line{'' if lines == 1 else 's'} omitted]"
+        if s["heading"]:
+            parts.append(s["heading"] + (f"\n{omitted}" if lines else ""))
+        elif lines:
+            parts.append(f"[header: {omitted[1:]}")
+    return "\n".join(parts)
+
+
+# Sections each resume tool reads, and the ones that must exist to narrow its input at all.
+# Tools not listed here (skills, desired experience, summary) keep the full resume.
+TOOL_SECTIONS: Dict[str, Dict[str, Sequence[str]]] = {
+    # Contact fields live in the header; years of experience in the summary claim or dated roles
+    "pi": {"keep": ("header", "summary", "experience"), "require": ("experience",)},
+    # Sparse-ness is about the applied-work sections; the rest is kept as an outline
+    "sparse": {"keep": ("summary", "experience", "projects"), "require": ()},
+    "education_eval": {"keep": ("education", "certifications"), "require": ("education", "certifications")},
+}
+
+
+def tool_views(resume_text: str, sections: Optional[List[Dict[str, Any]]] = None) -> Dict[str, str]:
+    """Per-tool resume text for the tools in TOOL_SECTIONS."""
+    if sections is None:
+        sections = segment(resume_text)
+    return {
+        tool: view(resume_text, sections, spec["keep"], spec["require"])
+        for tool, spec in TOOL_SECTIONS.items()
+    }
@@ -0,0 +1,230 @@
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import re
+
+
+EVIDENCE_MAX_LINES = int(os.getenv("SKILL_EVIDENCE_MAX_LINES", "6"))
+EVIDENCE_LINE_CHARS = int(os.getenv("SKILL_EVIDENCE_LINE_CHARS", "240"))
+
+# Spelling variants of common skills (same skill, different surface form)
+ALIASES: Dict[str, List[str]] = {
+    "javascript": ["js", "ecmascript", "es6"],
+    "typescript": ["ts"],
+    "node.js": ["nodejs", "node js"],
+    "react": ["react.js", "reactjs"],
+    "vue": ["vue.js", "vuejs"],
+    "angular": ["angularjs", "angular.js"],
+    "postgresql": ["postgres", "psql"],
+    "kubernetes": ["k8s"],
+    "go": ["golang"],
+    "c#": ["csharp", "c sharp"],
+    "c++": ["cpp"],
+    ".net": ["dotnet", "asp.net", ".net core"],
+    "machine learning": ["ml"],
+    "amazon web services": ["aws"],
+    "aws": ["amazon web services"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "azure": ["microsoft azure"],
+    "ci/cd": ["cicd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "rest": ["restful", "rest api", "rest apis"],
+    "spring boot": ["springboot"],
+    "microservices": ["microservice", "micro-services", "micro services"],
+}
+
+# One-hop associations RESUME_SKILLS_SCORER_PROMPT allows (framework/service -> base skill);
+# hits are tagged via="associated" so the scorer can note the inference
+ASSOCIATED: Dict[str, List[str]] = {
+    "java": ["spring boot", "spring"],
+    "python": ["django", "flask", "fastapi"],
+    "javascript": ["react", "node.js", "vue", "angular"],
+    "sql": ["postgresql", "mysql", "sql server", "oracle", "sqlite"],
+    "aws": ["aws lambda", "ec2", "s3", "dynamodb"],
+}
+
+# Words naming the kind of skill rather than the skill ("Python programming", "REST APIs",
+# "Microservices architecture"); the head term left without them is matched as well
+GENERIC_WORDS = {
+    "programming", "language", "languages", "api", "apis", "architecture", "skills", "skill",
+    "development", "framework", "frameworks", "experience", "knowledge", "proficiency", "expertise",
+}
+# Connectors left at the edges of a head term ("Experience with Python" -> "python")
+_CONNECTORS = {"with", "in", "of", "using", "and"}
+# Version qualifiers after a skill name ("Python 3.x", "Java 8+", "Java 11", "Python 3.10")
+_VERSION = re.compile(r"^v?\d+(?:\.(?:\d+|x))*\+?$")
+_GLUED_VERSION = re.compile(r"\d+(?:\.\d+)*")
+
+_WORD_CHARS = set("abcdefghijklmnopqrstuvwxyz0123456789+#")
+_MEMBERS = re.compile(r"\(([^()]*[/&,][^()]*)\)")
+
+
+def _head(term: str) -> str:
+    """`term` without its generic words and version qualifiers, or "" when nothing specific is left."""
+    words = [w for w in term.split() if w not in GENERIC_WORDS]
+    while words and words[0] in _CONNECTORS:
+        words.pop(0)
+    while words and (words[-1] in _CONNECTORS or (len(words) > 1 and _VERSION.match(words[-1]))):
+        words.pop()
+    return " ".join(words)
+
+
+def _base_terms(name: str) -> List[str]:
+    """Terms of a lowercased skill name: the name, the members of a grouped ("Any Cloud Platform
+    (AWS/Azure/GCP)") or merged ("Frontend (React & TypeScript)") skill and their head terms."""
+    base = [name]
+    members: List[str] = []
+    m = _MEMBERS.search(name)
+    if m:
+        members = [p.strip() for p in re.split(r"[/&,]|\bor\b|\band\b", m.group(1)) if p.strip()]
+        base += members
+        outer = name[: m.start()].replace("any ", "").strip()
+        if outer:
+            base.append(outer)
+    elif "&" in name:
+        # "X & Y (context)"; a bare slash is part of names like CI/CD or PL/SQL
+        members = [p.strip() for p in re.split(r"&", re.sub(r"\(.*?\)", "", name)) if p.strip()]
+        base += members
+    terms: List[str] = []
+    for t in base:
+        terms.append(t)
+        head = _head(t)
+        if head and head != t:
+            terms.append(head)
+    return terms
+
+
+def skill_terms(skill: str) -> List[Tuple[str, Optional[str]]]:
+    """(term, via) pairs for one JD skill: its name, grouped/merged members, head terms, aliases, associations.
+
+    Grouped ("Any Cloud Platform (AWS/Azure/GCP)") and merged ("Frontend (React & TypeScript)")
+    skills from jd_skills_extractor contribute their members as terms; generic words are
+    dropped to give head terms ("REST APIs" -> "rest", then its aliases), as are version
+    qualifiers ("Python 3.x" -> "python").
+    """
+    base = _base_terms(skill.strip().lower())
+    terms: Dict[str, Optional[str]] = {}
+    for t in base:
+        terms.setdefault(t, None)
+        for alias in ALIASES.get(t, []):
+            terms.setdefault(alias, "alias")
+    for t in list(terms):
+        for assoc in ASSOCIATED.get(t, []):
+            terms.setdefault(assoc, "associated")
+    return list(terms.items())
+
+
+class SkillIndex:
+    """Aho-Corasick automaton over every skill term of a job.
+
+    Built once per job (`_job_inputs`) and shared by all its candidates; `find` locates
+    all terms in a resume in one pass over the text, keeping whole-word hits only.
+    """
+
+    def __init__(self, skills: List[str]) -> None:
+        self.skills = list(skills)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        # pattern id -> (term, skill index, via)
+        self.patterns: List[Tuple[str, int, Optional[str]]] = []
+        for i, skill in enumerate(self.skills):
+            for term, via in skill_terms(skill):
+                self._add(term, len(self.patterns))
+                self.patterns.append((term, i, via))
+        self._build_failure_links()
+
+    def _add(self, term: str, pid: int) -> None:
+        node = 0
+        for ch in term:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(pid)
+
+    def _build_failure_links(self) -> None:
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """(start, end, pattern id) for every whole-word occurrence, in text order.
+
+        A term ending in a letter also matches with a version glued on ("python3", "java8").
+        Overlapping hits for the same skill keep only the longest ("spring boot" over "spring").
+        """
+        low = text.lower()
+        if len(low) != len(text):
+            # Keep offsets aligned when lowercasing changes a character's length
+            low = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+        hits: List[Tuple[int, int, int]] = []
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        node = 0
+        n = len(low)
+        for i, ch in enumerate(low):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pid in out[node]:
+                start = i - len(patterns[pid][0]) + 1
+                if start > 0 and low[start - 1] in _WORD_CHARS:
+                    continue
+                end = i + 1
+                if end < n and low[end].isdigit() and low[i].isalpha():
+                    end = _GLUED_VERSION.match(low, end).end()
+                if end < n and low[end] in _WORD_CHARS:
+                    continue
+                hits.append((start, end, pid))
+        hits.sort(key=lambda h: (h[0], -h[1]))
+        kept: List[Tuple[int, int, int]] = []
+        covered: Dict[int, int] = {}
+        for start, end, pid in hits:
+            si = patterns[pid][1]
+            if start < covered.get(si, -1):
+                continue
+            covered[si] = end
+            kept.append((start, end, pid))
+        return kept
+
+    def evidence_pack(self, text: str, max_lines: int = EVIDENCE_MAX_LINES) -> List[Dict[str, Any]]:
+        """Per skill: found flag, occurrence count and the resume lines holding the hits (with offsets)."""
+        line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+        per_skill: List[Dict[str, Any]] = [
+            {"skill": s, "found": False, "occurrences": 0, "lines": []}
+            for s in self.skills
+        ]
+        seen_lines: List[set] = [set() for _ in self.skills]
+        for start, end, pid in self.find(text):
+            term, si, via = self.patterns[pid]
+            entry = per_skill[si]
+            entry["occurrences"] += 1
+            if via != "associated":
+                entry["found"] = True
+            line_no = bisect_right(line_starts, start) - 1
+            if line_no in seen_lines[si] or len(entry["lines"]) >= max_lines:
+                continue
+            seen_lines[si].add(line_no)
+            line_start = line_starts[line_no]
+            line_end = line_starts[line_no + 1] - 1 if line_no + 1 < len(line_starts) else len(text)
+            # Long lines (e.g. paragraphs) are cut to a window around the hit
+            lo = max(line_start, start - EVIDENCE_LINE_CHARS // 2)
+            hi = min(line_end, max(end + EVIDENCE_LINE_CHARS // 2, lo + EVIDENCE_LINE_CHARS))
+            line = {"line": line_no + 1, "offset": [start, end], "text": text[lo:hi].strip(), "term": text[start:end]}
+            if via:
+                line["via"] = via
+            entry["lines"].append(line)
+        return per_skill
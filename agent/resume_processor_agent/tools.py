@@ -1,9 +1,15 @@
+import asyncio
 import os
-from typing import Dict, Optional
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from strands.tools.mcp.mcp_client import MCPClient
 from mcp.client.streamable_http import streamablehttp_client
 import httpx
 
+from logging_config import get_logger
+
 
 GATEWAY_URL = os.environ.get("AGENTCORE_GATEWAY_URL","https://resume-tools-nmtepsqx3j.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp")
 GATEWAY_TOKEN = os.environ.get("AGENTCORE_GATEWAY_TOKEN")
@@ -15,8 +21,22 @@ OAUTH_CLIENT_ID = os.environ.get("AGENTCORE_OAUTH_CLIENT_ID")
 OAUTH_CLIENT_SECRET = os.environ.get("AGENTCORE_OAUTH_CLIENT_SECRET", "")
 OAUTH_SCOPE = os.environ.get("AGENTCORE_OAUTH_SCOPE", "default-m2m-resource-server-kpomdi/read")
 
+OAUTH_REFRESH_MARGIN_SECONDS = float(os.environ.get("AGENTCORE_OAUTH_REFRESH_MARGIN_SECONDS", "300"))
+
+# Session reuse across invocations
+MCP_REGISTRY_TTL_SECONDS = float(os.environ.get("MCP_REGISTRY_TTL_SECONDS", "300"))
+MCP_CONNECT_ATTEMPTS = int(os.environ.get("MCP_CONNECT_ATTEMPTS", "4"))
+MCP_BACKOFF_BASE_SECONDS = float(os.environ.get("MCP_BACKOFF_BASE_SECONDS", "0.5"))
+
+_logger = get_logger(__name__)
+
+
+# Token endpoint client, reused across fetches
+_oauth_http = httpx.Client(timeout=10)
+
 
-def _fetch_oauth_token() -> Optional[str]:
+def _fetch_oauth_token() -> Optional[Tuple[str, float]]:
+    """Client-credentials grant; returns (access_token, expires_in seconds)."""
     if not (OAUTH_TOKEN_URL and OAUTH_CLIENT_ID is not None):
         return None
     data = {
@@ -26,27 +46,243 @@ def _fetch_oauth_token() -> Optional[str]:
         "scope": OAUTH_SCOPE,
     }
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
-    with httpx.Client(timeout=10) as client:
-        resp = client.post(OAUTH_TOKEN_URL, data=data, headers=headers)
-        resp.raise_for_status()
-        body = resp.json()
-        return body.get("access_token")
+    resp = _oauth_http.post(OAUTH_TOKEN_URL, data=data, headers=headers)
+    resp.raise_for_status()
+    body = resp.json()
+    token = body.get("access_token")
+    if not token:
+        return None
+    return token, float(body.get("expires_in") or 3600)
+
+
+class _TokenCache:
+    """Thread-safe OAuth token cache that honours `expires_in`.
+
+    Concurrent callers share one fetch (the lock makes it single-flight), and a daemon
+    timer refreshes the token `refresh_margin` seconds before it expires so requests
+    do not wait on the token endpoint.
+    """
+
+    def __init__(self, fetch: Callable[[], Optional[Tuple[str, float]]], refresh_margin: float) -> None:
+        self._fetch = fetch
+        self._refresh_margin = refresh_margin
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._timer: Optional[threading.Timer] = None
+
+    def _valid(self) -> bool:
+        # Keep a small skew so a token is never sent in its last seconds of life
+        return self._token is not None and time.monotonic() < self._expires_at - 30
+
+    def _refresh_locked(self) -> None:
+        fetched = self._fetch()
+        if not fetched:
+            self._token, self._expires_at = None, 0.0
+            return
+        token, expires_in = fetched
+        self._token = token
+        self._expires_at = time.monotonic() + expires_in
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(max(expires_in - self._refresh_margin, 1.0), self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+        _logger.info(f"OAuth token refreshed expires_in={expires_in:.0f}s")
+
+    def _background_refresh(self) -> None:
+        with self._lock:
+            try:
+                self._refresh_locked()
+            except Exception as e:
+                # The current token stays usable until expiry; get() retries on demand
+                _logger.warning(f"Background OAuth token refresh failed error={e}")
+
+    def get(self) -> Optional[str]:
+        if self._valid():
+            return self._token
+        with self._lock:
+            if not self._valid():
+                self._refresh_locked()
+            return self._token
+
+    def invalidate(self, token: str) -> None:
+        """Forget `token` (e.g. after a 401) unless another caller already replaced it."""
+        with self._lock:
+            if self._token == token:
+                self._token, self._expires_at = None, 0.0
+
+
+_token_cache = _TokenCache(_fetch_oauth_token, OAUTH_REFRESH_MARGIN_SECONDS)
 
 
 def _bearer_token() -> str:
     if GATEWAY_TOKEN:
         return GATEWAY_TOKEN
-    token = _fetch_oauth_token()
+    token = _token_cache.get()
     if not token:
         raise RuntimeError("No AGENTCORE_GATEWAY_TOKEN or OAuth client creds available")
     return token
 
 
+class _GatewayAuth(httpx.Auth):
+    """Attach the cached bearer token per request; on 401 refetch once and retry."""
+
+    def auth_flow(self, request: httpx.Request):
+        token = _bearer_token()
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+        if response.status_code == 401 and not GATEWAY_TOKEN:
+            _logger.warning("Gateway returned 401; refreshing OAuth token and retrying once")
+            _token_cache.invalidate(token)
+            request.headers["Authorization"] = f"Bearer {_bearer_token()}"
+            yield request
+
+
 def _make_mcp_client() -> MCPClient:
     if not GATEWAY_URL:
         raise RuntimeError("AGENTCORE_GATEWAY_URL is not set")
-    token = _bearer_token()
-    headers = {"Authorization": f"Bearer {token}", **EXTRA_HEADERS}
-    return MCPClient(lambda: streamablehttp_client(GATEWAY_URL, headers=headers))
+    _bearer_token()  # fail fast when no credentials are configured
+    headers = dict(EXTRA_HEADERS)
+    return MCPClient(lambda: streamablehttp_client(GATEWAY_URL, headers=headers, auth=_GatewayAuth()))
+
+
+def _tool_name(t: Any) -> Optional[str]:
+    tool_obj = getattr(t, "mcp_tool", t)
+    return getattr(tool_obj, "name", None) or (tool_obj.get("name") if isinstance(tool_obj, dict) else None)
+
+
+class McpSessionPool:
+    """Long-lived MCP session plus a name-keyed tool registry, shared by all invocations.
+
+    The session is opened lazily and kept for the life of the runtime; concurrent tool
+    calls are multiplexed over it. The registry is refreshed when older than
+    `registry_ttl`, and that refresh doubles as the health check: if it fails the session
+    is torn down and reopened with exponential backoff. A call that raises only marks the
+    registry stale, so the next request runs the health check; the session is not dropped
+    under other in-flight calls unless that check fails.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], MCPClient] = _make_mcp_client,
+        registry_ttl: float = MCP_REGISTRY_TTL_SECONDS,
+        connect_attempts: int = MCP_CONNECT_ATTEMPTS,
+        backoff_base: float = MCP_BACKOFF_BASE_SECONDS,
+    ) -> None:
+        self._factory = factory
+        self._registry_ttl = registry_ttl
+        self._connect_attempts = max(1, connect_attempts)
+        self._backoff_base = backoff_base
+        self._lock = threading.RLock()
+        self._client: Optional[MCPClient] = None
+        self._registry: Dict[str, Any] = {}
+        self._refreshed_at = 0.0
+
+    def _refresh_registry(self) -> None:
+        tools = self._client.list_tools_sync()
+        self._registry = {name: t for t in tools for name in [_tool_name(t)] if name}
+        self._refreshed_at = time.monotonic()
+
+    def _close(self) -> None:
+        client, self._client = self._client, None
+        self._registry = {}
+        if client is not None:
+            try:
+                client.stop(None, None, None)
+            except Exception as e:
+                _logger.warning(f"MCP session close failed error={e}")
+
+    def _connect(self) -> None:
+        last_error: Optional[Exception] = None
+        for attempt in range(self._connect_attempts):
+            if attempt:
+                delay = self._backoff_base * (2 ** (attempt - 1))
+                _logger.warning(f"MCP reconnect attempt={attempt + 1} in {delay:.1f}s error={last_error}")
+                time.sleep(delay)
+            try:
+                client = self._factory()
+                client.start()
+                self._client = client
+                self._refresh_registry()
+                _logger.info(f"MCP session opened tools={len(self._registry)}")
+                return
+            except Exception as e:
+                last_error = e
+                self._close()
+        raise RuntimeError(f"Unable to open MCP session: {last_error}")
+
+    def _ensure(self) -> bool:
+        """Make sure a healthy session exists; returns True if it was already warm."""
+        if self._client is None:
+            self._connect()
+            return False
+        if time.monotonic() - self._refreshed_at > self._registry_ttl:
+            try:
+                self._refresh_registry()
+            except Exception as e:
+                _logger.warning(f"MCP health check failed; reconnecting error={e}")
+                self._close()
+                self._connect()
+                return False
+        return True
+
+    def get_tools(self, names: List[str]) -> Tuple[Dict[str, Any], bool]:
+        """Resolve tools by name; returns ({name: tool}, warm)."""
+        with self._lock:
+            warm = self._ensure()
+            missing = [n for n in names if n not in self._registry]
+            if missing and warm:
+                self._refresh_registry()
+                missing = [n for n in names if n not in self._registry]
+            if missing:
+                raise RuntimeError(f"MCP tool(s) not found: {missing}")
+            return {n: self._registry[n] for n in names}, warm
+
+    def invalidate(self) -> None:
+        """Drop the session so the next request reconnects."""
+        with self._lock:
+            self._close()
+
+    def _warm_client(self, name: str) -> Optional[MCPClient]:
+        """The live client if `name` can be called without reconnecting or refreshing."""
+        client = self._client
+        if client is not None and name in self._registry and time.monotonic() - self._refreshed_at <= self._registry_ttl:
+            return client
+        return None
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool over the shared session from async code.
+
+        The request is multiplexed on the MCP client's own loop, so no thread is held for
+        the round trip; only a cold or stale session is (re)opened in a worker thread.
+        """
+        client = self._warm_client(name)
+        if client is None:
+            await asyncio.to_thread(self.get_tools, [name])
+            client = self._client
+            if client is None:
+                raise RuntimeError("MCP session closed while resolving tools")
+        try:
+            return await client.call_tool_async(
+                tool_use_id=f"{name}-{uuid.uuid4().hex[:12]}", name=name, arguments=arguments
+            )
+        except Exception:
+            if self._client is client:
+                self._refreshed_at = 0.0
+            raise
+
+
+_pool = McpSessionPool()
+
+
+def get_mcp_tools(names: List[str]) -> Tuple[Dict[str, Any], bool]:
+    return _pool.get_tools(names)
+
+
+def invalidate_mcp_session() -> None:
+    _pool.invalidate()
 
 
+async def call_mcp_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return await _pool.call_tool(name, arguments)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Sustained candidates/sec and memory per in-flight request: thread pools vs one event loop.
+
+The resume agent used to run each candidate on its own ThreadPoolExecutor (one thread per
+tool call) under a batch-level pool of candidate threads. It now runs every candidate
+as a task on the runtime's event loop, with the `pipeline.py` DAG awaiting the MCP tool
+calls directly. Tool calls are simulated with a fixed latency (time.sleep in the thread
+design, asyncio.sleep on the loop), so the numbers cover scheduling, threads and memory,
+not Bedrock. Memory is the tracemalloc peak of Python allocations while the given number
+of candidates are in flight, divided by that number; thread stacks come on top of this
+for the thread design (see the peak thread count).
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "agent", "resume_processor_agent"))
+
+from pipeline import Node, Pipeline  # noqa: E402
+
+# The six independent resume tools and a rough share of a real call's latency
+TOOLS = {
+    "pi_details": 0.4,
+    "sparse_resume": 0.3,
+    "resume_summary": 1.0,
+    "skills_eval": 0.9,
+    "desired_exp_eval": 0.7,
+    "education_eval": 0.5,
+}
+
+
+def _result(name: str) -> Dict[str, Any]:
+    return {"tool": name, "payload": "x" * 2048}
+
+
+def _thread_candidate(scale: float) -> Dict[str, Any]:
+    def call(name: str) -> Dict[str, Any]:
+        time.sleep(TOOLS[name] * scale)
+        return _result(name)
+
+    with ThreadPoolExecutor(max_workers=len(TOOLS)) as executor:
+        futures = {executor.submit(call, name): name for name in TOOLS}
+        return {futures[f]: f.result() for f in as_completed(futures)}
+
+
+def run_threads(candidates: int, concurrency: int, scale: float) -> Tuple[float, int]:
+    peak_threads = 0
+    stop = threading.Event()
+
+    def watch() -> None:
+        nonlocal peak_threads
+        while not stop.is_set():
+            peak_threads = max(peak_threads, threading.active_count())
+            time.sleep(0.005)
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for f in as_completed([executor.submit(_thread_candidate, scale) for _ in range(candidates)]):
+            f.result()
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    watcher.join()
+    return elapsed, peak_threads
+
+
+async def _async_candidate(scale: float) -> Dict[str, Any]:
+    def tool(name: str) -> Callable[[Dict[str, Any]], Any]:
+        async def fn(_inputs: Dict[str, Any]) -> Dict[str, Any]:
+            await asyncio.sleep(TOOLS[name] * scale)
+            return _result(name)
+        return fn
+
+    pipeline = Pipeline([Node(name, tool(name)) for name in TOOLS])
+    return {res.name: res.value async for res in pipeline.run()}
+
+
+def run_async(candidates: int, concurrency: int, scale: float) -> Tuple[float, int]:
+    async def main() -> None:
+        slots = asyncio.Semaphore(concurrency)
+
+        async def one() -> Dict[str, Any]:
+            async with slots:
+                return await _async_candidate(scale)
+
+        await asyncio.gather(*(one() for _ in range(candidates)))
+
+    t0 = time.perf_counter()
+    asyncio.run(main())
+    return time.perf_counter() - t0, threading.active_count()
+
+
+def _memory_per_request(runner: Callable[[int, int, float], Tuple[float, int]], concurrency: int, scale: float) -> float:
+    """Peak Python heap with `concurrency` candidates in flight, per candidate (KB)."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    runner(concurrency, concurrency, scale)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (peak - base) / 1024 / concurrency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="8,32,128,512", help="candidates in flight")
+    parser.add_argument("--rounds", type=int, default=3, help="candidates per slot in the throughput run")
+    parser.add_argument("--latency-scale", type=float, default=0.2, help="multiplier on the simulated tool latencies")
+    args = parser.parse_args()
+    levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+
+    print(f"{'design':<8} {'in flight':>9} {'cand/s':>9} {'KB/req':>9} {'threads':>8}")
+    for c in levels:
+        for name, runner in (("threads", run_threads), ("asyncio", run_async)):
+            n = c * args.rounds
+            elapsed, threads = runner(n, c, args.latency_scale)
+            kb = _memory_per_request(runner, c, args.latency_scale)
+            print(f"{name:<8} {c:>9} {n / elapsed:>9.1f} {kb:>9.1f} {threads:>8}")
+    slowest = max(TOOLS.values()) * args.latency_scale
+    print(f"Simulated tool latency; the slowest tool takes {slowest:.2f}s, so the ideal is in-flight / {slowest:.2f} cand/s.")
+
+
+if __name__ == "__main__":
+    main()
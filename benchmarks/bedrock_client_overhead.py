@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Per-call overhead of a fresh bedrock-runtime client vs the shared tool runtime.
+
+The old tool code built `boto3.client("bedrock-runtime")` and re-read env vars on every
+call; `bedrock_runtime.py` keeps one module-scope client. Both paths run against a
+botocore Stubber, so the numbers cover client construction, request serialization and
+response parsing only. TLS handshakes saved on a warm Lambda come on top of this.
+Pass --live to hit Bedrock instead (needs credentials and model access).
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import boto3
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools", "resume_sparse_checker"))
+
+import bedrock_runtime  # noqa: E402
+
+
+RESPONSE = json.dumps(
+    {
+        "content": [{"type": "text", "text": '{"sparse_resume": false, "reason": "ok"}'}],
+        "usage": {"input_tokens": 420, "output_tokens": 18},
+    }
+).encode()
+
+
+def _stub_response() -> Dict[str, Any]:
+    return {"body": StreamingBody(io.BytesIO(RESPONSE), len(RESPONSE)), "contentType": "application/json"}
+
+
+def _content() -> List[Dict[str, Any]]:
+    return [{"type": "text", "text": "prompt"}, {"type": "text", "text": "resume_text:\nJane Doe"}]
+
+
+def old_call(live: bool) -> str:
+    region = os.getenv("BEDROCK_REGION", os.getenv("AWS_REGION", "us-east-1"))
+    model_id = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20240620-v1:0")
+    client = boto3.client("bedrock-runtime", region_name=region)
+    body = {"anthropic_version": "bedrock-2023-05-31", "max_tokens": 4000, "temperature": 0,
+            "messages": [{"role": "user", "content": _content()}]}
+    if live:
+        resp = client.invoke_model(modelId=model_id, accept="application/json", contentType="application/json", body=json.dumps(body))
+    else:
+        with Stubber(client) as stub:
+            stub.add_response("invoke_model", _stub_response())
+            resp = client.invoke_model(modelId=model_id, accept="application/json", contentType="application/json", body=json.dumps(body))
+    payload = json.loads(resp["body"].read())
+    contents = []
+    output_obj = payload.get("output")
+    if isinstance(output_obj, dict):
+        contents = output_obj.get("content", []) or []
+    elif isinstance(payload.get("content"), list):
+        contents = payload.get("content", [])
+    return "".join(c.get("text", "") for c in contents if isinstance(c, dict) and c.get("type") == "text").strip()
+
+
+def shared_call(live: bool, stubber: Stubber) -> str:
+    if not live:
+        stubber.add_response("invoke_model", _stub_response())
+    return bedrock_runtime.invoke_messages(_content(), label="bench", max_tokens=4000)
+
+
+def _time(fn: Callable[[], Any], n: int) -> List[float]:
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def _report(name: str, samples: List[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{name:<18} mean={statistics.mean(samples):8.3f} ms  p50={statistics.median(samples):8.3f} ms  p95={p95:8.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=200, help="calls per variant")
+    parser.add_argument("--live", action="store_true", help="call Bedrock instead of a stub")
+    args = parser.parse_args()
+
+    stubber = Stubber(bedrock_runtime.get_client())
+    if not args.live:
+        stubber.activate()
+    old = _time(lambda: old_call(args.live), args.n)
+    shared = _time(lambda: shared_call(args.live, stubber), args.n)
+    _report("client per call", old)
+    _report("shared client", shared)
+    print(f"overhead removed per call: {statistics.mean(old) - statistics.mean(shared):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Per-tool prompt and output reduction from compact I/O and line-id evidence in the tools.
+
+Input side: resume / JD text is sent as raw `<name>...</name>` blocks instead of a
+JSON-escaped string, so newlines, quotes and non-ASCII bullets/dashes (`\\u2022` is six
+characters) are not escaped. Output side: the resume scorers answer with the short keys of
+their `OUTPUT_CODEC` in minified JSON (the skills scorer also leaves out `jd_context_used`)
+instead of the indented long-key schema the prompts show. With line-id evidence
+(`line_refs.py`) the skills and desired-experience scorers also cite `"lines": ["12"]`
+instead of copying each excerpt, at the cost of numbering the resume lines in the input.
+
+This reports the mean resume_text block tokens before/after (the same for every resume
+tool) and with numbered lines, and per scorer the output tokens before, with compact keys
+and with line ids, and the decode time saved at --output-tps, which is where most of the
+latency goes. Tokens are
+estimated as chars / 4; output sizes come from representative items built per schema
+(--skills, --requirements, --education items per call).
+
+Corpus: --resumes JSONL (`{"resume_text": ...}` per line), or --live to scan
+`resume_text` from the candidates table (`--table`, `--limit`). Without either a small
+synthetic set is used.
+"""
+import argparse
+import ast
+import json
+import os
+import random
+import sys
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools", "resume_skills_scorer"))
+
+import compact_io  # noqa: E402
+from compact_io import OutputCodec, input_text  # noqa: E402
+from line_refs import numbered, resume_units  # noqa: E402
+
+compact_io.COMPACT_INPUT_ENABLED = True
+
+# Resume tools whose output uses a codec; all resume tools share the resume_text input saving
+OUTPUT_TOOLS = ("resume_skills_scorer", "resume_desired_experience_scorer", "resume_education_evaluator")
+
+
+def _codec(tool: str) -> OutputCodec:
+    """The tool's OUTPUT_CODEC, read from its tools.py without importing the Lambda dependencies."""
+    with open(os.path.join(ROOT, "tools", tool, "tools.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", "") == "OUTPUT_CODEC":
+            call = node.value
+            kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}
+            return OutputCodec(ast.literal_eval(call.args[0]), **kwargs)
+    raise SystemExit(f"no OUTPUT_CODEC in {tool}")
+
+
+def _sample_output(tool: str, n: int) -> Dict[str, Any]:
+    justification = "Built and operated production services with this technology across two roles over four years."
+    excerpt = "Designed and shipped event-driven ingestion services on AWS Lambda handling 2M events/day"
+    if tool == "resume_skills_scorer":
+        return {"skills": [{
+            "skill": f"Skill {i}", "score": 7, "confidence": 0.8, "justification": justification,
+            "resume_evidence": [{"source": "applied", "excerpt": excerpt}, {"source": "keyword", "excerpt": "Skills: Python"}],
+            "jd_context_used": "Required to build and maintain the data ingestion services of the platform.",
+            "notes": [],
+        } for i in range(n)]}
+    if tool == "resume_desired_experience_scorer":
+        return {"experiences": [{
+            "requirement": f"Experience leading cross-functional delivery of platform initiative {i}",
+            "score": 6, "confidence": 0.7, "justification": justification,
+            "resume_evidence": [{"source": "partial", "excerpt": excerpt}], "notes": ["one-hop equivalence"],
+        } for i in range(n)]}
+    return {
+        "education_certification_matching": [{
+            "requirement": f"Bachelor's degree in Computer Science or related field {i}", "match_status": "Partial",
+            "score": 6, "justification": "Requirement satisfied because resume shows: \"BSc Information Systems\"",
+        } for i in range(n)],
+        "gaps": {"missing_requirements": []},
+    }
+
+
+def _shorten(value: Any, keys: Dict[str, str]) -> Any:
+    if isinstance(value, dict):
+        return {keys.get(k, k): _shorten(v, keys) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_shorten(v, keys) for v in value]
+    return value
+
+
+def _cite_lines(value: Any, keys: Dict[str, str]) -> Any:
+    """Compact output with each evidence excerpt replaced by a line id, for codecs that have "lines"."""
+    if "lines" not in keys:
+        return value
+    if isinstance(value, dict):
+        if keys["excerpt"] in value:
+            return {**{k: v for k, v in value.items() if k != keys["excerpt"]}, keys["lines"]: ["12"]}
+        return {k: _cite_lines(v, keys) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_cite_lines(v, keys) for v in value]
+    return value
+
+
+def _synthetic(n: int) -> List[str]:
+    rng = random.Random(11)
+    out = []
+    for i in range(n):
+        lines = [f"Candidate {i}", f"candidate{i}@example.com • +1 415 555 01{i % 100:02d}", "SUMMARY",
+                 "Engineer building “reliable” data platforms — 8 years.", "WORK EXPERIENCE"]
+        for r in range(rng.randint(1, 6)):
+            lines += [f"Senior Engineer, Company {r} Inc | {2022 - 2 * r} – {2024 - 2 * r}"]
+            lines += [f"• Delivered project {j} with Python and AWS for {rng.randint(2, 40)} teams" for j in range(4)]
+        lines += ["EDUCATION", "BSc Computer Science, State University, 2010", "SKILLS",
+                  "Python, SQL, AWS, Terraform, Kubernetes"]
+        out.append("\n".join(lines))
+    return out
+
+
+def _load(args: argparse.Namespace) -> List[str]:
+    if args.resumes:
+        with open(args.resumes, encoding="utf-8") as f:
+            return [json.loads(line).get("resume_text") or "" for line in f if line.strip()]
+    if args.live:
+        import boto3
+
+        table = boto3.resource("dynamodb", region_name=os.getenv("AWS_REGION", "us-east-1")).Table(args.table)
+        texts: List[str] = []
+        kwargs = {"ProjectionExpression": "resume_text"}
+        while len(texts) < args.limit:
+            page = table.scan(**kwargs)
+            texts += [it["resume_text"] for it in page.get("Items", []) if it.get("resume_text")]
+            if "LastEvaluatedKey" not in page:
+                break
+            kwargs["ExclusiveStartKey"] = page["LastEvaluatedKey"]
+        return texts[: args.limit]
+    return _synthetic(200)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", help="JSONL with resume_text per row")
+    parser.add_argument("--live", action="store_true", help="scan resume_text from the candidates table")
+    parser.add_argument("--table", default=os.getenv("CANDIDATE_TABLE_NAME", "candidates"))
+    parser.add_argument("--limit", type=int, default=500, help="resumes to read with --live")
+    parser.add_argument("--skills", type=int, default=12, help="skills scored per call")
+    parser.add_argument("--requirements", type=int, default=6, help="desired-experience items per call")
+    parser.add_argument("--education", type=int, default=3, help="education requirements per call")
+    parser.add_argument("--output-tps", type=float, default=60.0, help="model output tokens per second")
+    args = parser.parse_args()
+
+    texts = [t for t in _load(args) if t.strip()]
+    if not texts:
+        sys.exit("no resumes")
+    n = len(texts)
+    before = sum(len(f"Input JSON:\n{json.dumps({'resume_text': t})}") for t in texts) / n / 4
+    after = sum(len(input_text("Input", {"resume_text": t})) for t in texts) / n / 4
+    print(f"resumes: {n}")
+    print(f"{'input':<34} {'before':>7} {'after':>7} {'saved':>7}")
+    print(f"{'resume_text block':<34} {before:>7.0f} {after:>7.0f} {1 - after / before:>7.1%}")
+    lined = sum(len(input_text("Input", {"resume_text": numbered(resume_units(t))})) for t in texts) / n / 4
+    print(f"{'  with numbered lines':<34} {before:>7.0f} {lined:>7.0f} {1 - lined / before:>7.1%}")
+
+    counts = {"resume_skills_scorer": args.skills, "resume_desired_experience_scorer": args.requirements,
+              "resume_education_evaluator": args.education}
+    print(f"\n{'output':<34} {'before':>7} {'compact':>7} {'+lines':>7} {'saved':>7} {'decode s saved':>15}")
+    for tool in OUTPUT_TOOLS:
+        codec = _codec(tool)
+        full = _sample_output(tool, counts[tool])
+        kept = {k: [{f: x for f, x in item.items() if f not in codec.omit} for item in v] if isinstance(v, list) else v
+                for k, v in full.items()}
+        short = _shorten(kept, codec.keys)
+        assert codec.expand(short) == kept
+        compact = json.dumps(short, ensure_ascii=False, separators=(",", ":"))
+        out_before = len(json.dumps(full, indent=2)) / 4
+        out_compact = len(compact) / 4
+        out_after = len(json.dumps(_cite_lines(short, codec.keys), ensure_ascii=False, separators=(",", ":"))) / 4
+        print(f"{tool:<34} {out_before:>7.0f} {out_compact:>7.0f} {out_after:>7.0f} {1 - out_after / out_before:>7.1%} "
+              f"{(out_before - out_after) / args.output_tps:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""WCU, request size and latency of whole-item put_item vs field-level UpdateItem.
+
+The agents used to persist with `put_item({**record, **results})`, resending the whole
+resume/JD text on every run. They now use `update_item_fields` (agents' `utils.py`),
+which SETs only the result attributes behind a version guard. DynamoDB bills an
+UpdateItem on the larger of the item's before/after size, so the single update costs
+the same WCU as the put; what shrinks is the request payload (and the lost-update race).
+Per-tool writes (PERSIST_EACH_TOOL) pay the full item size once per tool.
+
+By default WCU come from DynamoDB's item-size rules and latency is client-side
+serialization, signing and parsing, with the HTTP send short-circuited. Pass --live --table <name> to write a scratch
+item to a real table (partition key `id`) and report ConsumedCapacity and round trips.
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+import uuid
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "agent", "resume_processor_agent"))
+
+from utils import to_dynamodb_compatible, update_item_fields  # noqa: E402
+
+
+def _results() -> Dict[str, Any]:
+    """Tool outputs of roughly the size the resume tools return for a 20-skill job."""
+    skill = {"skill": "Python", "score": 0.8, "confidence": 0.9, "justification": "x" * 180,
+             "resume_evidence": ["y" * 120], "jd_context_used": "z" * 80, "notes": ""}
+    return {
+        "pi_details": {"name": "Jane Doe", "email": "jane@example.com", "phone": "+1 555 0100", "years_of_experience": 8},
+        "sparse_resume": False,
+        "resume_summary": {"summary": "s" * 900, "match_score": 0.72, "strengths": ["a" * 80] * 4, "gaps": ["b" * 80] * 3},
+        "skills_eval": {"skills": [dict(skill) for _ in range(20)]},
+        "desired_exp_eval": {"experiences": [{"requirement": "r" * 90, "score": 0.6, "justification": "j" * 160} for _ in range(6)]},
+        "education_eval": {"education_certification_matching": [{"requirement": "BSc", "met": True}], "gaps": {"missing_requirements": []}},
+    }
+
+
+def _attr_size(value: Any) -> int:
+    """Approximate DynamoDB attribute value size in bytes."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (int, float, Decimal)):
+        return len(str(value).lstrip("-").replace(".", "")) // 2 + 2
+    if isinstance(value, dict):
+        return 3 + sum(1 + len(k.encode("utf-8")) + _attr_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 3 + sum(1 + _attr_size(v) for v in value)
+    return len(str(value))
+
+
+def item_size(item: Dict[str, Any]) -> int:
+    return sum(len(k.encode("utf-8")) + _attr_size(v) for k, v in item.items())
+
+
+def _wcu(size: int) -> int:
+    return max(1, math.ceil(size / 1024))
+
+
+def wcu_per_strategy(base: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, int]:
+    after = {**base, **results, "version": 1}
+    per_tool = 0
+    current = dict(base)
+    for i, (k, v) in enumerate(results.items(), start=1):
+        before_size = item_size(current)
+        current = {**current, k: v, "version": i}
+        per_tool += _wcu(max(before_size, item_size(current)))
+    return {
+        "put_item": _wcu(item_size(after)),
+        "update_item": _wcu(max(item_size(base), item_size(after))),
+        "update_per_tool": per_tool,
+    }
+
+
+class _RawBody:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def stream(self, **_: Any) -> Iterator[bytes]:
+        yield self._body
+
+
+def _offline_table() -> Tuple[Any, List[int]]:
+    """Table whose requests are fully built and signed, then answered locally; records body sizes."""
+    table = boto3.resource("dynamodb", region_name="us-east-1", aws_access_key_id="bench",
+                           aws_secret_access_key="bench").Table("candidates")
+    sizes: List[int] = []
+
+    def send(request: Any, **_: Any) -> AWSResponse:
+        sizes.append(len(request.body or b""))
+        body = b'{"Attributes": {"version": {"N": "1"}}}' if b"UpdateItem" in request.headers.get("X-Amz-Target", b"") else b"{}"
+        return AWSResponse(request.url, 200, {}, _RawBody(body))
+
+    table.meta.client.meta.events.register("before-send.dynamodb.*", send)
+    return table, sizes
+
+
+def _time(fn: Callable[[], Any], n: int) -> List[float]:
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def offline(sizes_kb: List[int], n: int) -> None:
+    results = _results()
+    table, request_sizes = _offline_table()
+    print(f"{'resume':>8} {'put WCU':>8} {'upd WCU':>8} {'per-tool WCU':>13} {'put req':>10} {'upd req':>10} {'put ms':>8} {'upd ms':>8}")
+    for kb in sizes_kb:
+        base = {"id": "c1", "job_id": "j1", "GSI1PK": "j1", "resume_text": "lorem ipsum " * (kb * 1024 // 12)}
+        wcu = wcu_per_strategy(base, results)
+
+        def put() -> None:
+            table.put_item(Item=to_dynamodb_compatible({**base, **results}))
+
+        def update() -> None:
+            update_item_fields(table, {"id": "c1"}, results, None)
+
+        request_sizes.clear()
+        put_ms = statistics.median(_time(put, n))
+        put_bytes = request_sizes[-1]
+        request_sizes.clear()
+        upd_ms = statistics.median(_time(update, n))
+        upd_bytes = request_sizes[-1]
+        print(f"{kb:>6}KB {wcu['put_item']:>8} {wcu['update_item']:>8} {wcu['update_per_tool']:>13} "
+              f"{put_bytes:>9}B {upd_bytes:>9}B {put_ms:>8.3f} {upd_ms:>8.3f}")
+    print("WCU from DynamoDB item-size rules; ms = client-side request/response handling (median, no network).")
+
+
+def live(table_name: str, sizes_kb: List[int], n: int) -> None:
+    region = os.getenv("AWS_REGION", "us-east-1")
+    table = boto3.resource("dynamodb", region_name=region).Table(table_name)
+    results = to_dynamodb_compatible(_results())
+    print(f"{'resume':>8} {'put WCU':>8} {'upd WCU':>8} {'put ms':>8} {'upd ms':>8}")
+    for kb in sizes_kb:
+        key = {"id": f"bench-{uuid.uuid4()}"}
+        base = {**key, "resume_text": "lorem ipsum " * (kb * 1024 // 12)}
+        put_wcu: List[float] = []
+        upd_wcu: List[float] = []
+        try:
+            def put() -> None:
+                resp = table.put_item(Item={**base, **results}, ReturnConsumedCapacity="TOTAL")
+                put_wcu.append(resp["ConsumedCapacity"]["CapacityUnits"])
+
+            version = [None]
+
+            def update() -> None:
+                version[0], wcu = update_item_fields(table, key, results, version[0])
+                upd_wcu.append(wcu)
+
+            put_ms = statistics.median(_time(put, n))
+            table.put_item(Item=base)
+            upd_ms = statistics.median(_time(update, n))
+        finally:
+            table.delete_item(Key=key)
+        print(f"{kb:>6}KB {statistics.mean(put_wcu):>8.1f} {statistics.mean(upd_wcu):>8.1f} {put_ms:>8.1f} {upd_ms:>8.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=50, help="writes per variant and size")
+    parser.add_argument("--sizes-kb", default="5,20,100,300", help="resume_text sizes to test")
+    parser.add_argument("--live", action="store_true", help="write to a real table instead of a stub")
+    parser.add_argument("--table", default=os.getenv("CANDIDATE_TABLE_NAME", "candidates"))
+    args = parser.parse_args()
+    sizes_kb = [int(s) for s in args.sizes_kb.split(",") if s.strip()]
+    if args.live:
+        live(args.table, sizes_kb, args.n)
+    else:
+        offline(sizes_kb, args.n)
+
+
+if __name__ == "__main__":
+    main()
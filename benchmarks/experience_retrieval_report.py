@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Input size and fallback rate of BM25 evidence windows vs the full resume for desired-experience scoring.
+
+`resume_desired_experience_scorer` sends per-requirement passages (`passage_index.py`) instead of
+the whole resume when retrieval is confident. Synthetic resumes of growing length are scored
+against a fixed requirement list; this reports the payload characters sent in each mode, how
+often the full-resume fallback kicks in, and retrieval latency. With --resumes a JSONL file of
+`{"resume_text": ..., "desired_experience": [...]}` rows is used instead.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools", "resume_desired_experience_scorer"))
+
+import passage_index  # noqa: E402
+
+REQUIREMENTS = [
+    "Experience leading engineering teams",
+    "Building backend services in Java",
+    "Experience with AWS serverless architectures",
+    "Working with SQL databases at scale",
+]
+_BULLETS = [
+    "Built payment microservices in Java and Spring Boot handling {n}M requests/day.",
+    "Managed a team of {n} engineers and mentored juniors through code reviews.",
+    "Migrated legacy batch jobs to AWS Lambda and DynamoDB, cutting cost {n}0%.",
+    "Tuned PostgreSQL queries and indexes for reporting workloads.",
+    "Partnered with product on roadmap planning and quarterly OKRs.",
+    "Set up CI pipelines with GitHub Actions across {n} repositories.",
+    "Ran incident reviews and on-call rotations for the platform group.",
+    "Wrote design docs for the event ingestion pipeline on Kafka.",
+]
+
+
+def _resume(roles: int, rng: random.Random) -> str:
+    lines = ["Jane Doe", "jane@example.com", "SUMMARY", "Backend engineer building distributed systems.",
+             "WORK EXPERIENCE"]
+    for i in range(roles):
+        lines.append(f"Senior Engineer, Company {i} Inc | {2023 - 2 * i - 2} - {2023 - 2 * i}")
+        lines += ["- " + b.format(n=rng.randint(2, 9)) for b in rng.sample(_BULLETS, 5)]
+    lines += ["EDUCATION", "BSc Computer Science, 2004 - 2008"]
+    return "\n".join(lines)
+
+
+def _rows(path: str, rng: random.Random, roles: List[int], per_size: int) -> List[Dict[str, Any]]:
+    if path:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    return [
+        {"resume_text": _resume(r, rng), "desired_experience": REQUIREMENTS}
+        for r in roles for _ in range(per_size)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", help="JSONL with resume_text and desired_experience per row")
+    parser.add_argument("--roles", default="2,4,8,16", help="roles per synthetic resume")
+    parser.add_argument("-n", type=int, default=50, help="synthetic resumes per size")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    rows = _rows(args.resumes, rng, [int(r) for r in args.roles.split(",") if r.strip()], args.n)
+    full_chars, sent_chars, fallbacks, latencies = 0, 0, {}, []
+    for row in rows:
+        full = len(json.dumps({"resume_text": row["resume_text"]}))
+        t0 = time.perf_counter()
+        windows, stats = passage_index.evidence_windows(row["resume_text"], row["desired_experience"])
+        latencies.append((time.perf_counter() - t0) * 1e3)
+        full_chars += full
+        if windows is None:
+            fallbacks[stats["reason"]] = fallbacks.get(stats["reason"], 0) + 1
+            sent_chars += full
+        else:
+            sent_chars += len(json.dumps({"resume_evidence_windows": windows}))
+
+    n = len(rows)
+    print(f"rows: {n}")
+    print(f"full-resume payload chars: {full_chars / n:.0f}/row; sent: {sent_chars / n:.0f}/row "
+          f"({1 - sent_chars / full_chars:.1%} saved)")
+    print(f"fallback to full resume: {sum(fallbacks.values())} ({sum(fallbacks.values()) / n:.1%}) "
+          + " ".join(f"{k}={v}" for k, v in sorted(fallbacks.items())))
+    print(f"retrieval latency: p50={statistics.median(latencies):.2f} ms  max={max(latencies):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Per-tool input reduction from routing JD sections (`agent/jd_skill_processor_agent/sections.py`).
+
+The JD agent segments each JD once and sends the skills extractor, responsibility extractor
+and education/desired-experience tool only their sections. This reports, per tool, the mean
+JD tokens sent with and without routing (tokens estimated as chars / 4), how often a tool
+falls back to the full JD, how often each section is found, and segmentation latency.
+
+Corpus: --jds JSONL (`{"jd_text": ...}` per line), or --live to scan `jd_text`/`text` from
+the jobs table (`--table`, `--limit`). Without either a small synthetic set is used.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "agent", "jd_skill_processor_agent"))
+
+from sections import TOOL_SECTIONS, segment, tool_views  # noqa: E402
+
+
+def _synthetic(n: int) -> List[str]:
+    rng = random.Random(7)
+    out = []
+    for i in range(n):
+        lines = [f"Company {i} is hiring a Senior Backend Engineer for its payments platform.", "About Us",
+                 "We are a fast-growing fintech serving customers in 30 countries. " * rng.randint(1, 4),
+                 "What You'll Do"]
+        lines += [f"- Design and operate service {j} on AWS with Java and Kafka" for j in range(rng.randint(4, 8))]
+        lines += ["Requirements"] + [f"- {rng.randint(3, 8)}+ years of experience with skill {j}" for j in range(5)]
+        lines += ["Preferred Qualifications", "- Kubernetes and Terraform", "Education",
+                  "- Bachelor's degree in Computer Science or related field", "Benefits"]
+        lines += [f"- Perk {j}: generous allowance and flexible hours" for j in range(rng.randint(3, 8))]
+        lines += ["Equal Opportunity Employer", "We celebrate diversity and are committed to an inclusive workplace."]
+        out.append("\n".join(lines))
+    return out
+
+
+def _load(args: argparse.Namespace) -> List[str]:
+    if args.jds:
+        with open(args.jds, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        return [r.get("jd_text") or r.get("text") or "" for r in rows]
+    if args.live:
+        import boto3
+
+        table = boto3.resource("dynamodb", region_name=os.getenv("AWS_REGION", "us-east-1")).Table(args.table)
+        texts: List[str] = []
+        kwargs = {"ProjectionExpression": "jd_text, #t", "ExpressionAttributeNames": {"#t": "text"}}
+        while len(texts) < args.limit:
+            page = table.scan(**kwargs)
+            texts += [t for t in (it.get("jd_text") or it.get("text") for it in page.get("Items", [])) if t]
+            if "LastEvaluatedKey" not in page:
+                break
+            kwargs["ExclusiveStartKey"] = page["LastEvaluatedKey"]
+        return texts[: args.limit]
+    return _synthetic(200)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jds", help="JSONL with jd_text per row")
+    parser.add_argument("--live", action="store_true", help="scan JD text from the jobs table")
+    parser.add_argument("--table", default=os.getenv("JD_TABLE_NAME", "jobs"))
+    parser.add_argument("--limit", type=int, default=500, help="JDs to read with --live")
+    args = parser.parse_args()
+
+    texts = [t for t in _load(args) if t.strip()]
+    if not texts:
+        sys.exit("no JDs")
+    routed: Dict[str, List[float]] = {tool: [] for tool in TOOL_SECTIONS}
+    fallbacks = {tool: 0 for tool in TOOL_SECTIONS}
+    found: Dict[str, int] = {}
+    latencies: List[float] = []
+    for text in texts:
+        t0 = time.perf_counter()
+        sections = segment(text)
+        views = tool_views(text, sections)
+        latencies.append((time.perf_counter() - t0) * 1e6)
+        for name in {s["name"] for s in sections}:
+            found[name] = found.get(name, 0) + 1
+        for tool, view in views.items():
+            routed[tool].append(len(view) / 4)
+            fallbacks[tool] += view is text
+
+    n = len(texts)
+    total_full = sum(len(t) / 4 for t in texts)
+    print(f"JDs: {n}  mean JD tokens: {total_full / n:.0f}")
+    print(f"{'tool':<30} {'full':>7} {'routed':>7} {'saved':>7} {'fallback':>9}")
+    for tool, tokens in routed.items():
+        print(f"{tool:<30} {total_full / n:>7.0f} {sum(tokens) / n:>7.0f} {1 - sum(tokens) / total_full:>7.1%} "
+              f"{fallbacks[tool] / n:>9.1%}")
+    print("sections found: " + ", ".join(f"{k}={v / n:.0%}" for k, v in sorted(found.items(), key=lambda kv: -kv[1])))
+    print(f"segmentation latency: p50={statistics.median(latencies):.0f} us  max={max(latencies):.0f} us")
+
+
+if __name__ == "__main__":
+    main()
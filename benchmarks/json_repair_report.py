@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Latency and span choice of the regex JSON fallback vs json_repair.py on pathological output.
+
+The agents' previous `safe_json_loads` fell back to `re.search(r"(\\{[\\s\\S]*\\}|\\[[\\s\\S]*\\])")`,
+which backtracks from every "{" to the last "}" (quadratic on unbalanced braces) and takes the
+span from the first bracket to the last one, stray prose braces included. `json_repair.scan_json`
+decodes in place from the first bracket that can start a JSON value and skips malformed spans
+in one pass.
+
+Latency is measured per case at --size bytes (default 1 MB) for json_repair. The regex is run
+up to --regex-max-bytes and, when it is still growing quadratically, estimated at --size from
+the largest measured size ("est."). The second table shows what each parser returns on short
+model-style outputs: prose around the JSON, stray braces, and output cut at max_tokens.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Callable, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "agent", "resume_processor_agent"))
+
+from json_repair import scan_json  # noqa: E402
+
+_GREEDY = re.compile(r"(\{[\s\S]*\}|\[[\s\S]*\])")
+
+
+def regex_loads(text: str):
+    """The previous safe_json_loads."""
+    try:
+        return json.loads(text)
+    except Exception:
+        m = _GREEDY.search(text)
+        if m:
+            return json.loads(m.group(1))
+        raise
+
+
+def _item(i: int) -> str:
+    return json.dumps({"skill": f"Skill {i}", "score": 7, "justification": "Used {x} and [y] in production."})
+
+
+def _cases() -> List[Tuple[str, Callable[[int], str]]]:
+    """(name, builder of a text of about n bytes)."""
+    return [
+        ("unbalanced braces", lambda n: "{" * n),
+        ("stray braces in prose", lambda n: "x { y " * (n // 6) + json.dumps({"ok": True})),
+        ("prose-wrapped JSON", lambda n: "Result for {skill}:\n```json\n{\"skills\": ["
+         + ",".join(_item(i) for i in range(n // 90)) + "]}\n``` see {notes}"),
+        ("truncated list", lambda n: "{\"skills\": [" + ",".join(_item(i) for i in range(n // 90)) + ",{\"skill\": \"Sk"),
+        ("unterminated strings", lambda n: "{\"" * (n // 2)),
+    ]
+
+
+def _time(fn: Callable[[str], object], text: str) -> Tuple[float, str]:
+    t0 = time.perf_counter()
+    try:
+        value = fn(text)
+        outcome = type(value).__name__
+    except (ValueError, RecursionError):
+        outcome = "error"
+    return time.perf_counter() - t0, outcome
+
+
+def _regex_latency(build: Callable[[int], str], size: int, max_bytes: int) -> str:
+    n, last = 1024, None
+    while n <= min(size, max_bytes):
+        elapsed, _ = _time(regex_loads, build(n))
+        last = (n, elapsed)
+        n *= 4
+    if last is None:
+        return "-"
+    measured_n, elapsed = last
+    if measured_n >= size:
+        return f"{elapsed:.3f}"
+    previous, _ = _time(regex_loads, build(measured_n // 4))
+    exponent = 2 if elapsed > 8 * max(previous, 1e-4) else 1
+    return f"{elapsed * (size / measured_n) ** exponent:.3g} est."
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1 << 20, help="input bytes per case")
+    parser.add_argument("--regex-max-bytes", type=int, default=16 << 10, help="largest input timed for the regex")
+    args = parser.parse_args()
+
+    print(f"input size: {args.size} bytes")
+    print(f"{'case':<24} {'regex s':>14} {'json_repair s':>14} {'result':>14}")
+    for name, build in _cases():
+        text = build(args.size)
+        t0 = time.perf_counter()
+        try:
+            value, repaired = scan_json(text)
+            result = f"{type(value).__name__}{' repaired' if repaired else ''}"
+        except ValueError:
+            result = "error"
+        elapsed = time.perf_counter() - t0
+        print(f"{name:<24} {_regex_latency(build, args.size, args.regex_max_bytes):>14} {elapsed:>14.3f} {result:>14}")
+
+    samples = [
+        ("prose around JSON", 'Here you go: {"skills": [{"skill": "Go"}]} Let me know if {anything} else.'),
+        ("brace before JSON", 'Scored each {skill} below.\n{"skills": [{"skill": "Go"}]}'),
+        ("cut at max_tokens", '{"skills": [{"skill": "Go", "score": 8}, {"skill": "Rust", "sco'),
+        ("two objects", '{"skills": []}\n{"notes": "retry"}'),
+    ]
+    print(f"\n{'output':<20} {'regex':<40} {'json_repair':<40}")
+    for name, text in samples:
+        try:
+            old = json.dumps(regex_loads(text))
+        except (ValueError, RecursionError) as e:
+            old = f"error: {type(e).__name__}"
+        try:
+            new = json.dumps(scan_json(text)[0])
+        except ValueError as e:
+            new = f"error: {type(e).__name__}"
+        print(f"{name:<20} {old[:40]:<40} {new[:40]:<40}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Validation cost of the compiled result models and output tokens of targeted re-asks vs full retries.
+
+For the three scorers whose items map to input items (skills, desired experience, education),
+a result of --items items is built per schema (as in compact_io_report.py) and validated
+against the tool's OUTPUT_SCHEMA with `result_check.ResultModel`; the mean time per result
+is reported.
+
+With each item independently missing or invalid at --fail-rate, a full retry re-generates
+every item whenever any item fails, while `complete_items` re-asks for the failed items only.
+The expected output tokens per call spent on recovery (chars / 4) are reported for both.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+from typing import Any, Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools", "resume_skills_scorer"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from compact_io_report import _sample_output  # noqa: E402
+from result_check import ResultModel  # noqa: E402
+
+TOOLS = {
+    "resume_skills_scorer": "skills",
+    "resume_desired_experience_scorer": "experiences",
+    "resume_education_evaluator": "education_certification_matching",
+}
+
+
+def _output_schema(tool: str) -> Dict[str, Any]:
+    """The tool's OUTPUT_SCHEMA; agentcore_gateway_setup.py only needs the standard library."""
+    path = os.path.join(ROOT, "tools", tool, "agentcore_gateway_setup.py")
+    spec = importlib.util.spec_from_file_location(f"{tool}_gateway_setup", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.OUTPUT_SCHEMA
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=12, help="items per result")
+    parser.add_argument("--fail-rate", type=float, default=0.05, help="share of items missing or invalid")
+    parser.add_argument("--repeat", type=int, default=2000, help="validations timed per tool")
+    args = parser.parse_args()
+
+    p_any = 1 - (1 - args.fail_rate) ** args.items
+    print(f"items per result: {args.items}  item fail rate: {args.fail_rate:.1%}  P(any item fails): {p_any:.1%}")
+    print(f"{'tool':<34} {'validate us':>12} {'full retry tok':>15} {'re-ask tok':>11} {'saved':>7}")
+    for tool, key in TOOLS.items():
+        model = ResultModel(_output_schema(tool))
+        result = _sample_output(tool, args.items)
+        assert not model.validate(result)[1], model.validate(result)[1][:3]
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            model.validate(result)
+        us = (time.perf_counter() - t0) / args.repeat * 1e6
+        item_tokens = len(json.dumps(result[key][0], separators=(",", ":"))) / 4
+        full = p_any * args.items * item_tokens
+        reask = args.fail_rate * args.items * item_tokens
+        print(f"{tool:<34} {us:>12.1f} {full:>15.0f} {reask:>11.0f} {1 - reask / full:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
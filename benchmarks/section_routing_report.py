@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Per-tool input reduction from routing resume sections (`agent/resume_processor_agent/sections.py`).
+
+The resume agent segments each resume once and sends `resume_pi_extractor`,
+`resume_sparse_checker` and `resume_education_evaluator` only the sections they read.
+This reports, per tool, the mean resume tokens sent with and without routing, the
+reduction and how often a tool falls back to the full resume, plus how often each
+section type is found and segmentation latency. Tokens are estimated as chars / 4.
+
+Corpus: --resumes JSONL (`{"resume_text": ...}` per line), or --live to scan
+`resume_text` from the candidates table (`--table`, `--limit`). Without either a small
+synthetic set is used.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "agent", "resume_processor_agent"))
+
+from sections import SECTION_TYPES, TOOL_SECTIONS, segment, tool_views  # noqa: E402
+
+
+def _synthetic(n: int) -> List[str]:
+    rng = random.Random(7)
+    out = []
+    for i in range(n):
+        roles = rng.randint(1, 6)
+        lines = [f"Candidate {i}", f"candidate{i}@example.com | +1 415 555 01{i % 100:02d}", "SUMMARY",
+                 "Engineer building data platforms.", "WORK EXPERIENCE"]
+        for r in range(roles):
+            lines += [f"Engineer, Company {r} Inc | {2022 - 2 * r} - {2024 - 2 * r}"]
+            lines += [f"- Delivered project {j} with Python and AWS for {rng.randint(2, 40)} teams" for j in range(4)]
+        lines += ["EDUCATION", "BSc Computer Science, State University, 2010", "CERTIFICATIONS",
+                  "AWS Certified Developer", "SKILLS", "Python, SQL, AWS, Terraform, Kubernetes", "PROJECTS"]
+        lines += [f"- Side project {j}: a CLI tool for log search" for j in range(rng.randint(0, 3))]
+        out.append("\n".join(lines))
+    return out
+
+
+def _load(args: argparse.Namespace) -> List[str]:
+    if args.resumes:
+        with open(args.resumes, encoding="utf-8") as f:
+            return [json.loads(line).get("resume_text") or "" for line in f if line.strip()]
+    if args.live:
+        import boto3
+
+        table = boto3.resource("dynamodb", region_name=os.getenv("AWS_REGION", "us-east-1")).Table(args.table)
+        texts: List[str] = []
+        kwargs = {"ProjectionExpression": "resume_text"}
+        while len(texts) < args.limit:
+            page = table.scan(**kwargs)
+            texts += [it["resume_text"] for it in page.get("Items", []) if it.get("resume_text")]
+            if "LastEvaluatedKey" not in page:
+                break
+            kwargs["ExclusiveStartKey"] = page["LastEvaluatedKey"]
+        return texts[: args.limit]
+    return _synthetic(200)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", help="JSONL with resume_text per row")
+    parser.add_argument("--live", action="store_true", help="scan resume_text from the candidates table")
+    parser.add_argument("--table", default=os.getenv("CANDIDATE_TABLE_NAME", "candidates"))
+    parser.add_argument("--limit", type=int, default=500, help="resumes to read with --live")
+    args = parser.parse_args()
+
+    texts = [t for t in _load(args) if t.strip()]
+    if not texts:
+        sys.exit("no resumes")
+    full_tokens = [len(t) / 4 for t in texts]
+    routed: Dict[str, List[float]] = {tool: [] for tool in TOOL_SECTIONS}
+    fallbacks = {tool: 0 for tool in TOOL_SECTIONS}
+    found = {kind: 0 for kind in SECTION_TYPES}
+    latencies: List[float] = []
+    for text in texts:
+        t0 = time.perf_counter()
+        sections = segment(text)
+        views = tool_views(text, sections)
+        latencies.append((time.perf_counter() - t0) * 1e6)
+        for kind in {s["type"] for s in sections}:
+            found[kind] += 1
+        for tool, view in views.items():
+            routed[tool].append(len(view) / 4)
+            fallbacks[tool] += view is text
+
+    n = len(texts)
+    total_full = sum(full_tokens)
+    print(f"resumes: {n}  mean resume tokens: {total_full / n:.0f}")
+    print(f"{'tool':<16} {'full':>7} {'routed':>7} {'saved':>7} {'fallback':>9}")
+    for tool, tokens in routed.items():
+        print(f"{tool:<16} {total_full / n:>7.0f} {sum(tokens) / n:>7.0f} {1 - sum(tokens) / total_full:>7.1%} "
+              f"{fallbacks[tool] / n:>9.1%}")
+    print("sections found: " + ", ".join(f"{k}={v / n:.0%}" for k, v in found.items()))
+    print(f"segmentation latency: p50={statistics.median(latencies):.0f} us  max={max(latencies):.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Share of sparse checks the rule pre-classifier answers locally, and its agreement with the model.
+
+`tools/resume_sparse_checker/sparse_rules.py` answers clear-cut resumes without a Bedrock
+call and leaves borderline ones to the model. Given a labelled JSONL set (one
+`{"resume_text": ..., "sparse_resume": true|false}` per line, labels from the model or a
+reviewer) this reports how much traffic is short-circuited, the agreement and confusion
+matrix on the short-circuited part, how often each indicator fires, and rule latency.
+Rows without a label are labelled by calling the model when --label-with-model is given
+(needs Bedrock credentials). Without --labels a small built-in smoke set is used.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools", "resume_sparse_checker"))
+
+os.environ["SPARSE_PRECHECK"] = "true"
+import sparse_rules  # noqa: E402
+
+
+SMOKE_SET = [
+    {"sparse_resume": False, "resume_text": (
+        "Jane Doe\nSUMMARY\nBackend engineer.\nWORK EXPERIENCE\nSenior Engineer, Acme Technologies  Jan 2020 - Present\n"
+        "- Built a payments service handling 2M requests/day\n- Designed the event pipeline on Kafka\n"
+        "- Led migration of 40 services to Kubernetes\nEDUCATION\nBSc Computer Science\n")},
+    {"sparse_resume": True, "resume_text": (
+        "John Smith\nSummary\nMotivated professional seeking opportunities.\nSkills\nPython, SQL, Excel\n"
+        "Education\nBA Economics\n")},
+    {"sparse_resume": True, "resume_text": "Experience\nWorked at a startup on various things.\nSkills: Python\n"},
+    {"sparse_resume": False, "resume_text": (
+        "Experience:\nData Analyst at Northwind Bank, 03/2018 - 06/2022\n* Automated monthly reporting with Python and Airflow\n"
+        "* Reduced dashboard load time by 60% by tuning SQL\n* Analyzed churn drivers for the retail portfolio\n")},
+    {"sparse_resume": True, "resume_text": "Projects\n- Todo app\n- Weather app\nSkills\nReact, Node\n"},
+    {"sparse_resume": False, "resume_text": (
+        "Experience\nEngineer, Foo Inc  2019 - 2021\nWorked on backend services and built the public APIs.\n")},
+]
+
+
+def _load(path: Optional[str]) -> List[Dict[str, Any]]:
+    if not path:
+        return [dict(r) for r in SMOKE_SET]
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _model_label(resume_text: str) -> bool:
+    from bedrock_runtime import invoke_messages
+    from constants import RESUME_SPARSE_CHECK_PROMPT
+    from prompt_cache import text_block
+
+    content = [text_block(RESUME_SPARSE_CHECK_PROMPT.strip(), cache=True), text_block(f"resume_text:\n{resume_text}")]
+    text = invoke_messages(content, label="SparsePrecheckReport", max_tokens=4000)
+    return bool(json.loads(text[text.find("{"): text.rfind("}") + 1])["sparse_resume"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--labels", help="labelled JSONL (resume_text, sparse_resume)")
+    parser.add_argument("--label-with-model", action="store_true", help="call the model for rows without a label")
+    parser.add_argument("--show-disagreements", type=int, default=5, help="print up to N disagreeing rows")
+    args = parser.parse_args()
+
+    rows = _load(args.labels)
+    for row in rows:
+        if "sparse_resume" not in row and args.label_with_model:
+            row["sparse_resume"] = _model_label(row["resume_text"])
+    rows = [r for r in rows if "sparse_resume" in r]
+    if not rows:
+        sys.exit("no labelled rows")
+
+    fired_counts = {k: 0 for k in sparse_rules.INDICATORS}
+    matrix = {"tp": 0, "tn": 0, "fp": 0, "fn": 0}
+    latencies: List[float] = []
+    disagreements = []
+    decided = 0
+    for row in rows:
+        t0 = time.perf_counter()
+        out = sparse_rules.precheck(row["resume_text"])
+        latencies.append((time.perf_counter() - t0) * 1e6)
+        for k, v in sparse_rules.indicators(row["resume_text"])["fired"].items():
+            fired_counts[k] += v
+        if out is None:
+            continue
+        decided += 1
+        label, pred = bool(row["sparse_resume"]), out["sparse_resume"]
+        matrix[("t" if label == pred else "f") + ("p" if pred else "n")] += 1
+        if label != pred:
+            disagreements.append((row["resume_text"][:120].replace("\n", " | "), label, out["reason"]))
+
+    n = len(rows)
+    agree = matrix["tp"] + matrix["tn"]
+    print(f"rows: {n}")
+    print(f"short-circuited: {decided} ({decided / n:.1%}); sent to model: {n - decided} ({(n - decided) / n:.1%})")
+    if decided:
+        print(f"agreement on short-circuited: {agree}/{decided} ({agree / decided:.1%})  "
+              f"tp={matrix['tp']} tn={matrix['tn']} fp={matrix['fp']} fn={matrix['fn']}")
+    print("indicator fire rate: " + ", ".join(f"{k}={v / n:.0%}" for k, v in fired_counts.items()))
+    print(f"rule latency: p50={statistics.median(latencies):.0f} us  max={max(latencies):.0f} us")
+    for text, label, reason in disagreements[: args.show_disagreements]:
+        print(f"  disagree label={label} rules_reason={reason!r} text={text!r}")
+
+
+if __name__ == "__main__":
+    main()
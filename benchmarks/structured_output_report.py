@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Parse-failure rate and retries of one tool with free-text JSON vs forced tool-use output.
+
+Calls the tool function of `tools/<--tool>` (the one its `handler.py` imports) `--runs`
+times with the kwargs in `--event` (a handler event JSON), once with STRUCTURED_OUTPUT off
+(the model writes JSON as text) and once on (the model answers through the result tool
+whose input_schema is the tool's `OUTPUT_SCHEMA`). The result cache is disabled, so every
+call reaches Bedrock; AWS credentials and model access are required.
+
+Per mode it reports:
+- handler failures: `json.loads(text)` raises, which is what every `handler.py` does;
+- repaired: the text only parses after the agents' `safe_json_loads` regex fallback;
+- schema violations: parsed output that does not match `OUTPUT_SCHEMA` (type, required, enum);
+- retries: extra attempts an agent with `--retries` retries would make on handler failures;
+- p50 / max latency.
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _tool_function(tool_dir: str) -> Callable[..., Any]:
+    """The tool function `handler.py` imports from `tools`."""
+    with open(os.path.join(tool_dir, "handler.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    names = [a.name for node in ast.walk(tree) if isinstance(node, ast.ImportFrom) and node.module == "tools"
+             for a in node.names]
+    if not names:
+        sys.exit(f"{tool_dir}/handler.py does not import from tools")
+    import tools  # noqa: E402  (the tool directory is first on sys.path)
+
+    return getattr(tools, names[0])
+
+
+def _violations(value: Any, schema: Dict[str, Any], path: str = "$") -> List[str]:
+    """Minimal JSON schema check: type, required, enum, properties, items, anyOf."""
+    if "anyOf" in schema:
+        return [] if any(not _violations(value, s, path) for s in schema["anyOf"]) else [f"{path}: no anyOf match"]
+    types = schema.get("type")
+    checks = {"object": dict, "array": list, "string": str, "boolean": bool, "null": type(None)}
+    if types is not None:
+        allowed = types if isinstance(types, list) else [types]
+        ok = any(
+            isinstance(value, (int, float)) and not isinstance(value, bool) if t == "number"
+            else isinstance(value, int) and not isinstance(value, bool) if t == "integer"
+            else isinstance(value, checks[t])
+            for t in allowed
+        )
+        if not ok:
+            return [f"{path}: expected {types}"]
+    if "enum" in schema and value not in schema["enum"]:
+        return [f"{path}: {value!r} not in enum"]
+    out: List[str] = []
+    if isinstance(value, dict):
+        out += [f"{path}.{k}: missing" for k in schema.get("required", []) if k not in value]
+        for k, sub in schema.get("properties", {}).items():
+            if k in value:
+                out += _violations(value[k], sub, f"{path}.{k}")
+    if isinstance(value, list) and "items" in schema:
+        for i, item in enumerate(value):
+            out += _violations(item, schema["items"], f"{path}[{i}]")
+    return out
+
+
+def _classify(text: str) -> Dict[str, Any]:
+    try:
+        return {"parsed": json.loads(text), "handler_failure": False, "repaired": False}
+    except ValueError:
+        pass
+    m = re.search(r"(\{[\s\S]*\}|\[[\s\S]*\])", text)
+    try:
+        return {"parsed": json.loads(m.group(1)) if m else None, "handler_failure": True, "repaired": bool(m)}
+    except ValueError:
+        return {"parsed": None, "handler_failure": True, "repaired": False}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tool", required=True, help="tool directory name under tools/, e.g. resume_skills_scorer")
+    parser.add_argument("--event", required=True, help="handler event JSON file (the tool's kwargs)")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--retries", type=int, default=int(os.getenv("TOOL_RETRIES", "1")))
+    args = parser.parse_args()
+
+    tool_dir = os.path.join(ROOT, "tools", args.tool)
+    os.environ["RESULT_CACHE_BACKEND"] = "none"
+    sys.path.insert(0, tool_dir)
+    import bedrock_runtime  # noqa: E402
+    from agentcore_gateway_setup import OUTPUT_SCHEMA  # noqa: E402
+
+    fn = _tool_function(tool_dir)
+    with open(args.event, encoding="utf-8") as f:
+        event = json.load(f)
+
+    print(f"tool: {args.tool}  runs per mode: {args.runs}  agent retries: {args.retries}")
+    print(f"{'mode':<12} {'handler fail':>13} {'repaired':>9} {'schema viol':>12} {'retries':>8} {'p50 s':>7} {'max s':>7}")
+    for mode, structured in (("text", False), ("tool_use", True)):
+        bedrock_runtime.STRUCTURED_OUTPUT_ENABLED = structured
+        failures = repaired = violations = retries = 0
+        latencies: List[float] = []
+        for _ in range(args.runs):
+            for attempt in range(args.retries + 1):
+                t0 = time.perf_counter()
+                result = fn(**event)
+                latencies.append(time.perf_counter() - t0)
+                text = result if isinstance(result, str) else json.dumps(result)
+                outcome = _classify(text)
+                if attempt == 0:
+                    failures += outcome["handler_failure"]
+                    repaired += outcome["repaired"]
+                    if outcome["parsed"] is not None and _violations(outcome["parsed"], OUTPUT_SCHEMA):
+                        violations += 1
+                if not outcome["handler_failure"]:
+                    break
+                if attempt < args.retries:
+                    retries += 1
+        n = args.runs
+        print(f"{mode:<12} {failures / n:>13.1%} {repaired / n:>9.1%} {violations / n:>12.1%} {retries:>8} "
+              f"{statistics.median(latencies):>7.2f} {max(latencies):>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Single-core throughput of the resume employment-timeline parser (`timeline.py`).
+
+`resume_pi_extractor` and `resume_desired_experience_scorer` build the timeline on every
+call before deciding whether the model is needed, so it has to stay far below a
+model round trip. Synthetic resumes with the given number of roles (mixed date formats,
+overlaps, an internship and an education block) are parsed repeatedly in one process,
+after a regression check that open-ended ("Present") roles run to the current month.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools", "resume_pi_extractor"))
+
+from timeline import build_timeline  # noqa: E402
+
+_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def _resume(roles: int, rng: random.Random) -> str:
+    lines = ["Jane Doe", "jane@example.com | +1 415 555 0100", "SUMMARY",
+             "Backend engineer building distributed systems.", "WORK EXPERIENCE"]
+    year = 2024
+    for i in range(roles):
+        start = year - rng.randint(1, 3)
+        fmt = i % 3
+        if fmt == 0:
+            dates = f"{rng.choice(_MONTHS)} {start} - {'Present' if i == 0 else rng.choice(_MONTHS) + ' ' + str(year)}"
+        elif fmt == 1:
+            dates = f"{rng.randint(1, 12):02d}/{start} – {rng.randint(1, 12):02d}/{year}"
+        else:
+            dates = f"{start} - {year}"
+        lines += [f"Senior Engineer, Company {i} Inc", dates]
+        lines += [f"- Built service {j} in Python and Go handling {rng.randint(1, 9)}M requests/day" for j in range(4)]
+        year = start + rng.randint(0, 1)
+    lines += ["Software Intern, Startup LLC, Jun 2012 - Aug 2012", "EDUCATION", "BSc Computer Science, 2008 - 2012",
+              "SKILLS", "Python, Go, Kafka, PostgreSQL, AWS"]
+    return "\n".join(lines)
+
+
+def _check_open_ends() -> None:
+    today = date(2026, 10, 1)
+    lone = build_timeline("WORK EXPERIENCE\nSenior Engineer, Acme\nJan 2015 - Present", today)
+    assert lone["total_months"] == 142 and lone["years"] == 11, lone["total_months"]
+    both = build_timeline("WORK EXPERIENCE\nSenior Engineer, Acme Jan 2015 - Present\n"
+                          "Engineer, Initech Mar 2010 - Dec 2014", today)
+    assert both["total_months"] == 200 and both["years"] == 16, both["total_months"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=5000, help="resumes parsed per size")
+    parser.add_argument("--roles", default="3,6,12", help="roles per synthetic resume")
+    args = parser.parse_args()
+    _check_open_ends()
+
+    rng = random.Random(7)
+    print(f"{'roles':>6} {'lines':>6} {'resumes/s':>10} {'p50 us':>8} {'p99 us':>8}")
+    for roles in (int(r) for r in args.roles.split(",") if r.strip()):
+        corpus = [_resume(roles, rng) for _ in range(200)]
+        samples: List[float] = []
+        t0 = time.perf_counter()
+        for i in range(args.n):
+            t1 = time.perf_counter()
+            build_timeline(corpus[i % len(corpus)])
+            samples.append((time.perf_counter() - t1) * 1e6)
+        elapsed = time.perf_counter() - t0
+        samples.sort()
+        lines = statistics.mean(c.count("\n") + 1 for c in corpus)
+        print(f"{roles:>6} {lines:>6.0f} {args.n / elapsed:>10.0f} {samples[len(samples) // 2]:>8.0f} "
+              f"{samples[int(len(samples) * 0.99) - 1]:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
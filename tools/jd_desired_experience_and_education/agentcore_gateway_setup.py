@@ -1,6 +1,34 @@
 from typing import Any, Dict
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+_EXPERIENCE: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "experience": {"type": "string"},
+        "source_section": {"type": "string"},
+    },
+    "required": ["experience", "source_section"],
+}
+_EDUCATION: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "education": {"type": "string"},
+        "source_section": {"type": "string"},
+    },
+    "required": ["education", "source_section"],
+}
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "desired_experience": {"type": "array", "items": _EXPERIENCE},
+        "education_preference": {"type": "array", "items": _EDUCATION},
+    },
+    "required": ["desired_experience", "education_preference"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -34,6 +62,7 @@ def create_or_update_gateway_target(
                                 },
                                 "required": ["title"],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                     ]
                 },
@@ -0,0 +1,264 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from logging_config import get_logger
+
+
+_logger = get_logger(__name__)
+
+# Backends: "memory" (in-process LRU only), "dynamodb" (shared), "sqlite" / "file" (local
+# stand-ins for offline runs), "none" (disabled).
+RESULT_CACHE_BACKEND = os.getenv("RESULT_CACHE_BACKEND", "memory").lower()
+RESULT_CACHE_TTL_SECONDS = int(os.getenv("RESULT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "256"))
+RESULT_CACHE_TABLE = os.getenv("RESULT_CACHE_TABLE", "tool_result_cache")
+RESULT_CACHE_PATH = os.getenv("RESULT_CACHE_PATH", "/tmp/tool_result_cache")
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize inputs so formatting-only differences map to the same key."""
+    if isinstance(value, str):
+        text = unicodedata.normalize("NFC", value).replace("\r\n", "\n").replace("\r", "\n")
+        return "\n".join(line.rstrip() for line in text.strip().split("\n"))
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_key(tool_name: str, prompt: str, model_id: str, inputs: Dict[str, Any]) -> str:
+    """Content address of a tool call.
+
+    The prompt hash is part of the key, so editing a prompt in constants.py invalidates
+    every entry produced by the old prompt; stale entries simply age out via TTL.
+    """
+    input_hash = _sha256(json.dumps(_normalize(inputs), sort_keys=True, ensure_ascii=False))
+    return _sha256("\x1f".join([tool_name, _sha256(prompt), model_id, input_hash]))
+
+
+class _MemoryTier:
+    """In-process LRU with TTL and cost-weighted (GreedyDual-Size) eviction.
+
+    Each entry gets priority `clock + cost / size`; the lowest priority is evicted and the
+    clock advances to it. Expensive-to-recompute results outlive cheap ones of the same
+    size, while entries that are not re-read still age out.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max = max_entries
+        self._entries: Dict[str, Tuple[str, float, float, float]] = {}  # key -> (value, expires_at, cost, priority)
+        self._clock = 0.0
+        self._lock = threading.Lock()
+
+    def _priority(self, value: str, cost: float) -> float:
+        return self._clock + cost / max(len(value), 1)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, cost, _ = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries[key] = (value, expires_at, cost, self._priority(value, cost))
+            return value
+
+    def put(self, key: str, value: str, expires_at: float, cost: float) -> None:
+        if self._max <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, expires_at, cost, self._priority(value, cost))
+            while len(self._entries) > self._max:
+                victim = min(self._entries, key=lambda k: self._entries[k][3])
+                self._clock = self._entries.pop(victim)[3]
+
+
+class _NullBackend:
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        return None
+
+    def put(self, key: str, value: str, expires_at: float, cost: float) -> None:
+        return None
+
+
+class _DynamoDBBackend:
+    """Shared store; `expires_at` doubles as the table's DynamoDB TTL attribute."""
+
+    def __init__(self, table_name: str) -> None:
+        import boto3
+
+        region = os.getenv("AWS_REGION", "us-east-1")
+        self._table = boto3.resource("dynamodb", region_name=region).Table(table_name)
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        item = self._table.get_item(Key={"cache_key": key}).get("Item")
+        if not item:
+            return None
+        return str(item["result"]), float(item["expires_at"])
+
+    def put(self, key: str, value: str, expires_at: float, cost: float) -> None:
+        self._table.put_item(
+            Item={"cache_key": key, "result": value, "expires_at": int(expires_at), "cost_ms": int(cost)}
+        )
+
+
+class _SQLiteBackend:
+    def __init__(self, path: str) -> None:
+        db_path = path if path.endswith(".db") else os.path.join(path, "results.db")
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results (cache_key TEXT PRIMARY KEY, result TEXT, expires_at REAL, cost_ms REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, expires_at FROM results WHERE cache_key = ?", (key,)
+            ).fetchone()
+        return (row[0], float(row[1])) if row else None
+
+    def put(self, key: str, value: str, expires_at: float, cost: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (cache_key, result, expires_at, cost_ms) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, cost),
+            )
+            self._conn.commit()
+
+
+class _FileBackend:
+    def __init__(self, root: str) -> None:
+        self._root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._root, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        return entry["result"], float(entry["expires_at"])
+
+    def put(self, key: str, value: str, expires_at: float, cost: float) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"result": value, "expires_at": expires_at, "cost_ms": cost}, fh)
+        os.replace(tmp, path)
+
+
+def _make_backend(name: str) -> Any:
+    if name == "dynamodb":
+        return _DynamoDBBackend(RESULT_CACHE_TABLE)
+    if name == "sqlite":
+        return _SQLiteBackend(RESULT_CACHE_PATH)
+    if name == "file":
+        return _FileBackend(RESULT_CACHE_PATH)
+    return _NullBackend()
+
+
+class ResultCache:
+    """Two-tier cache: in-process LRU in front of a pluggable persistent backend."""
+
+    def __init__(self, backend: Any, ttl_seconds: int, max_entries: int, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._backend = backend
+        self._ttl = ttl_seconds
+        self._memory = _MemoryTier(max_entries)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._memory.get(key)
+        if value is not None:
+            return value
+        try:
+            entry = self._backend.get(key)
+        except Exception as e:
+            _logger.warning("Result cache backend get failed error=%s", e)
+            return None
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            return None
+        self._memory.put(key, value, expires_at, cost=0.0)
+        return value
+
+    def put(self, key: str, value: str, cost: float) -> None:
+        expires_at = time.time() + self._ttl
+        self._memory.put(key, value, expires_at, cost)
+        try:
+            self._backend.put(key, value, expires_at, cost)
+        except Exception as e:
+            _logger.warning("Result cache backend put failed error=%s", e)
+
+    def get_or_compute(
+        self,
+        tool_name: str,
+        prompt: str,
+        model_id: str,
+        inputs: Dict[str, Any],
+        compute: Callable[[], str],
+    ) -> str:
+        if not self.enabled:
+            return compute()
+        key = make_key(tool_name, prompt, model_id, inputs)
+        cached = self.get(key)
+        if cached is not None:
+            _logger.info("Result cache hit tool=%s key=%s", tool_name, key[:12])
+            return cached
+        t0 = time.perf_counter()
+        value = compute()
+        cost_ms = (time.perf_counter() - t0) * 1000
+        # Only well-formed JSON is worth replaying; a bad response should be retried
+        try:
+            json.loads(value)
+        except (TypeError, ValueError):
+            return value
+        self.put(key, value, cost_ms)
+        _logger.info("Result cache miss tool=%s key=%s cost_ms=%.0f", tool_name, key[:12], cost_ms)
+        return value
+
+
+_cache: Optional[ResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                enabled = RESULT_CACHE_BACKEND != "none"
+                backend = _make_backend(RESULT_CACHE_BACKEND) if enabled else _NullBackend()
+                _cache = ResultCache(backend, RESULT_CACHE_TTL_SECONDS, RESULT_CACHE_MAX_ENTRIES, enabled=enabled)
+    return _cache
+
+
+def cached_call(
+    tool_name: str,
+    prompt: str,
+    model_id: str,
+    inputs: Dict[str, Any],
+    compute: Callable[[], str],
+) -> str:
+    """Return a cached result for this tool call or compute and store it."""
+    return get_result_cache().get_or_compute(tool_name, prompt, model_id, inputs, compute)
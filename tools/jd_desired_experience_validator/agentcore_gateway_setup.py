@@ -1,6 +1,25 @@
 from typing import Any, Dict
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+_EXPERIENCE: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "experience": {"type": "string"},
+        "source_section": {"type": "string"},
+    },
+    "required": ["experience", "source_section"],
+}
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "desired_experience": {"type": "array", "items": _EXPERIENCE},
+    },
+    "required": ["desired_experience"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -52,6 +71,7 @@ def create_or_update_gateway_target(
                                 },
                                 "required": ["desired_experience"],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                     ]
                 },
@@ -0,0 +1,186 @@
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import boto3
+from botocore.config import Config
+
+from json_stream import JsonElementStream
+from logging_config import get_logger
+from prompt_cache import log_usage
+
+
+_logger = get_logger(__name__)
+
+ANTHROPIC_VERSION = "bedrock-2023-05-31"
+BEDROCK_REGION = os.getenv("BEDROCK_REGION", os.getenv("AWS_REGION", "us-east-1"))
+DEFAULT_MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20240620-v1:0")
+STREAMING_ENABLED: bool = os.getenv("BEDROCK_STREAMING", "false").lower() in ("1", "true", "yes")
+# Forced tool use: a call with an `output_schema` offers the model a single tool whose input_schema
+# is that schema and requires it, so the result arrives as structured tool input, not free text
+# that may carry prose around the JSON.
+STRUCTURED_OUTPUT_ENABLED: bool = os.getenv("STRUCTURED_OUTPUT", "true").lower() in ("1", "true", "yes")
+RESULT_TOOL_NAME = "return_result"
+
+# One client per Lambda execution environment: created during init and reused by warm
+# invocations so connection setup (and TLS) is paid once, not per tool call.
+_client_config = Config(
+    region_name=BEDROCK_REGION,
+    retries={"mode": "adaptive", "max_attempts": int(os.getenv("BEDROCK_MAX_ATTEMPTS", "4"))},
+    connect_timeout=float(os.getenv("BEDROCK_CONNECT_TIMEOUT", "5")),
+    read_timeout=float(os.getenv("BEDROCK_READ_TIMEOUT", "60")),
+    max_pool_connections=int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS", "10")),
+    tcp_keepalive=True,
+)
+_client = boto3.client("bedrock-runtime", config=_client_config)
+
+
+def get_client() -> Any:
+    return _client
+
+
+def resolve_model_id(override_env: Optional[str] = None) -> str:
+    """Model id from a per-tool override env var, falling back to BEDROCK_MODEL_ID."""
+    if override_env:
+        return os.getenv(override_env) or DEFAULT_MODEL_ID
+    return DEFAULT_MODEL_ID
+
+
+def extract_text(payload: Dict[str, Any]) -> str:
+    """Join the text blocks of an Anthropic Messages response (top-level or under `output`).
+
+    A forced result tool call is returned as the JSON text of its input.
+    """
+    output_obj = payload.get("output")
+    contents = output_obj.get("content") if isinstance(output_obj, dict) else payload.get("content")
+    if not isinstance(contents, list):
+        return ""
+    for c in contents:
+        if isinstance(c, dict) and c.get("type") == "tool_use" and c.get("name") == RESULT_TOOL_NAME:
+            return json.dumps(c.get("input"))
+    return "".join(
+        c.get("text", "") for c in contents if isinstance(c, dict) and c.get("type") == "text"
+    ).strip()
+
+
+def _request_body(
+    content: List[Dict[str, Any]], max_tokens: int, output_schema: Optional[Dict[str, Any]] = None
+) -> str:
+    body: Dict[str, Any] = {
+        "anthropic_version": ANTHROPIC_VERSION,
+        "max_tokens": max_tokens,
+        "temperature": 0,
+        "messages": [{"role": "user", "content": content}],
+    }
+    if output_schema is not None and STRUCTURED_OUTPUT_ENABLED:
+        body["tools"] = [{
+            "name": RESULT_TOOL_NAME,
+            "description": "Return the complete result. Call exactly once, with the whole JSON output as input.",
+            "input_schema": output_schema,
+        }]
+        body["tool_choice"] = {"type": "tool", "name": RESULT_TOOL_NAME}
+    return json.dumps(body)
+
+
+def invoke_messages(
+    content: List[Dict[str, Any]],
+    label: str,
+    model_id: Optional[str] = None,
+    max_tokens: int = 40000,
+    on_element: Optional[Callable[[Optional[str], Any], None]] = None,
+    output_schema: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Send one user message to Bedrock and return the response text.
+
+    Streams (see `invoke_messages_stream`) when BEDROCK_STREAMING is set or the caller
+    wants completed elements via `on_element`. With `output_schema` (and STRUCTURED_OUTPUT
+    on) the model must answer through the result tool and the text is its JSON input.
+    """
+    if STREAMING_ENABLED or on_element is not None:
+        return invoke_messages_stream(
+            content, label, model_id=model_id, max_tokens=max_tokens, on_element=on_element, output_schema=output_schema
+        )
+    resp = _client.invoke_model(
+        modelId=model_id or DEFAULT_MODEL_ID,
+        accept="application/json",
+        contentType="application/json",
+        body=_request_body(content, max_tokens, output_schema),
+    )
+    raw = resp["body"].read()
+    if not raw:
+        raise RuntimeError("Empty response body from Bedrock")
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError:
+        _logger.error("%s failed to parse Bedrock response: %s", label, raw[:500])
+        raise
+    log_usage(_logger, label, payload)
+    return extract_text(payload)
+
+
+def invoke_messages_stream(
+    content: List[Dict[str, Any]],
+    label: str,
+    model_id: Optional[str] = None,
+    max_tokens: int = 40000,
+    on_element: Optional[Callable[[Optional[str], Any], None]] = None,
+    output_schema: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Streaming variant of `invoke_messages`.
+
+    Output text is parsed incrementally and every array element that closes (one
+    skill, experience, responsibility, ...) is passed to `on_element(key, element)`
+    before the rest of the response has been generated. Logs time to first element
+    next to total latency. Returns the full response text.
+    """
+    t0 = time.perf_counter()
+    resp = _client.invoke_model_with_response_stream(
+        modelId=model_id or DEFAULT_MODEL_ID,
+        accept="application/json",
+        contentType="application/json",
+        body=_request_body(content, max_tokens, output_schema),
+    )
+    parser = JsonElementStream()
+    parts: List[str] = []
+    usage: Dict[str, Any] = {}
+    first_element_ms: Optional[float] = None
+    elements = 0
+    for event in resp["body"]:
+        chunk = event.get("chunk")
+        if not chunk:
+            errors = [k for k in event if k.endswith("Exception")]
+            if errors:
+                raise RuntimeError(f"{label} Bedrock stream error {errors[0]}: {event[errors[0]]}")
+            continue
+        data = json.loads(chunk["bytes"])
+        etype = data.get("type")
+        if etype == "message_start":
+            usage.update((data.get("message") or {}).get("usage") or {})
+        elif etype == "message_delta":
+            usage.update(data.get("usage") or {})
+        elif etype == "content_block_delta":
+            delta = data.get("delta") or {}
+            # The result tool's input streams as partial JSON, parsed the same way as text
+            if delta.get("type") == "text_delta":
+                text = delta.get("text", "")
+            elif delta.get("type") == "input_json_delta":
+                text = delta.get("partial_json", "")
+            else:
+                continue
+            parts.append(text)
+            for key, element in parser.feed(text):
+                elements += 1
+                if first_element_ms is None:
+                    first_element_ms = (time.perf_counter() - t0) * 1000
+                if on_element is not None:
+                    on_element(key, element)
+    log_usage(_logger, label, {"usage": usage})
+    _logger.info(
+        "%s stream elements=%d first_element_ms=%s total_ms=%.0f",
+        label,
+        elements,
+        f"{first_element_ms:.0f}" if first_element_ms is not None else "n/a",
+        (time.perf_counter() - t0) * 1000,
+    )
+    return "".join(parts).strip()
@@ -1,6 +1,27 @@
 from typing import Any, Dict
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "responsibilities": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "text": {"type": "string"},
+                    "source_section": {"type": "string"},
+                },
+                "required": ["text", "source_section"],
+            },
+        },
+    },
+    "required": ["responsibilities"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -10,7 +31,7 @@ def create_or_update_gateway_target(
     """Register the jd_responsibility_extractor Lambda as an MCP tool.
 
     Tool name: jd_responsibility_extractor
-    Input schema: { title: str, years_of_experience: str, seniority_level: str, job_page: str, must_have_skills?: [str] }
+    Input schema: { title: str, years_of_experience: str, seniority_level: str, job_page: str, must_have_skills?: [str], partial_results_key?: str }
     """
     lambda_target_config = {
         "mcp": {
@@ -33,6 +54,7 @@ def create_or_update_gateway_target(
                                         "type": "array",
                                         "items": {"type": "string"},
                                     },
+                                    "partial_results_key": {"type": "string"},
                                 },
                                 "required": [
                                     "title",
@@ -41,6 +63,7 @@ def create_or_update_gateway_target(
                                     "jd",
                                 ],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                     ]
                 },
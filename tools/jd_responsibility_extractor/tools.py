@@ -1,12 +1,15 @@
 from typing import Any, Optional, List
-import json
-import os
 
-import boto3
 from strands import tool
 
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from bedrock_runtime import DEFAULT_MODEL_ID, invoke_messages
+from compact_io import input_text
 from constants import RESPONSIBILITY_PROMPT
 from logging_config import get_logger
+from partial_results import partial_sink
+from prompt_cache import text_block
+from result_cache import cached_call
 
 _logger = get_logger(__name__)
 
@@ -18,11 +21,8 @@ def responsibility_extractor_tool(
     seniority_level: str,
     job_page: str,
     must_have_skills: Optional[List[str]] = None,
+    partial_results_key: Optional[str] = None,
 ) -> str:
-    region = os.getenv("BEDROCK_REGION", os.getenv("AWS_REGION", "us-east-1"))
-    model_id = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20240620-v1:0")
-    client = boto3.client("bedrock-runtime", region_name=region)
-
     user_payload = {
         "title": title,
         "years_of_experience": years_of_experience,
@@ -30,37 +30,18 @@ def responsibility_extractor_tool(
         "job_page": job_page,
         "must_have_skills": must_have_skills or [],
     }
-
-    body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 40000,
-        "temperature": 0,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": RESPONSIBILITY_PROMPT.strip()},
-                    {"type": "text", "text": f"Inputs as JSON:\n{json.dumps(user_payload)}"},
-                ],
-            }
-        ],
-    }
-    response = client.invoke_model(
-        modelId=model_id,
-        accept="application/json",
-        contentType="application/json",
-        body=json.dumps(body),
+    content = [
+        text_block(RESPONSIBILITY_PROMPT.strip(), cache=True),
+        text_block(input_text("Inputs as", user_payload)),
+    ]
+    text = cached_call(
+        "jd_responsibility_extractor",
+        RESPONSIBILITY_PROMPT,
+        DEFAULT_MODEL_ID,
+        user_payload,
+        lambda: invoke_messages(
+            content, label="Responsibilities", on_element=partial_sink(partial_results_key), output_schema=OUTPUT_SCHEMA
+        ),
     )
-    payload = json.loads(response["body"].read())
-    contents = []
-    output_obj = payload.get("output")
-    if isinstance(output_obj, dict):
-        contents = output_obj.get("content", []) or []
-    elif isinstance(payload.get("content"), list):
-        contents = payload.get("content", [])
-    text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict) and c.get("type") == "text"]
-    text = "".join(text_chunks).strip()
     _logger.info("Responsibilities output", extra={"len": len(text)})
     return text
-
-
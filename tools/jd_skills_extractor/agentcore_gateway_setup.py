@@ -3,6 +3,47 @@ import os
 import json
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+_SKILL: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "skill": {"type": "string"},
+        "required": {"type": "boolean"},
+        "context": {"type": "string"},
+    },
+    "required": ["skill", "required", "context"],
+}
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "categories": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "verticals": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "skills": {"type": "array", "items": _SKILL},
+                            },
+                            "required": ["name", "skills"],
+                        },
+                    },
+                },
+                "required": ["name", "verticals"],
+            },
+        },
+        "skills_unclassified": {"type": "array", "items": _SKILL},
+    },
+    "required": ["categories"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -39,6 +80,7 @@ def create_or_update_gateway_target(
                                 },
                                 "required": ["jd"],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                         # Add more tools here if this same Lambda handles them
                     ]
@@ -1,6 +1,41 @@
 from typing import Any, Dict
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "experiences": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "requirement": {"type": "string"},
+                    "score": {"type": "integer", "minimum": 0, "maximum": 10},
+                    "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+                    "justification": {"type": "string"},
+                    "resume_evidence": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "source": {"type": "string", "enum": ["matched", "partial", "keyword"]},
+                                "excerpt": {"type": "string"},
+                            },
+                            "required": ["source", "excerpt"],
+                        },
+                    },
+                    "notes": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["requirement", "score", "confidence", "justification", "resume_evidence", "notes"],
+            },
+        },
+    },
+    "required": ["experiences"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -26,9 +61,11 @@ def create_or_update_gateway_target(
                                         "type": "array",
                                         "items": {"type": "string"},
                                     },
+                                    "partial_results_key": {"type": "string"},
                                 },
                                 "required": ["resume_text", "desired_experience"],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                     ]
                 },
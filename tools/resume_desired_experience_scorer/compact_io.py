@@ -0,0 +1,110 @@
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+from json_repair import extract_json
+
+
+# Compact wire mode. Inputs: multi-line strings (resume/JD text) leave the JSON payload and
+# follow it as raw <name>...</name> blocks, so newlines, quotes and non-ASCII characters are
+# not escaped. Outputs: the model writes the tool's schema with short keys (see OutputCodec)
+# and the codec expands them back before the result leaves tools.py.
+COMPACT_INPUT_ENABLED: bool = os.getenv("COMPACT_INPUT", "true").lower() in ("1", "true", "yes")
+COMPACT_OUTPUT_ENABLED: bool = os.getenv("COMPACT_OUTPUT", "true").lower() in ("1", "true", "yes")
+
+RAW_BLOCKS_NOTE = "Each <name>...</name> block above is the raw text value of input field `name`."
+
+
+def input_text(label: str, payload: Dict[str, Any]) -> str:
+    """Prompt text for one input payload: "<label> JSON:" plus the payload, with multi-line
+    string fields moved into raw blocks when compact input is enabled."""
+    if not COMPACT_INPUT_ENABLED:
+        return f"{label} JSON:\n{json.dumps(payload)}"
+    fields = {k: v for k, v in payload.items() if not (isinstance(v, str) and "\n" in v)}
+    raw = {k: v for k, v in payload.items() if k not in fields}
+    parts = [f"{label} JSON:\n{json.dumps(fields, ensure_ascii=False)}" if fields else f"{label}:"]
+    for key, value in raw.items():
+        parts.append(f"<{key}>\n{value.replace(f'</{key}>', f'</ {key}>')}\n</{key}>")
+    if raw:
+        parts.append(RAW_BLOCKS_NOTE)
+    return "\n".join(parts)
+
+
+class OutputCodec:
+    """Short-key output schema for one tool: `keys` maps schema key -> short key.
+
+    Keys in `omit` are left out by the model and filled in by the tool afterwards.
+    """
+
+    def __init__(self, keys: Dict[str, str], omit: tuple = ()) -> None:
+        self.keys = keys
+        self.omit = omit
+        self._long = {short: key for key, short in keys.items()}
+        if len(self._long) != len(keys):
+            raise ValueError("short keys must be unique")
+
+    def note(self) -> str:
+        mapping = ", ".join(f'"{key}"→"{short}"' for key, short in self.keys.items())
+        text = (
+            "COMPACT OUTPUT: return the same JSON structure and values, but write every key in its short form: "
+            f"{mapping}. Use minified JSON (no indentation or spaces between tokens)."
+        )
+        if self.omit:
+            text += " Leave out " + ", ".join(f'"{k}"' for k in self.omit) + "; it is filled in from the input."
+        return text
+
+    def schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON schema of the compact output: properties renamed to short keys, `omit` removed."""
+        out: Dict[str, Any] = {}
+        for key, value in schema.items():
+            if key == "properties" and isinstance(value, dict):
+                out[key] = {self.keys.get(k, k): self.schema(v) for k, v in value.items() if k not in self.omit}
+            elif key == "required" and isinstance(value, list):
+                out[key] = [self.keys.get(k, k) for k in value if k not in self.omit]
+            elif isinstance(value, dict):
+                out[key] = self.schema(value)
+            elif isinstance(value, list):
+                out[key] = [self.schema(v) if isinstance(v, dict) else v for v in value]
+            else:
+                out[key] = value
+        return out
+
+    def expand(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {self._long.get(k, k): self.expand(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.expand(v) for v in value]
+        return value
+
+    def expand_text(self, text: str, on_item: Optional[Callable[[Dict[str, Any]], None]] = None) -> str:
+        """Full-schema JSON text for a compact model response; unparseable text is returned as is.
+
+        `on_item` is called on every expanded object in the top-level lists (to fill omitted keys).
+        """
+        try:
+            obj = self.expand(extract_json(text))
+        except ValueError:
+            return text
+        if on_item is not None and isinstance(obj, dict):
+            for value in obj.values():
+                for item in value if isinstance(value, list) else ():
+                    if isinstance(item, dict):
+                        on_item(item)
+        return json.dumps(obj)
+
+    def wrap_sink(
+        self,
+        sink: Optional[Callable[[Optional[str], Any], None]],
+        on_item: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Optional[Callable[[Optional[str], Any], None]]:
+        """Partial-results sink that receives streamed compact elements in the full schema."""
+        if sink is None:
+            return None
+
+        def emit(key: Optional[str], element: Any) -> None:
+            element = self.expand(element)
+            if on_item is not None and isinstance(element, dict):
+                on_item(element)
+            sink(self._long.get(key or "", key), element)
+
+        return emit
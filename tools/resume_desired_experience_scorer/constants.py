@@ -173,3 +173,30 @@ When uncertain between two match strengths, choose the lower to ensure determini
 """
 
 
+
+
+# Appended after the resume when timeline.py found "N years of X" requirements
+TENURE_FACTS_NOTE = """
+Tenure facts were computed from the resume's dated roles (overlapping roles counted once; internships,
+volunteering and education excluded). For "N years of X" requirements use these month counts instead of
+re-deriving dates, and quote the listed role lines as evidence only if they appear verbatim in resume_text.
+"""
+
+
+# Replaces the resume_text note when passage_index.py retrieved per-requirement evidence windows
+EVIDENCE_WINDOWS_NOTE = """
+resume_text is replaced by resume_evidence_windows: for each requirement, the resume passages most
+likely to hold its evidence (bullets or sentences, with their line number and the role or section
+line above them). Treat each window as the resume_text for its requirement: excerpts must be verbatim
+from a passage's text, and if no passage supports a requirement score it as "No evidence found in resume."
+"""
+
+
+# Appended when line_refs.py is enabled: evidence is cited by line id and rebuilt by the tool
+LINE_REFS_NOTE = """
+EVIDENCE BY LINE ID: resume_text is given as numbered lines "[12] ..." (long lines are split into
+sentences "[12.1] ... [12.2] ..."); evidence window passages carry their "line" number. In
+resume_evidence do not copy text: replace "excerpt" with "lines", the ids of the 1–2 lines or sentences
+holding the evidence, e.g. {"source": "matched", "lines": ["12", "14.2"]}. Cite only ids you were shown;
+the verbatim excerpt is rebuilt from them.
+"""
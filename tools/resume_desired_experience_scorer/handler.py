@@ -1,13 +1,17 @@
 from typing import Any, Dict, List
-import json
 
 from strands import Agent
 
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from json_repair import extract_json
 from logging_config import get_logger
+from result_check import ResultModel
 from tools import resume_desired_experience_scorer
 
 
 _logger = get_logger(__name__)
+# Typed view of the result returned through the gateway; violations are logged, numbers coerced
+RESULT_MODEL = ResultModel(OUTPUT_SCHEMA)
 
 
 def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
@@ -18,12 +22,17 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
 
     agent = Agent(tools=[resume_desired_experience_scorer])
     result = agent.tool.resume_desired_experience_scorer(
-        resume_text=resume_text, desired_experience=desired_experience
+        resume_text=resume_text,
+        desired_experience=desired_experience,
+        partial_results_key=(event or {}).get("partial_results_key"),
     )
     contents = result.get("content", [])
     text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict)]
     text = "".join(text_chunks).strip()
     _logger.info("ResumeDesiredExpScorer output text: %s", text)
-    return json.loads(text)
+    result, errors = RESULT_MODEL.validate(extract_json(text))
+    if errors:
+        _logger.warning("ResumeDesiredExpScorer result does not match OUTPUT_SCHEMA: %s", errors[:5])
+    return result
 
 
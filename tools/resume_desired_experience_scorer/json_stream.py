@@ -0,0 +1,98 @@
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class JsonElementStream:
+    """Incremental parser that emits array elements as soon as they close.
+
+    Feed model output text in arbitrary chunks. Every element of an array that is a
+    direct child of the top-level object (e.g. each item of `{"skills": [...]}`), or of a
+    top-level array, is returned from `feed` as `(key, element)` once its closing
+    bracket/quote arrives. Leading prose before the first `{`/`[` is ignored. The scan is
+    a single pass, and only the text of the currently open element is retained.
+    """
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._buf_start = 0  # absolute offset of self._buf[0]
+        self._pos = 0  # absolute offset of the next character to scan
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_key: Optional[str] = None
+        self._target_depth = -1  # stack depth of the array whose elements we emit
+        self._array_key: Optional[str] = None
+        self._elem_start = -1
+        self._started = False
+
+    def _text(self, start: int, end: int) -> str:
+        return self._buf[start - self._buf_start:end - self._buf_start]
+
+    def feed(self, chunk: str) -> List[Tuple[Optional[str], Any]]:
+        out: List[Tuple[Optional[str], Any]] = []
+        if not chunk:
+            return out
+        base = self._pos
+        self._buf += chunk
+        for offset, ch in enumerate(chunk):
+            i = base + offset
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1 and self._stack[0] == "{":
+                        self._last_key = json.loads(self._text(self._string_start, i + 1))
+                    elif self._elem_start == self._string_start and len(self._stack) == self._target_depth:
+                        out.append((self._array_key, json.loads(self._text(self._elem_start, i + 1))))
+                        self._elem_start = -1
+                continue
+            if not self._started:
+                if ch in "{[":
+                    self._started = True
+                else:
+                    continue
+            depth = len(self._stack)
+            if depth == self._target_depth and self._elem_start < 0 and ch not in " \t\r\n,]":
+                self._elem_start = i
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch in "{[":
+                self._stack.append(ch)
+                if ch == "[" and self._target_depth < 0 and (depth == 0 or (depth == 1 and self._stack[0] == "{")):
+                    self._target_depth = len(self._stack)
+                    self._array_key = self._last_key if depth == 1 else None
+            elif ch in "}]":
+                if depth == self._target_depth and ch == "]":
+                    # Scalar element terminated by the closing bracket
+                    self._flush_scalar(i, out)
+                    self._target_depth = -1
+                if self._stack:
+                    self._stack.pop()
+                if len(self._stack) == self._target_depth and self._elem_start >= 0:
+                    out.append((self._array_key, json.loads(self._text(self._elem_start, i + 1))))
+                    self._elem_start = -1
+            elif ch == "," and depth == self._target_depth:
+                self._flush_scalar(i, out)
+        self._pos = base + len(chunk)
+        # Drop text no open element or key can still reference
+        keep = self._pos
+        if self._elem_start >= 0:
+            keep = min(keep, self._elem_start)
+        if self._in_string:
+            keep = min(keep, self._string_start)
+        if keep > self._buf_start:
+            self._buf = self._buf[keep - self._buf_start:]
+            self._buf_start = keep
+        return out
+
+    def _flush_scalar(self, end: int, out: List[Tuple[Optional[str], Any]]) -> None:
+        if self._elem_start >= 0:
+            raw = self._text(self._elem_start, end).strip()
+            if raw:
+                out.append((self._array_key, json.loads(raw)))
+            self._elem_start = -1
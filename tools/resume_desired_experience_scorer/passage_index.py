@@ -0,0 +1,184 @@
+import math
+import os
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+# BM25 passage retrieval over a resume: bullets and sentences become passages (tagged with the
+# role/section line above them), each desired_experience requirement is a query, and the top-k
+# passages per requirement replace the full resume in the scorer input. Retrieval is judged
+# low-confidence when too few of a requirement's terms appear in its top passages; the caller
+# then falls back to the full resume.
+RETRIEVAL_ENABLED: bool = os.getenv("EXPERIENCE_RETRIEVAL", "true").lower() in ("1", "true", "yes")
+TOP_K = int(os.getenv("EXPERIENCE_RETRIEVAL_TOP_K", "4"))
+MIN_COVERAGE = float(os.getenv("EXPERIENCE_RETRIEVAL_MIN_COVERAGE", "0.5"))
+# Shorter resumes are sent whole: retrieval would save little and risk missing context
+MIN_RESUME_CHARS = int(os.getenv("EXPERIENCE_RETRIEVAL_MIN_RESUME_CHARS", "3000"))
+PASSAGE_CHARS = 300
+
+K1 = 1.5
+B = 0.75
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_BULLET = re.compile(r"^\s*(?:[•·▪◦●○■□►▸‣*+-]|\d{1,2}[.)])\s+")
+# Lines that look like a role/company/section heading: dated, separated ("Title, Company"), or all caps
+_HEADING = re.compile(r"(?:19|20)\d{2}|[,|@–—]|\bat\b|^[A-Z][A-Z &/]+:?$")
+_SENTENCE_END = re.compile(r"(?<=[.;!?])\s+(?=[A-Z0-9])")
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "into", "is", "it", "its",
+    "of", "on", "or", "our", "such", "that", "the", "their", "this", "to", "was", "were", "with", "within", "using",
+    "experience", "experienced", "years", "year", "yrs", "strong", "proven", "solid", "ability", "knowledge",
+    "understanding", "familiarity", "preferred", "plus", "etc", "e.g", "i.e", "including", "across", "work",
+    "working", "skills", "skill", "demonstrated", "hands-on", "good", "excellent", "least", "minimum",
+    "scale", "large", "various", "environment", "environments", "based", "related", "relevant", "similar",
+}
+_IRREGULAR = {"built": "build", "wrote": "writ", "ran": "run", "drove": "driv", "grew": "grow"}
+# One-hop equivalences RESUME_DESIRED_EXP_SCORER_PROMPT allows, as query expansions (stemmed form)
+_EXPANSIONS: Dict[str, List[str]] = {
+    "lead": ["led", "manag", "mentor", "architect", "own", "head", "supervis", "direct"],
+    "leadership": ["led", "lead", "manag", "mentor", "own", "head"],
+    "manag": ["led", "lead", "supervis", "head"],
+    "java": ["spring", "springboot"],
+    "javascript": ["react", "node.j", "typescript", "vue", "angular"],
+    "frontend": ["react", "ui", "vue", "angular"],
+    "sql": ["postgresql", "postgr", "mysql", "oracle"],
+    "databas": ["sql", "postgresql", "postgr", "mysql", "oracle", "dynamodb", "mongodb"],
+    "aws": ["lambda", "ec2", "s3", "dynamodb"],
+    "serverles": ["lambda", "fargate"],
+    "architectur": ["architect", "design"],
+    "cloud": ["aws", "azure", "gcp"],
+}
+
+
+def stem(token: str) -> str:
+    """Light suffix stripping so "managed", "managing" and "management" meet at "manag"."""
+    token = token.rstrip(".")
+    if token in _IRREGULAR:
+        return _IRREGULAR[token]
+    for suffix in ("ments", "ment", "ing", "ies", "ed", "es", "s"):
+        if len(token) > len(suffix) + 2 and token.endswith(suffix):
+            token = token[: -len(suffix)] + ("y" if suffix == "ies" else "")
+            break
+    # "manage"/"service" meet "managed"/"services"
+    return token[:-1] if len(token) > 4 and token.endswith("e") else token
+
+
+def tokenize(text: str) -> List[str]:
+    return [stem(t) for t in _TOKEN.findall(text.lower()) if t.rstrip(".") not in _STOPWORDS]
+
+
+def split_passages(resume_text: str) -> List[Dict[str, Any]]:
+    """Bullets and sentences with their 1-based line number and the nearest heading line above."""
+    passages: List[Dict[str, Any]] = []
+    context = ""
+    for line_no, raw in enumerate(resume_text.splitlines(), start=1):
+        line = raw.strip()
+        if not line:
+            continue
+        bullet = _BULLET.match(raw)
+        if not bullet and len(line) < 80 and _HEADING.search(line) and not line.endswith("."):
+            # Role, company or section line: kept as its own passage and as context for what follows
+            context = line
+            passages.append({"line": line_no, "text": line, "context": ""})
+            continue
+        body = line[bullet.end() - (len(raw) - len(raw.lstrip())):] if bullet else line
+        for sentence in _SENTENCE_END.split(body) if len(body) > PASSAGE_CHARS else [body]:
+            if sentence.strip():
+                passages.append({"line": line_no, "text": sentence.strip(), "context": context})
+    return passages
+
+
+def _covered(term: str, found: Set[str]) -> bool:
+    """Term, one of its expansions, or (for longer terms) a compound containing it ("microservic")."""
+    if term in found or any(e in found for e in _EXPANSIONS.get(term, [])):
+        return True
+    return len(term) >= 4 and any(term in f for f in found)
+
+
+class PassageIndex:
+    """Inverted index with BM25 scoring over the passages of one resume."""
+
+    def __init__(self, passages: List[Dict[str, Any]]) -> None:
+        self.passages = passages
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._lengths: List[int] = []
+        for pid, passage in enumerate(passages):
+            tokens = tokenize(f"{passage['context']} {passage['text']}")
+            self._lengths.append(len(tokens))
+            counts: Dict[str, int] = {}
+            for t in tokens:
+                counts[t] = counts.get(t, 0) + 1
+            for t, tf in counts.items():
+                self._postings.setdefault(t, []).append((pid, tf))
+        n = len(passages)
+        self._avg_len = (sum(self._lengths) / n) if n else 0.0
+        self._idf = {
+            t: math.log(1 + (n - len(p) + 0.5) / (len(p) + 0.5)) for t, p in self._postings.items()
+        }
+
+    @classmethod
+    def from_resume(cls, resume_text: str) -> "PassageIndex":
+        return cls(split_passages(resume_text))
+
+    def query_terms(self, query: str) -> Tuple[List[str], Dict[str, float]]:
+        """Distinct query terms, and weights for terms incl. half-weight expansions."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        weights = {t: 1.0 for t in terms}
+        for t in terms:
+            for e in _EXPANSIONS.get(t, []):
+                weights.setdefault(e, 0.5)
+        return terms, weights
+
+    def search(self, query: str, k: int = TOP_K) -> Tuple[List[Tuple[int, float]], float]:
+        """Top-k (passage id, score) and coverage: the share of query terms (or one of
+        their expansions) found in those passages."""
+        terms, weights = self.query_terms(query)
+        scores: Dict[int, float] = {}
+        for t, w in weights.items():
+            postings = self._postings.get(t)
+            if not postings:
+                continue
+            idf = self._idf[t] * w
+            for pid, tf in postings:
+                norm = tf + K1 * (1 - B + B * self._lengths[pid] / self._avg_len)
+                scores[pid] = scores.get(pid, 0.0) + idf * tf * (K1 + 1) / norm
+        top = sorted(scores.items(), key=lambda s: (-s[1], s[0]))[:k]
+        if not terms or not top:
+            return top, 0.0
+        found: Set[str] = set()
+        for pid, _ in top:
+            found.update(tokenize(f"{self.passages[pid]['context']} {self.passages[pid]['text']}"))
+        covered = sum(1 for t in terms if _covered(t, found))
+        return top, covered / len(terms)
+
+
+def evidence_windows(
+    resume_text: str, requirements: List[str], k: int = TOP_K
+) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, Any]]:
+    """Per-requirement passages, or None when the full resume should be sent; plus stats for logging."""
+    stats: Dict[str, Any] = {"resume_chars": len(resume_text), "min_coverage": None}
+    if len(resume_text) < MIN_RESUME_CHARS or not requirements:
+        stats["reason"] = "short_resume"
+        return None, stats
+    index = PassageIndex.from_resume(resume_text)
+    windows: List[Dict[str, Any]] = []
+    coverages: List[float] = []
+    for requirement in requirements:
+        top, coverage = index.search(requirement, k)
+        coverages.append(coverage)
+        # Resume order reads better than score order and keeps role context adjacent
+        passages = [index.passages[pid] for pid, _ in sorted(top)]
+        windows.append({
+            "requirement": requirement,
+            "passages": [
+                {"line": p["line"], "role": p["context"], "text": p["text"]} if p["context"]
+                else {"line": p["line"], "text": p["text"]}
+                for p in passages
+            ],
+        })
+    stats["min_coverage"] = round(min(coverages), 2)
+    if min(coverages) < MIN_COVERAGE:
+        stats["reason"] = "low_coverage"
+        return None, stats
+    stats["window_chars"] = sum(len(p["text"]) for w in windows for p in w["passages"])
+    return windows, stats
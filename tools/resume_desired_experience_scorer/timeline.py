@@ -0,0 +1,268 @@
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Deterministic employment timeline: date ranges are parsed line by line, each becomes a
+# role (titled by its line, or by the line above a bare date line), roles outside experience
+# sections (once the resume has section headings) or marked internship/volunteer/part-time are
+# excluded, and the remaining month intervals are merged so overlapping roles count once.
+# Year-only dates are taken as June; open ends ("Present") as the current month.
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_MONTH_NAME = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sept?|oct|nov|dec)[a-z]*\.?"
+_DATE = (
+    rf"{_MONTH_NAME}\s*,?\s*'?(?:(?:19|20)\d{{2}}|\d{{2}})(?!\d)"
+    r"|(?:0?[1-9]|1[0-2])\s*[/.]\s*(?:19|20)\d{2}(?!\d)"
+    r"|(?:19|20)\d{2}\s*[/.-]\s*(?:0?[1-9]|1[0-2])(?![\d/.-])"
+    r"|(?:19|20)\d{2}(?!\d)"
+)
+_OPEN_END = r"present|current|currently|now|today|date|ongoing"
+_YEAR = re.compile(r"(?:19|20)\d{2}")
+_OPEN_END_ONLY = re.compile(_OPEN_END)
+_MONTH_YEAR = re.compile(r"([a-z]+)\.?\s*,?\s*'?(\d{2,4})$")
+_NUMERIC_MONTH_YEAR = re.compile(r"(\d{1,2})\s*[/.]\s*(\d{4})$")
+_YEAR_NUMERIC_MONTH = re.compile(r"(\d{4})\s*[/.-]\s*(\d{1,2})$")
+_BULLET = re.compile(r"^\s*(?:[•·▪◦●○■□►▸‣*+-]|\d{1,2}[.)])\s")
+_RANGE = re.compile(
+    rf"(?<![\w/.])({_DATE})\s*(?:-|–|—|to|until|till|through)\s*({_DATE}|{_OPEN_END})\b",
+    re.IGNORECASE,
+)
+
+_SECTION = re.compile(
+    r"^\s*#*\s*(?P<name>(?:professional |work |relevant |employment |career )?(?:experience|employment(?: history)?|"
+    r"work history|career history)|education|academic background|certifications?|training|courses|projects|"
+    r"volunteer(?:ing)?(?: experience)?|skills|summary|profile|awards|publications|references)\s*:?\s*$",
+    re.IGNORECASE,
+)
+_EXCLUDED_SECTIONS = ("education", "academic", "certification", "training", "course", "volunteer", "reference")
+_EXPERIENCE_SECTION = re.compile(r"experience|employment|work history|career history")
+_EDUCATION_LINE = re.compile(
+    r"\b(?:university|college|school|institute of|bachelor|master|b\.?\s?sc|m\.?\s?sc|b\.?\s?tech|m\.?\s?tech|"
+    r"b\.?\s?e\b|m\.?\s?s\b|ph\.?\s?d|mba|degree|diploma|gpa|graduated)\b",
+    re.IGNORECASE,
+)
+_EXCLUSIONS = (
+    ("internship", re.compile(r"\b(?:intern|internship|trainee|apprentice(?:ship)?|co-?op)\b", re.IGNORECASE)),
+    ("volunteer", re.compile(r"\bvolunteer(?:ing|ed)?\b", re.IGNORECASE)),
+    ("part_time", re.compile(r"\bpart[\s-]?time\b", re.IGNORECASE)),
+)
+_EXPLICIT_CLAIM = re.compile(
+    r"(?<!\d)(\d{1,2})\s*(?:\+|plus)?\s*(?:(?:-|–|to)\s*(\d{1,2})\s*\+?\s*)?"
+    r"(?:years?|yrs?)['’]?\s*(?:of\s+)?(?:(?:professional|industry|total|overall|work|hands-on)\s+)*"
+    r"(?:(?:experience|exp\b)(?:\s+in\s+(?:the\s+)?industry\b)?|in\s+(?:the\s+)?industry)"
+    # Overall experience only: "3+ years of experience in React" is tenure in one skill
+    r"(?!\s*(?:in|with|of|using|on|for|building|developing|designing|working)\b)",
+    re.IGNORECASE,
+)
+_TENURE_REQUIREMENT = re.compile(
+    r"(\d{1,2})\s*(?:(?:-|–|to)\s*\d{1,2}\s*)?\+?\s*(?:years?|yrs?)['’]?\s*(?:of\s+)?(.*)",
+    re.IGNORECASE,
+)
+# Words that may surround a bare tenure clause ("At least 5+ years of experience")
+_BARE_FILLER = {"at", "least", "over", "more", "than", "min", "must", "have", "having", "has", "should", "require",
+                "required", "requires", "preferred", "plus", "years", "year"}
+_FILLER = {
+    "a", "an", "the", "of", "in", "with", "on", "for", "and", "using", "experience", "experienced", "professional",
+    "work", "working", "industry", "overall", "total", "hands-on", "proven", "relevant", "related", "practical",
+    "commercial", "solid", "strong", "demonstrated", "development", "programming", "building", "minimum", "least",
+}
+
+
+def _month_index(year: int, month: int) -> int:
+    return year * 12 + (month - 1)
+
+
+def parse_date(text: str, today: Optional[date] = None) -> Optional[int]:
+    """Month index (year * 12 + month - 1) for one date token; open ends map to `today`."""
+    s = text.strip().lower()
+    if _OPEN_END_ONLY.fullmatch(s):
+        t = today or date.today()
+        return _month_index(t.year, t.month)
+    m = _MONTH_YEAR.match(s)
+    if m:
+        month = _MONTHS.get(m.group(1)[:4] if m.group(1).startswith("sept") else m.group(1)[:3])
+        if not month:
+            return None
+        year = int(m.group(2))
+        if year < 100:
+            year += 2000 if year <= (today or date.today()).year % 100 else 1900
+        return _month_index(year, month)
+    m = _NUMERIC_MONTH_YEAR.match(s)
+    if m:
+        return _month_index(int(m.group(2)), int(m.group(1)))
+    m = _YEAR_NUMERIC_MONTH.match(s)
+    if m:
+        return _month_index(int(m.group(1)), int(m.group(2)))
+    if len(s) == 4 and s.isdigit():
+        return _month_index(int(s), 6)
+    return None
+
+
+def merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge inclusive [start, end] month intervals; touching months are joined."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def months_covered(intervals: List[Tuple[int, int]]) -> int:
+    return sum(end - start + 1 for start, end in merge_intervals(intervals))
+
+
+def _format_month(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def explicit_claim(resume_text: str) -> Optional[Dict[str, Any]]:
+    """First "X+ years of experience" style claim: X+ → X, X–Y → Y, about X → X."""
+    # Cheap substring filter first: the regex is slow on digit-heavy resumes
+    m = None
+    for line in resume_text.splitlines():
+        low = line.lower()
+        if ("year" in low or "yr" in low) and ("exp" in low or "industry" in low):
+            m = _EXPLICIT_CLAIM.search(line)
+            if m:
+                break
+    if not m:
+        return None
+    years = int(m.group(2) or m.group(1))
+    if not 0 < years <= 60:
+        return None
+    return {"years": years, "excerpt": m.group(0).strip()}
+
+
+def build_timeline(resume_text: str, today: Optional[date] = None) -> Dict[str, Any]:
+    """Roles with per-role tenure, plus merged total months over the counted roles.
+
+    Open-ended roles ("Present") run to the current month (`today` when given).
+    Once the resume has section headings, only roles under experience headings count.
+    """
+    lines = resume_text.splitlines()
+    section = ""
+    has_sections = False
+    roles: List[Dict[str, Any]] = []
+    prev_line = ""
+    current: Optional[Dict[str, Any]] = None
+    for line in lines:
+        header = _SECTION.match(line) if len(line) < 48 else None
+        if header:
+            section = header.group("name").lower()
+            has_sections = True
+            current = None
+            prev_line = ""
+            continue
+        m = _RANGE.search(line) if _YEAR.search(line) else None
+        if m:
+            start, end = parse_date(m.group(1), today), parse_date(m.group(2), today)
+            if start is not None and end is not None and start <= end:
+                # A bare date line takes its title from the line above
+                rest = (line[:m.start()] + line[m.end():]).strip(" \t|,;:()[]-–—")
+                title = line.strip()
+                if not rest and prev_line.strip():
+                    title = f"{prev_line.strip()} {title}"
+                    if current is not None and current["text"].endswith("\n" + prev_line.strip()):
+                        current["text"] = current["text"][: -len(prev_line.strip()) - 1]
+                excluded = None
+                if any(s in section for s in _EXCLUDED_SECTIONS) or _EDUCATION_LINE.search(title):
+                    excluded = "education" if "volunteer" not in section else "volunteer"
+                elif section and not _EXPERIENCE_SECTION.search(section):
+                    excluded = "other_section"  # projects, skills, summary, ...
+                else:
+                    excluded = next((name for name, rx in _EXCLUSIONS if rx.search(title)), None)
+                current = {
+                    "section": section,
+                    "line": line.strip(),
+                    "title": title,
+                    "start": start,
+                    "end": end,
+                    "months": end - start + 1,
+                    "excluded": excluded,
+                    "text": title,
+                }
+                roles.append(current)
+                prev_line = line
+                continue
+        if current is not None and line.strip():
+            current["text"] += "\n" + line.strip()
+        if line.strip():
+            prev_line = "" if _BULLET.match(line) else line
+    if has_sections:
+        # Dated lines above the first heading (contact block, summary) are not roles
+        for r in roles:
+            if not r["section"] and not r["excluded"]:
+                r["excluded"] = "other_section"
+    counted = [(r["start"], r["end"]) for r in roles if not r["excluded"]]
+    total = months_covered(counted)
+    return {
+        "roles": roles,
+        "total_months": total,
+        "years": total // 12,
+        "explicit_claim": explicit_claim(resume_text),
+    }
+
+
+def years_of_experience(timeline: Dict[str, Any]) -> Optional[int]:
+    """Explicit claim first, then the merged dated roles; None when neither exists."""
+    claim = timeline.get("explicit_claim")
+    if claim:
+        return claim["years"]
+    if any(not r["excluded"] for r in timeline["roles"]):
+        return timeline["years"]
+    return None
+
+
+def tenure_requirement(requirement: str) -> Optional[Dict[str, Any]]:
+    """{"years": N, "topic": str | None, "bare": bool} for an "N+ years (of X)" requirement.
+
+    topic None = total experience; `bare` when the requirement is nothing but that tenure clause
+    (not "Bachelor's degree with 5+ years of experience").
+    """
+    m = _TENURE_REQUIREMENT.search(requirement)
+    if not m:
+        return None
+    years = int(m.group(1))
+    if not 0 < years <= 40:
+        return None
+    words = [w for w in re.findall(r"[\w+#.-]+", m.group(2).lower()) if w.strip(".") not in _FILLER]
+    topic = " ".join(words).strip(" .") or None
+    before = [w for w in re.findall(r"[\w+#.'-]+", requirement[: m.start()].lower())
+              if w not in _FILLER and w not in _BARE_FILLER]
+    return {"years": years, "topic": topic, "bare": topic is None and not before}
+
+
+def topic_terms(topic: str) -> List[str]:
+    return [t.strip() for t in re.split(r",|/|\bor\b|\band\b|;", topic) if t.strip()]
+
+
+def topic_tenure(timeline: Dict[str, Any], topic: str) -> Dict[str, Any]:
+    """Merged months of counted roles whose text mentions any term of `topic`."""
+    terms = topic_terms(topic)
+    patterns = [re.compile(rf"(?<!\w){re.escape(t)}(?!\w)", re.IGNORECASE) for t in terms]
+    matched = [
+        r for r in timeline["roles"]
+        if not r["excluded"] and any(p.search(r["text"]) for p in patterns)
+    ]
+    months = months_covered([(r["start"], r["end"]) for r in matched])
+    return {"terms": terms, "months": months, "roles": [r["title"] for r in matched]}
+
+
+def summarize_roles(timeline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """JSON-friendly role list (no role text) for logs and prompts."""
+    return [
+        {
+            "role": r["title"],
+            "start": _format_month(r["start"]),
+            "end": _format_month(r["end"]),
+            "months": r["months"],
+            "excluded": r["excluded"],
+        }
+        for r in timeline["roles"]
+    ]
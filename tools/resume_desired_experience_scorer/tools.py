@@ -1,64 +1,264 @@
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import json
 import os
 
-import boto3
 from strands import tool
 
-from constants import RESUME_DESIRED_EXP_SCORER_PROMPT
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from bedrock_runtime import DEFAULT_MODEL_ID, invoke_messages
+from compact_io import COMPACT_OUTPUT_ENABLED, OutputCodec, input_text
+from constants import EVIDENCE_WINDOWS_NOTE, LINE_REFS_NOTE, RESUME_DESIRED_EXP_SCORER_PROMPT, TENURE_FACTS_NOTE
+from json_repair import extract_json
+from line_refs import LINE_REFS_ENABLED, cite_schema, line_refs, normalize, numbered, resolve_evidence, resume_units
 from logging_config import get_logger
+from partial_results import partial_sink
+from passage_index import RETRIEVAL_ENABLED, evidence_windows
+from prompt_cache import text_block
+from result_cache import cached_call
+from result_check import ResultModel, complete_items
+from timeline import build_timeline, tenure_requirement, topic_tenure
 
 
 _logger = get_logger(__name__)
 
+# Answer "N+ years of experience" (no topic) requirements from the parsed timeline
+TIMELINE_ENABLED: bool = os.getenv("TENURE_TIMELINE", "true").lower() in ("1", "true", "yes")
+
+OUTPUT_CODEC = OutputCodec({
+    "experiences": "k", "requirement": "r", "score": "sc", "confidence": "c", "justification": "j",
+    "resume_evidence": "e", "source": "t", "excerpt": "x", "lines": "l", "notes": "n",
+})
+OUTPUT_NOTE = OUTPUT_CODEC.note() if COMPACT_OUTPUT_ENABLED else ""
+PLAIN_CODEC = OutputCodec({})
+ITEM_MODEL = ResultModel(OUTPUT_SCHEMA).items("experiences")
+
+
+def _valid(item: Any) -> bool:
+    """Partial results keep valid items only; invalid ones are re-asked."""
+    return not ITEM_MODEL.validate(item)[1]
+
+
+def _unscored(requirement: str) -> Dict[str, Any]:
+    """Placeholder for a requirement still missing or invalid after the re-ask, so it stays visible downstream."""
+    return {
+        "requirement": requirement,
+        "score": 0,
+        "confidence": 0.0,
+        "justification": "Not scored: model output missing or invalid after re-ask.",
+        "resume_evidence": [],
+        "notes": ["unscored"],
+        "unscored": True,
+    }
+
+
+# RESUME_DESIRED_EXP_SCORER_PROMPT's SCORING bands: (score low, high), (confidence low, high)
+_EXACT_BAND = ((9, 10), (0.80, 0.90))
+_PARTIAL_BAND = ((6, 8), (0.60, 0.75))
+# Shortfall the partial band still covers: at least half the required tenure
+_PARTIAL_MIN_RATIO = 0.5
+
+
+def _total_tenure_item(requirement: str, required_years: int, timeline: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Score a total-experience requirement locally with the prompt's bands.
+
+    Met tenure is an exact match (lowest exact score, mid-band confidence); at least half of it
+    a partial match, placed in the partial band by the ratio. None (left to the model) when the
+    resume has no usable dates or claim, or holds less than half the required tenure, which no
+    band describes.
+    """
+    claim = timeline["explicit_claim"]
+    counted = [r for r in timeline["roles"] if not r["excluded"]]
+    if claim:
+        years, excerpts = float(claim["years"]), [claim["excerpt"]]
+    elif counted:
+        years, excerpts = timeline["total_months"] / 12, [r["title"] for r in counted[:2]]
+    else:
+        return None
+    ratio = years / required_years
+    if ratio >= 1:
+        (score, _), (c_low, c_high) = _EXACT_BAND
+        confidence, source, notes = round((c_low + c_high) / 2, 2), "matched", []
+    elif ratio >= _PARTIAL_MIN_RATIO:
+        (low, high), (c_low, c_high) = _PARTIAL_BAND
+        fraction = (ratio - _PARTIAL_MIN_RATIO) / (1 - _PARTIAL_MIN_RATIO)
+        score = low + int(fraction * (high - low + 1))
+        confidence = round(c_low + fraction * (c_high - c_low), 2)
+        source, notes = "partial", ["below required tenure"]
+    else:
+        return None
+    basis = "stated" if claim else "from dated roles, overlaps merged"
+    return {
+        "requirement": requirement,
+        "score": score,
+        "confidence": confidence,
+        "justification": f"{years:.1f} years of experience ({basis}) against {required_years} required.",
+        "resume_evidence": [{"source": source, "excerpt": e} for e in excerpts],
+        "notes": notes,
+    }
+
+
+def _apply_timeline(
+    resume_text: str, requirements: List[str]
+) -> Tuple[Dict[int, Dict[str, Any]], List[Dict[str, Any]]]:
+    """Items answered from the timeline (by requirement index) and tenure facts for the rest."""
+    timeline = build_timeline(resume_text)
+    answered: Dict[int, Dict[str, Any]] = {}
+    facts: List[Dict[str, Any]] = []
+    for i, requirement in enumerate(requirements):
+        tr = tenure_requirement(requirement)
+        if not tr:
+            continue
+        if tr["bare"]:
+            item = _total_tenure_item(requirement, tr["years"], timeline)
+            if item:
+                answered[i] = item
+                continue
+        if tr["topic"] is None:
+            # Total tenure within a wider requirement, or one the bands leave to the model
+            facts.append({"requirement": requirement, "required_years": tr["years"]})
+            continue
+        tenure = topic_tenure(timeline, tr["topic"])
+        facts.append({
+            "requirement": requirement,
+            "required_years": tr["years"],
+            "matched_terms": tenure["terms"],
+            "months_in_roles_mentioning_terms": tenure["months"],
+            "roles": tenure["roles"],
+        })
+    if facts:
+        facts.append({"total_professional_months": timeline["total_months"], "stated": timeline["explicit_claim"]})
+    return answered, facts
+
+
+def _score_with_model(
+    resume_text: str,
+    desired_experience: List[str],
+    facts: List[Dict[str, Any]],
+    sink: Optional[Callable[[Optional[str], Any], None]],
+) -> str:
+    # Job-scoped inputs form a second cacheable prefix shared by every candidate of the job
+    job_in = {"desired_experience": desired_experience}
+    windows = None
+    if RETRIEVAL_ENABLED:
+        windows, stats = evidence_windows(resume_text, desired_experience)
+        if windows is None:
+            _logger.info(f"ResumeDesiredExpScorer full resume reason={stats['reason']} "
+                         f"min_coverage={stats['min_coverage']} resume_chars={stats['resume_chars']}")
+        else:
+            _logger.info(f"ResumeDesiredExpScorer evidence windows min_coverage={stats['min_coverage']} "
+                         f"window_chars={stats['window_chars']} resume_chars={stats['resume_chars']}")
+    refs: Dict[str, Dict[str, str]] = {}
+    if windows is not None:
+        payload_in: Dict[str, Any] = {"resume_evidence_windows": windows}
+        candidate_block = f"{EVIDENCE_WINDOWS_NOTE.strip()}\n{input_text('Input', payload_in)}"
+        if LINE_REFS_ENABLED:
+            # An item may cite the passages of its own window, or any other passage shown
+            shown = line_refs(p for w in windows for p in w["passages"])
+            refs = {w["requirement"]: {**shown, **line_refs(w["passages"])} for w in windows}
+            refs[""] = shown
+    else:
+        units = resume_units(resume_text) if LINE_REFS_ENABLED else {}
+        payload_in = {"resume_text": numbered(units) if units else resume_text}
+        candidate_block = input_text("Input", payload_in)
+        if units:
+            refs[""] = units
+
+    content = [
+        text_block(RESUME_DESIRED_EXP_SCORER_PROMPT.strip(), cache=True),
+        text_block(f"Job input JSON:\n{json.dumps(job_in)}", cache=True),
+        text_block(candidate_block),
+    ]
+    if facts:
+        content.append(text_block(f"{TENURE_FACTS_NOTE.strip()}\nTenure facts JSON:\n{json.dumps(facts)}"))
+        payload_in = {**payload_in, "tenure_facts": facts}
+    note = "\n".join(n.strip() for n in (LINE_REFS_NOTE if refs else "", OUTPUT_NOTE) if n)
+    codec = OUTPUT_CODEC if OUTPUT_NOTE else PLAIN_CODEC
+    # The schema the model answers in: line ids instead of excerpts, short keys
+    schema = codec.schema(cite_schema(OUTPUT_SCHEMA) if refs else OUTPUT_SCHEMA)
+    haystack = normalize(resume_text) if refs else ""
+    counts = [0, 0]
+
+    def finish(item: Dict[str, Any], count: bool = False) -> None:
+        if refs:
+            resolved, dropped = resolve_evidence(item, refs.get(item.get("requirement"), refs[""]), haystack)
+            if count:
+                counts[0] += resolved
+                counts[1] += dropped
+
+    if note:
+        content.append(text_block(note))
+        sink = codec.wrap_sink(sink, finish)
+    text = cached_call(
+        "resume_desired_experience_scorer",
+        RESUME_DESIRED_EXP_SCORER_PROMPT + note,
+        DEFAULT_MODEL_ID,
+        {**job_in, **payload_in},
+        lambda: invoke_messages(content, label="ResumeDesiredExpScorer", on_element=sink, output_schema=schema),
+    )
+    if not note:
+        return text
+    text = codec.expand_text(text, lambda item: finish(item, count=True))
+    if refs:
+        _logger.info(f"ResumeDesiredExpScorer evidence refs resolved={counts[0]} dropped={counts[1]}")
+    return text
+
 
 @tool(name="resume_desired_experience_scorer")
-def resume_desired_experience_scorer(resume_text: str, desired_experience: List[str]) -> str:
+def resume_desired_experience_scorer(
+    resume_text: str,
+    desired_experience: List[str],
+    partial_results_key: Optional[str] = None,
+) -> str:
     """Scores desired experience items against resume; returns ONLY JSON string.
 
     Args:
         resume_text: Full resume text
         desired_experience: List of requirement strings
+        partial_results_key: Optional key under which scored items are written as they stream
     """
-    region = os.getenv("BEDROCK_REGION", os.getenv("AWS_REGION", "us-east-1"))
-    model_id = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20240620-v1:0")
-    client = boto3.client("bedrock-runtime", region_name=region)
+    requirements = list(desired_experience or [])
+    sink = partial_sink(partial_results_key, _valid)
+    answered: Dict[int, Dict[str, Any]] = {}
+    facts: List[Dict[str, Any]] = []
+    if TIMELINE_ENABLED:
+        answered, facts = _apply_timeline(resume_text, requirements)
+    if answered:
+        _logger.info(f"ResumeDesiredExpScorer answered from timeline count={len(answered)} of={len(requirements)}")
+        if sink:
+            for item in answered.values():
+                sink("experiences", item)
+    remaining = [r for i, r in enumerate(requirements) if i not in answered]
+    scored: List[Optional[Dict[str, Any]]] = []
+    if remaining:
 
-    payload_in = {
-        "resume_text": resume_text,
-        "desired_experience": desired_experience or [],
-    }
-    body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 40000,
-        "temperature": 0,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": RESUME_DESIRED_EXP_SCORER_PROMPT.strip()},
-                    {"type": "text", "text": f"Input JSON:\n{json.dumps(payload_in)}"},
-                ],
-            }
-        ],
-    }
+        def score(reqs: List[str]) -> List[Any]:
+            # Tenure facts of the requirements asked for, plus the resume-wide totals entry
+            kept = [f for f in facts if f.get("requirement") in reqs]
+            text = _score_with_model(
+                resume_text, reqs, kept + [f for f in facts if "requirement" not in f] if kept else [],
+                sink,
+            )
+            try:
+                return extract_json(text).get("experiences") or []
+            except (ValueError, AttributeError):
+                _logger.error(f"ResumeDesiredExpScorer model output not JSON: {text[:200]}")
+                return []
 
-    resp = client.invoke_model(
-        modelId=model_id,
-        accept="application/json",
-        contentType="application/json",
-        body=json.dumps(body),
-    )
-    payload_out = json.loads(resp["body"].read())
-    contents = []
-    output_obj = payload_out.get("output")
-    if isinstance(output_obj, dict):
-        contents = output_obj.get("content", []) or []
-    elif isinstance(payload_out.get("content"), list):
-        contents = payload_out.get("content", [])
-    text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict) and c.get("type") == "text"]
-    text = "".join(text_chunks).strip()
+        scored, stats = complete_items(
+            remaining, score(remaining), "requirement", ITEM_MODEL, score, unscored=_unscored
+        )
+        if stats["missing"] or stats["invalid"]:
+            _logger.info(
+                f"ResumeDesiredExpScorer result check missing={stats['missing']} invalid={stats['invalid']} "
+                f"reasked={stats['reasked']} recovered={stats['recovered']} unscored={stats['unscored']} "
+                f"errors={stats['errors']}"
+            )
+    scored_items = iter(scored)
+    experiences = []
+    for i in range(len(requirements)):
+        item = answered.get(i) or next(scored_items)
+        if item:
+            experiences.append(item)
+    text = json.dumps({"experiences": experiences})
     _logger.info("ResumeDesiredExpScorer output", extra={"len": len(text)})
     return text
-
-
@@ -1,6 +1,34 @@
 from typing import Any, Dict
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "education_certification_matching": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "requirement": {"type": "string"},
+                    "match_status": {"type": "string", "enum": ["Exact", "Partial", "Keyword", "None"]},
+                    "score": {"type": "integer", "minimum": 0, "maximum": 10},
+                    "justification": {"type": "string"},
+                },
+                "required": ["requirement", "match_status", "score", "justification"],
+            },
+        },
+        "gaps": {
+            "type": "object",
+            "properties": {"missing_requirements": {"type": "array", "items": {"type": "string"}}},
+            "required": ["missing_requirements"],
+        },
+    },
+    "required": ["education_certification_matching", "gaps"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -26,9 +54,11 @@ def create_or_update_gateway_target(
                                         "items": {"type": "string"},
                                     },
                                     "resume_text": {"type": "string"},
+                                    "partial_results_key": {"type": "string"},
                                 },
                                 "required": ["jd_education_and_certifications", "resume_text"],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                     ]
                 },
@@ -0,0 +1,392 @@
+import os
+import re
+from datetime import date
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+# Local matching of JD education/certification requirements that RESUME_EDU_EVAL_PROMPT would
+# score "Exact": the resume holds the required degree level or a higher one (degree ladder) in
+# the same field (synonym table), or the required certification or one that dominates it (alias
+# dictionary). Anything the rules cannot settle conservatively (lower level, other field,
+# unrecognised wording, "preferred" combinations, a degree still in progress) is left to the model.
+LOCAL_MATCH_ENABLED: bool = os.getenv("EDU_LOCAL_MATCH", "true").lower() in ("1", "true", "yes")
+
+LEVEL_NAMES = {0: "High school", 1: "Associate's", 2: "Bachelor's", 3: "Master's", 4: "Doctorate"}
+_LEVELS: List[Tuple[int, "re.Pattern[str]"]] = [
+    (4, re.compile(r"\bph\.?\s?d\b|\bdoctor(?:ate|al)\b|\bdoctor of (?:philosophy|science|engineering)\b|\bd\.\s?phil\b")),
+    (3, re.compile(
+        r"(?<!scrum )\bmaster'?s?\b(?! data)|\bm\.?\s?sc\b|\bm\.\s?s\.?(?=[\s,(]|$)|\bm\.?\s?tech\b|\bm\.?\s?eng\b"
+        r"|\bmba\b|\bmca\b|\bm\.\s?e\.|\bm\.\s?a\.|\bpost[\s-]?graduate\b")),
+    (2, re.compile(
+        r"\bbachelor'?s?\b|\bb\.?\s?sc\b|\bb\.\s?s\.?(?=[\s,(]|$)|\bb\.?\s?tech\b|\bb\.?\s?eng\b|\bbca\b|\bb\.\s?e\."
+        r"|\bb\.\s?a\.|\bb\.?\s?com\b|\bundergraduate degree\b|\bfour[\s-]year degree\b")),
+    (1, re.compile(r"\bassociate'?s? degree\b|\bassociate of (?:arts|science|applied science)\b|\ba\.\s?[as]\.(?=[\s,]|$)")),
+    (0, re.compile(r"\bhigh school\b|\bged\b|\bsecondary school\b")),
+]
+# Bare "BS", "MS", "BE", "BA", "MA", "ME" count only in upper case and next to a known field
+_BARE_DEGREE = re.compile(r"\b(?P<letter>[BM])[SAE]\b(?!\s*(?:Office|Excel|Word|SQL|Teams|Azure))")
+_ANY_DEGREE = re.compile(r"\bdegree\b", re.IGNORECASE)
+# A degree not yet held: in progress, pursuing, expected, or ending in a later year
+_IN_PROGRESS = re.compile(
+    r"\b(?:in[\s-]progress|pursuing|expected|anticipated|candidate|ongoing|currently enrolled|current student"
+    r"|(?:19|20)\d{2}\s*(?:-|–|—|to)\s*(?:present|current|now|date))\b",
+    re.IGNORECASE,
+)
+_YEAR = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)")
+
+FIELDS: Dict[str, List[str]] = {
+    "computer science": ["computer science", "comp sci", "computing", "cse", "cs", "computer science and engineering"],
+    "software engineering": ["software engineering"],
+    "computer engineering": ["computer engineering"],
+    "information technology": ["information technology", "it"],
+    "information systems": ["information systems", "management information systems", "mis",
+                            "computer information systems"],
+    "electrical engineering": ["electrical engineering", "electrical and electronics engineering", "eee", "ee"],
+    "electronics engineering": ["electronics engineering", "electronics and communication engineering",
+                                "electronics and communication", "ece"],
+    "mechanical engineering": ["mechanical engineering"],
+    "civil engineering": ["civil engineering"],
+    "chemical engineering": ["chemical engineering"],
+    "data science": ["data science", "data analytics"],
+    "mathematics": ["mathematics", "applied mathematics", "maths", "math"],
+    "statistics": ["statistics", "applied statistics"],
+    "physics": ["physics"],
+    "business administration": ["business administration", "business management"],
+    "finance": ["finance"],
+    "accounting": ["accounting"],
+    "economics": ["economics"],
+    "marketing": ["marketing"],
+}
+# Umbrella terms in requirements ("a technical field") and the fields they accept
+FIELD_GROUPS: Dict[str, List[str]] = {
+    "stem": ["computer science", "software engineering", "computer engineering", "information technology",
+             "electrical engineering", "electronics engineering", "mechanical engineering", "civil engineering",
+             "chemical engineering", "data science", "mathematics", "statistics", "physics"],
+    "engineering": ["software engineering", "computer engineering", "electrical engineering", "electronics engineering",
+                    "mechanical engineering", "civil engineering", "chemical engineering"],
+    "technical": ["computer science", "software engineering", "computer engineering", "information technology",
+                  "information systems", "electrical engineering", "electronics engineering", "data science"],
+    "quantitative": ["mathematics", "statistics", "physics", "economics", "data science", "computer science"],
+    "business": ["business administration", "finance", "accounting", "economics", "marketing"],
+}
+# MBA implies its field
+_IMPLIED_FIELDS = {"mba": "business administration"}
+# Short forms that are also English words or common abbreviations ("made it my focus"): they
+# name a field only right after a degree ("B.S. in IT", "BS CS", "degree in CS or EE")
+_SHORT_FIELDS = {
+    s: f for f, syns in FIELDS.items() for s in syns if s in ("it", "cs", "cse", "ee", "eee", "ece", "mis", "math")
+}
+_DEGREE_CONTEXT = (
+    r" (?:[bm] (?:s|sc|a|e|tech|eng)|bs|ms|bsc|msc|btech|mtech|beng|meng|bca|mca|bachelor|master|degree|diploma"
+    r"|major|majored|majoring|science|engineering|ph d|phd)(?: s)?(?: (?:in|of))?(?: (?:or|and))?"
+)
+_SHORT_PATTERNS = {s: re.compile(rf"(?P<ctx>{_DEGREE_CONTEXT}) {s}(?= )") for s in _SHORT_FIELDS}
+
+# (canonical name, vendor, aliases in normalized form, canonical names it dominates)
+CERTIFICATIONS: List[Tuple[str, str, List[str], List[str]]] = [
+    ("AWS Certified Cloud Practitioner", "aws", ["aws cloud practitioner", "clf c01", "clf c02"], []),
+    ("AWS Certified Solutions Architect - Associate", "aws",
+     ["aws solutions architect associate", "aws csa", "saa c02", "saa c03"], []),
+    ("AWS Certified Solutions Architect - Professional", "aws",
+     ["aws solutions architect professional", "sap c01", "sap c02"],
+     ["AWS Certified Solutions Architect - Associate", "AWS Certified Cloud Practitioner"]),
+    ("AWS Certified Developer - Associate", "aws", ["aws developer associate", "dva c01", "dva c02"], []),
+    ("AWS Certified SysOps Administrator - Associate", "aws", ["aws sysops administrator associate", "soa c02"], []),
+    ("AWS Certified DevOps Engineer - Professional", "aws", ["aws devops engineer professional", "dop c02"],
+     ["AWS Certified Developer - Associate", "AWS Certified SysOps Administrator - Associate"]),
+    ("Microsoft Certified: Azure Fundamentals", "azure", ["azure fundamentals", "az 900"], []),
+    ("Microsoft Certified: Azure Administrator Associate", "azure", ["azure administrator associate", "az 104"], []),
+    ("Microsoft Certified: Azure Developer Associate", "azure", ["azure developer associate", "az 204"], []),
+    ("Microsoft Certified: Azure Solutions Architect Expert", "azure", ["azure solutions architect expert", "az 305"],
+     ["Microsoft Certified: Azure Administrator Associate"]),
+    ("Google Cloud Associate Cloud Engineer", "gcp", ["associate cloud engineer"], []),
+    ("Google Cloud Professional Cloud Architect", "gcp", ["professional cloud architect", "gcp cloud architect"], []),
+    ("Certified Kubernetes Administrator", "kubernetes", ["kubernetes administrator", "cka"], []),
+    ("Certified Kubernetes Application Developer", "kubernetes", ["kubernetes application developer", "ckad"], []),
+    ("HashiCorp Certified: Terraform Associate", "terraform", ["terraform associate"], []),
+    ("Project Management Professional", "pmi", ["project management professional", "pmp"],
+     ["Certified Associate in Project Management"]),
+    ("Certified Associate in Project Management", "pmi", ["associate in project management", "capm"], []),
+    ("Certified ScrumMaster", "scrum", ["scrummaster", "scrum master", "csm", "professional scrum master", "psm"], []),
+    ("CISSP", "security", ["cissp", "information systems security professional"], []),
+    ("CISM", "security", ["cism", "information security manager"], []),
+    ("CISA", "security", ["cisa", "information systems auditor"], []),
+    ("CompTIA Security+", "comptia", ["security+", "comptia security+"], []),
+    ("Certified Ethical Hacker", "security", ["ethical hacker", "ceh"], []),
+    ("CCNA", "cisco", ["ccna", "cisco certified network associate"], []),
+    ("CCNP", "cisco", ["ccnp", "cisco certified network professional"], ["CCNA"]),
+    ("ITIL Foundation", "itil", ["itil foundation", "itil v4", "itil 4", "itil"], []),
+    ("Certified Public Accountant", "accounting", ["cpa", "public accountant"], []),
+    ("Chartered Financial Analyst", "finance", ["cfa", "chartered financial analyst"], []),
+    ("Six Sigma Green Belt", "six sigma", ["six sigma green belt", "lean six sigma green belt"], []),
+    ("Six Sigma Black Belt", "six sigma", ["six sigma black belt", "lean six sigma black belt"], ["Six Sigma Green Belt"]),
+    ("Oracle Certified Professional, Java SE Programmer", "oracle", ["oracle java", "ocpjp", "java se programmer"], []),
+    ("TOGAF", "togaf", ["togaf"], []),
+]
+# Aliases that are also role titles or everyday acronyms ("Served as Scrum Master", "ran ITIL
+# change processes", "audited by CPA firms"): they count in a resume only on a line that
+# mentions certification or under a certifications/licenses heading
+_CONTEXT_ALIASES = {
+    "scrum master", "professional scrum master", "csm", "psm", "itil", "cpa", "public accountant", "cfa",
+    "chartered financial analyst", "cisa", "cism", "information security manager", "information systems auditor",
+    "ceh", "ethical hacker", "kubernetes administrator", "togaf",
+}
+_CERT_CONTEXT = re.compile(r"certif|credential|licen[sc]|\bexam\b", re.IGNORECASE)
+_CERT_HEADING = re.compile(r"^\W*(?:certifications?|certificates|licen[sc]es?|credentials)\b[\w &,]{0,30}:?$", re.IGNORECASE)
+_OTHER_HEADING = re.compile(
+    r"^\W*(?:education|experience|work experience|professional experience|employment|work history|skills"
+    r"|technical skills|projects|summary|profile|awards|publications|languages|interests)\s*:?$",
+    re.IGNORECASE,
+)
+
+_VENDOR_WORDS = {
+    "aws": ["aws", "amazon web services"], "azure": ["azure", "microsoft azure"], "gcp": ["gcp", "google cloud"],
+    "kubernetes": ["kubernetes", "cncf"], "scrum": ["scrum", "agile"], "cisco": ["cisco"], "comptia": ["comptia"],
+    "oracle": ["oracle"], "pmi": ["pmi"], "six sigma": ["six sigma", "lean six sigma"],
+}
+
+# Words that carry no matching information in a requirement once levels/fields/certs are removed
+_FILLER = set("""
+a an the in of or and with from any one some its is are be to for on at as e g eg such following e.g
+degree degrees diploma science sciences arts art bachelor bachelors master masters equivalent related field fields
+discipline disciplines area areas major required requirement requirements preferred preferably desired desirable
+plus bonus nice have having must should strong good relevant similar accredited university college institution
+recognized recognised minimum least qualification qualifications education educational background study studies
+certification certifications certificate certificates certified credential credentials professional industry
+valid current active hold holding holds obtained obtain level higher above advanced graduate experience
+""".split())
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+
+def normalize(text: str) -> str:
+    """Lower-case, "&" as "and", punctuation (except + and #) as spaces, collapsed."""
+    text = text.lower().replace("’", "'").replace("&", " and ")
+    text = re.sub(r"[^a-z0-9+#]+", " ", text)
+    return f" {text.strip()} "
+
+
+def _find_phrases(norm: str, phrases: List[str]) -> List[str]:
+    return [p for p in phrases if f" {p} " in norm]
+
+
+def _strip_phrases(norm: str, phrases: List[str]) -> str:
+    for p in sorted(phrases, key=len, reverse=True):
+        norm = norm.replace(f" {p} ", " ")
+    return norm
+
+
+def fields_in(text: str, groups: bool = False) -> Tuple[Set[str], str]:
+    """Canonical fields named in `text` (umbrella groups expanded when `groups`, for requirements),
+    and the normalized text without them."""
+    norm = normalize(text)
+    found: Set[str] = set()
+    matched: List[str] = []
+    low = text.lower()
+    found.update(f for k, f in _IMPLIED_FIELDS.items() if re.search(rf"\b{k}\b", low))
+    # Longest synonyms first so "computer science and engineering" is not read as two fields;
+    # umbrella groups only count once the named fields are gone ("electrical engineering")
+    synonyms = sorted(((s, f) for f, syns in FIELDS.items() for s in syns), key=lambda sf: -len(sf[0]))
+    for syn, field in synonyms:
+        if syn not in _SHORT_FIELDS and f" {syn} " in norm:
+            found.add(field)
+            norm = norm.replace(f" {syn} ", " ")
+    # A matched short form is dropped and leaves its degree context for the next one ("BS in CS or EE")
+    matching = True
+    while matching:
+        matching = False
+        for syn, pattern in _SHORT_PATTERNS.items():
+            norm, n = pattern.subn(r"\g<ctx>", norm)
+            if n:
+                found.add(_SHORT_FIELDS[syn])
+                matching = True
+    if groups:
+        for group, members in FIELD_GROUPS.items():
+            if f" {group} " in norm:
+                found.update(members)
+                matched.append(group)
+    return found, _strip_phrases(norm, matched)
+
+
+def degree_levels(text: str) -> Tuple[Set[int], str]:
+    """Degree levels mentioned in `text`, and the lower-cased text with each mention replaced by "degree"."""
+    low = text.lower().replace("’", "'")
+    levels: Set[int] = set()
+    for level, rx in _LEVELS:
+        if rx.search(low):
+            levels.add(level)
+            low = rx.sub(" degree ", low)
+    for m in _BARE_DEGREE.finditer(text):
+        if fields_in(text[m.start():m.end() + 60])[0]:
+            levels.add(3 if m.group("letter") == "M" else 2)
+            low = low.replace(m.group(0).lower(), " degree ", 1)
+    return levels, low
+
+
+def _in_progress(text: str, today: date) -> bool:
+    return bool(_IN_PROGRESS.search(text)) or any(int(y) > today.year for y in _YEAR.findall(text))
+
+
+def resume_degrees(resume_text: str, today: Optional[date] = None) -> List[Dict[str, Any]]:
+    """Degrees found line by line: {level, fields, excerpt, in_progress}; the field and the dates
+    may sit on the next line."""
+    today = today or date.today()
+    lines = [line.strip() for line in resume_text.splitlines() if line.strip()]
+    degrees: List[Dict[str, Any]] = []
+    for i, line in enumerate(lines):
+        levels, _ = degree_levels(line)
+        if not levels:
+            continue
+        fields, _ = fields_in(line)
+        excerpt = line
+        following = lines[i + 1] if i + 1 < len(lines) and not degree_levels(lines[i + 1])[0] else ""
+        if not fields and following:
+            fields, _ = fields_in(following)
+            if fields:
+                excerpt = f"{line} {following}"
+        in_progress = _in_progress(line, today) or _in_progress(following, today)
+        degrees.append({"level": max(levels), "fields": fields, "excerpt": excerpt, "in_progress": in_progress})
+    return degrees
+
+
+def _cert_lookup() -> Tuple[Dict[str, Tuple[str, str]], Dict[str, FrozenSet[str]]]:
+    aliases = {}
+    dominates = {}
+    for name, vendor, names, dom in CERTIFICATIONS:
+        for a in names:
+            aliases[a] = (name, vendor)
+        dominates[name] = frozenset(dom)
+    return aliases, dominates
+
+
+_CERT_ALIASES, _CERT_DOMINATES = _cert_lookup()
+_CERT_FILLER = ("certified", "certification", "certificate", "microsoft", "google", "hashicorp", "cisco")
+
+
+def _cert_norm(text: str) -> str:
+    norm = normalize(text)
+    for w in _CERT_FILLER:
+        norm = norm.replace(f" {w} ", " ")
+    return norm
+
+
+def certifications_in(text: str, context: bool = True) -> Tuple[Dict[str, str], str]:
+    """{canonical cert: vendor} named in `text`, and the normalized text without those names.
+
+    Without `context` (a resume line that does not speak of certification), the role-like
+    aliases of _CONTEXT_ALIASES are ignored.
+    """
+    norm = _cert_norm(text)
+    found = {}
+    matched = _find_phrases(norm, [a for a in _CERT_ALIASES if context or a not in _CONTEXT_ALIASES])
+    for alias in matched:
+        name, vendor = _CERT_ALIASES[alias]
+        found[name] = vendor
+    return found, _strip_phrases(norm, matched)
+
+
+def resume_certifications(resume_text: str) -> Dict[str, str]:
+    """{canonical cert: resume line} for every certification alias found."""
+    found: Dict[str, str] = {}
+    under_heading = False
+    for line in resume_text.splitlines():
+        if not line.strip():
+            continue
+        if _CERT_HEADING.match(line.strip()):
+            under_heading = True
+            continue
+        if _OTHER_HEADING.match(line.strip()):
+            under_heading = False
+            continue
+        context = under_heading or bool(_CERT_CONTEXT.search(line))
+        for name in certifications_in(line, context)[0]:
+            found.setdefault(name, line.strip())
+    return found
+
+
+def _leftover(norm: str) -> List[str]:
+    return [w for w in _WORD.findall(norm) if w not in _FILLER]
+
+
+def _item(requirement: str, evidence: str, note: str = "") -> Dict[str, Any]:
+    return {
+        "requirement": requirement,
+        "match_status": "Exact",
+        "score": 10,
+        "justification": f'Requirement satisfied because resume shows: "{evidence}"{note}',
+    }
+
+
+def _match_degree(requirement: str, levels: Set[int], rest: str, degrees: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    # "Bachelor's or Master's", "BS/MS": the lowest level satisfies; other combinations
+    # ("Bachelor's required, Master's preferred") are left to the model
+    if len(levels) > 1 and not re.search(r"\bor\b|/", requirement.lower()):
+        return None
+    required = min(levels)
+    req_fields, rest = fields_in(rest, groups=True)
+    req_fields.update(f for k, f in _IMPLIED_FIELDS.items() if re.search(rf"\b{k}\b", requirement.lower()))
+    if _leftover(rest):
+        return None  # a field or condition the tables do not know
+    best = None
+    for d in degrees:
+        if d["in_progress"] or d["level"] < required:
+            continue  # a degree not yet held is the model's call
+        if req_fields and not (req_fields & d["fields"]):
+            continue
+        if best is None or (d["level"] == required) > (best["level"] == required):
+            best = d
+    if best is None:
+        return None
+    note = ""
+    if best["level"] > required:
+        note = f" ({LEVEL_NAMES[best['level']]} exceeds the required {LEVEL_NAMES[required]})"
+    return _item(requirement, best["excerpt"], note)
+
+
+def _match_certification(requirement: str, held: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    wanted, rest = certifications_in(requirement)
+    vendors = [v for v, words in _VENDOR_WORDS.items() if _find_phrases(rest, words)]
+    for v in vendors:
+        rest = _strip_phrases(rest, _VENDOR_WORDS[v])
+    if _leftover(rest) or not (wanted or vendors):
+        return None
+    all_required = bool(re.search(r"\band\b|,", requirement.lower())) and len(wanted) > 1
+
+    def satisfied(name: str) -> Optional[str]:
+        if name in held:
+            return held[name]
+        return next((line for h, line in held.items() if name in _CERT_DOMINATES.get(h, ())), None)
+
+    if wanted:
+        evidence = [satisfied(name) for name in wanted]
+        hits = [e for e in evidence if e]
+        if not hits or (all_required and len(hits) < len(wanted)):
+            return None
+        return _item(requirement, "; ".join(dict.fromkeys(hits)))
+    # Vendor-level requirement ("AWS certification"): any certification from that vendor
+    vendor_of = {name: vendor for name, vendor, _, _ in CERTIFICATIONS}
+    for name, line in held.items():
+        if vendor_of.get(name) in vendors:
+            return _item(requirement, line)
+    return None
+
+
+def match_requirements(requirements: List[str], resume_text: str) -> Dict[int, Dict[str, Any]]:
+    """Requirements settled locally, by index, as education_certification_matching items."""
+    degrees = resume_degrees(resume_text)
+    held = resume_certifications(resume_text)
+    answered: Dict[int, Dict[str, Any]] = {}
+    for i, requirement in enumerate(requirements):
+        if not isinstance(requirement, str) or not requirement.strip():
+            continue
+        levels, rest = degree_levels(requirement)
+        if not levels and _ANY_DEGREE.search(requirement) and not certifications_in(requirement)[0]:
+            levels = {2}  # "Degree in Computer Science"
+        if levels:
+            if "certif" in requirement.lower():
+                continue  # combined degree + certification requirement
+            item = _match_degree(requirement, levels, rest, degrees)
+        else:
+            item = _match_certification(requirement, held)
+        if item:
+            answered[i] = item
+    return answered
@@ -1,13 +1,17 @@
 from typing import Any, Dict, List
-import json
 
 from strands import Agent
 
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from json_repair import extract_json
 from logging_config import get_logger
+from result_check import ResultModel
 from tools import resume_education_evaluator
 
 
 _logger = get_logger(__name__)
+# Typed view of the result returned through the gateway; violations are logged, numbers coerced
+RESULT_MODEL = ResultModel(OUTPUT_SCHEMA)
 
 
 def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
@@ -17,11 +21,18 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
         return {"error": "Missing or invalid 'jd_education_and_certifications' (list) or 'resume_text' (str)"}
 
     agent = Agent(tools=[resume_education_evaluator])
-    result = agent.tool.resume_education_evaluator(jd_education_and_certifications=jd_list, resume_text=resume_text)
+    result = agent.tool.resume_education_evaluator(
+        jd_education_and_certifications=jd_list,
+        resume_text=resume_text,
+        partial_results_key=(event or {}).get("partial_results_key"),
+    )
     contents = result.get("content", [])
     text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict)]
     text = "".join(text_chunks).strip()
     _logger.info("ResumeEducationEval output text: %s", text)
-    return json.loads(text)
+    result, errors = RESULT_MODEL.validate(extract_json(text))
+    if errors:
+        _logger.warning("ResumeEducationEval result does not match OUTPUT_SCHEMA: %s", errors[:5])
+    return result
 
 
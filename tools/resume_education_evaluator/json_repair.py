@@ -0,0 +1,117 @@
+import json
+import re
+from typing import Any, List, Match, Optional, Tuple
+
+
+# Closing bracket per opening bracket, for repairing truncated output
+_CLOSERS = {"{": "}", "[": "]"}
+# A bracket that starts a JSON value rather than prose ("{skill}", "[1]", "[ ]"): an object
+# opens with a key or closes, a top-level array holds objects, arrays or strings.
+_START = re.compile(r'\{\s*["}]|\[\s*[{\["]')
+# Tokens the scan looks at: a string (unterminated at the end of the text: no closing quote)
+# or a structural character. Numbers, literals and whitespace are skipped by the regex engine.
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*(?P<closed>")?|[{}\[\],:]', re.S)
+_DECODER = json.JSONDecoder()
+
+
+def scan_json(text: str, repair: bool = True) -> Tuple[Any, bool]:
+    """The first complete top-level JSON object/array in `text`, and whether it was repaired.
+
+    Text that is JSON as a whole is parsed directly. Otherwise the value is decoded in place
+    at the first bracket that can start one; when that fails, a pass over its tokens (string
+    and escape aware) finds where its brackets balance, and the search resumes after that
+    span. When the text ends inside the value (output cut at max_tokens) and `repair` is
+    set, the value is cut back to its last complete element and the open arrays/objects are
+    closed; an array element that is an object is kept only once it is complete. Spans do
+    not overlap, so the cost is linear in len(text), unlike a backtracking regex. An empty
+    object in prose ("function() {}") is returned only when no other value follows it.
+
+    Raises ValueError when no value can be recovered.
+    """
+    try:
+        return json.loads(text), False
+    except (ValueError, RecursionError):
+        pass
+    n = len(text)
+    empty: Optional[Any] = None
+    i = _next_start(text, 0)
+    while i < n:
+        try:
+            value, end = _DECODER.raw_decode(text, i)
+        except (ValueError, RecursionError):
+            pass
+        else:
+            if value:
+                return value, False
+            if empty is None:
+                empty = value
+            i = _next_start(text, end)
+            continue
+        end, cut = _scan(text, i)
+        if end >= 0:
+            i = _next_start(text, end)
+            continue
+        if repair and cut is not None:
+            pos, closers = cut
+            try:
+                return json.loads(text[i:pos] + closers), True
+            except (ValueError, RecursionError):
+                pass
+        break
+    if empty is not None:
+        return empty, False
+    raise ValueError("no JSON object or array found")
+
+
+def extract_json(text: str, repair: bool = True) -> Any:
+    """scan_json() without the repaired flag."""
+    return scan_json(text, repair)[0]
+
+
+def _next_start(text: str, i: int) -> int:
+    m = _START.search(text, i)
+    return m.start() if m else len(text)
+
+
+def _scan(text: str, start: int) -> Tuple[int, Optional[Tuple[int, str]]]:
+    """Scan the value opening at `start`: (end offset, None) when it closes, else (-1, cut).
+
+    `cut` is (offset, closers): text[start:offset] + closers is the value truncated to its
+    last complete element with every open bracket closed (None when no such point exists).
+    """
+    stack: List[str] = []
+    prev = ""  # last token: a structural character, or '"' after a string
+    item_depth = -1  # stack depth of the outermost array element object still open
+    # Last complete point: the cut is at the end of token `cut` (its start for a comma),
+    # with the first `cut_depth` brackets of the stack still open
+    cut: Optional[Match[str]] = None
+    cut_depth = 0
+    for m in _TOKEN.finditer(text, start):
+        ch = m.group()[0]
+        if ch == '"':
+            if m.group("closed") is None:
+                break  # the text ends inside this string
+            if item_depth < 0 and (prev == ":" or stack[-1] == "["):
+                cut, cut_depth = m, len(stack)
+        elif ch == "{" or ch == "[":
+            if ch == "{" and item_depth < 0 and stack and stack[-1] == "[":
+                item_depth = len(stack)
+            stack.append(ch)
+            if item_depth < 0:
+                cut, cut_depth = m, len(stack)
+        elif ch == "}" or ch == "]":
+            if _CLOSERS[stack.pop()] != ch:
+                return m.end(), None  # mismatched: not JSON, the caller skips the span
+            if not stack:
+                return m.end(), None
+            if len(stack) == item_depth:
+                item_depth = -1
+            if item_depth < 0:
+                cut, cut_depth = m, len(stack)
+        elif ch == "," and item_depth < 0:
+            cut, cut_depth = m, len(stack)
+        prev = ch
+    if cut is None:
+        return -1, None
+    pos = cut.start() if cut.group() == "," else cut.end()
+    return -1, (pos, "".join(_CLOSERS[b] for b in reversed(stack[:cut_depth])))
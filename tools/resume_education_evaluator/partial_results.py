@@ -0,0 +1,80 @@
+import json
+import os
+import time
+import uuid
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from logging_config import get_logger
+
+
+_logger = get_logger(__name__)
+
+# Optional sink for streamed elements: each completed element is appended to
+# `items` of the row keyed by the caller-supplied partial_results_key, so the
+# agent/webapp can read results before the tool call returns.
+PARTIAL_RESULTS_TABLE = os.getenv("PARTIAL_RESULTS_TABLE", "")
+PARTIAL_RESULTS_TTL_SECONDS = int(os.getenv("PARTIAL_RESULTS_TTL_SECONDS", "86400"))
+
+_table = None
+
+
+def _get_table() -> Any:
+    global _table
+    if _table is None:
+        import boto3
+
+        region = os.getenv("AWS_REGION", "us-east-1")
+        _table = boto3.resource("dynamodb", region_name=region).Table(PARTIAL_RESULTS_TABLE)
+    return _table
+
+
+def partial_sink(
+    partial_results_key: Optional[str], accept: Optional[Callable[[Any], bool]] = None
+) -> Optional[Callable[[Optional[str], Any], None]]:
+    """Return an `on_element` callback writing to PARTIAL_RESULTS_TABLE, or None if disabled.
+
+    Create one sink per tool call: it starts the row afresh under a new run id, so a re-run or
+    retried call replaces the items of the previous one, and appends from an older call still
+    streaming under the same key are rejected. Elements `accept` turns down (items that fail
+    validation, which a re-ask replaces) are not written.
+    """
+    if not (PARTIAL_RESULTS_TABLE and partial_results_key):
+        return None
+    table = _get_table()
+    run_id = uuid.uuid4().hex
+    try:
+        table.put_item(Item={
+            "partial_key": partial_results_key,
+            "run_id": run_id,
+            "items": [],
+            "expires_at": int(time.time()) + PARTIAL_RESULTS_TTL_SECONDS,
+        })
+    except Exception as e:
+        _logger.warning("Partial result reset failed key=%s error=%s", partial_results_key, e)
+        return None
+
+    def sink(key: Optional[str], element: Any) -> None:
+        if accept is not None and not accept(element):
+            return
+        item = json.loads(json.dumps(element), parse_float=Decimal)
+        try:
+            table.update_item(
+                Key={"partial_key": partial_results_key},
+                UpdateExpression="SET #items = list_append(#items, :item), #list_key = :list_key, expires_at = :exp",
+                ConditionExpression="run_id = :run",
+                ExpressionAttributeNames={"#items": "items", "#list_key": "list_key"},
+                ExpressionAttributeValues={
+                    ":item": [item],
+                    ":list_key": key or "",
+                    ":exp": int(time.time()) + PARTIAL_RESULTS_TTL_SECONDS,
+                    ":run": run_id,
+                },
+            )
+        except Exception as e:
+            if getattr(e, "response", {}).get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return  # a newer call for this key has started the row again
+            # Partial results are best-effort; the full result is still returned
+            _logger.warning("Partial result write failed key=%s error=%s", partial_results_key, e)
+
+    return sink
@@ -1,59 +1,130 @@
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Optional
 import json
-import os
 
-import boto3
 from strands import tool
 
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from bedrock_runtime import DEFAULT_MODEL_ID, invoke_messages
+from compact_io import COMPACT_OUTPUT_ENABLED, OutputCodec, input_text
 from constants import RESUME_EDU_EVAL_PROMPT
+from education_rules import LOCAL_MATCH_ENABLED, match_requirements
+from json_repair import extract_json
 from logging_config import get_logger
+from partial_results import partial_sink
+from prompt_cache import text_block
+from result_cache import cached_call
+from result_check import ResultModel, complete_items
 
 
 _logger = get_logger(__name__)
 
+OUTPUT_CODEC = OutputCodec({
+    "education_certification_matching": "k", "requirement": "r", "match_status": "m", "score": "sc",
+    "justification": "j", "gaps": "g", "missing_requirements": "mr",
+})
+OUTPUT_NOTE = OUTPUT_CODEC.note() if COMPACT_OUTPUT_ENABLED else ""
+MODEL_SCHEMA = OUTPUT_CODEC.schema(OUTPUT_SCHEMA) if OUTPUT_NOTE else OUTPUT_SCHEMA
+ITEM_MODEL = ResultModel(OUTPUT_SCHEMA).items("education_certification_matching")
 
-@tool(name="resume_education_evaluator")
-def resume_education_evaluator(jd_education_and_certifications: List[str], resume_text: str) -> str:
-    """Evaluates education and certifications alignment; returns ONLY JSON string."""
-    region = os.getenv("BEDROCK_REGION", os.getenv("AWS_REGION", "us-east-1"))
-    model_id = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20240620-v1:0")
-    client = boto3.client("bedrock-runtime", region_name=region)
 
-    payload_in = {
-        "jd_education_and_certifications": jd_education_and_certifications or [],
-        "resume_text": resume_text,
-    }
-    body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 40000,
-        "temperature": 0,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": RESUME_EDU_EVAL_PROMPT.strip()},
-                    {"type": "text", "text": f"Input JSON:\n{json.dumps(payload_in)}"},
-                ],
-            }
-        ],
+def _valid(item: Any) -> bool:
+    """Partial results keep valid items only; invalid ones are re-asked."""
+    return not ITEM_MODEL.validate(item)[1]
+
+
+def _unscored(requirement: str) -> Dict[str, Any]:
+    """Placeholder for a requirement still missing or invalid after the re-ask, so it stays visible downstream."""
+    return {
+        "requirement": requirement,
+        "match_status": "None",
+        "score": 0,
+        "justification": "Not scored: model output missing or invalid after re-ask.",
+        "unscored": True,
     }
 
-    resp = client.invoke_model(
-        modelId=model_id,
-        accept="application/json",
-        contentType="application/json",
-        body=json.dumps(body),
+
+def _evaluate_with_model(
+    jd_education_and_certifications: List[str],
+    resume_text: str,
+    sink: Optional[Callable[[Optional[str], Any], None]],
+) -> str:
+    # Job-scoped inputs form a second cacheable prefix shared by every candidate of the job
+    job_in = {"jd_education_and_certifications": jd_education_and_certifications}
+    payload_in = {"resume_text": resume_text}
+
+    content = [
+        text_block(RESUME_EDU_EVAL_PROMPT.strip(), cache=True),
+        text_block(f"Job input JSON:\n{json.dumps(job_in)}", cache=True),
+        text_block(input_text("Input", payload_in)),
+    ]
+    if OUTPUT_NOTE:
+        content.append(text_block(OUTPUT_NOTE))
+        sink = OUTPUT_CODEC.wrap_sink(sink)
+    text = cached_call(
+        "resume_education_evaluator",
+        RESUME_EDU_EVAL_PROMPT + OUTPUT_NOTE,
+        DEFAULT_MODEL_ID,
+        {**job_in, **payload_in},
+        lambda: invoke_messages(content, label="ResumeEducationEval", on_element=sink, output_schema=MODEL_SCHEMA),
     )
-    payload_out = json.loads(resp["body"].read())
-    contents = []
-    output_obj = payload_out.get("output")
-    if isinstance(output_obj, dict):
-        contents = output_obj.get("content", []) or []
-    elif isinstance(payload_out.get("content"), list):
-        contents = payload_out.get("content", [])
-    text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict) and c.get("type") == "text"]
-    text = "".join(text_chunks).strip()
-    _logger.info("ResumeEducationEval output", extra={"len": len(text)})
-    return text
+    return OUTPUT_CODEC.expand_text(text) if OUTPUT_NOTE else text
+
 
+@tool(name="resume_education_evaluator")
+def resume_education_evaluator(
+    jd_education_and_certifications: List[str],
+    resume_text: str,
+    partial_results_key: Optional[str] = None,
+) -> str:
+    """Evaluates education and certifications alignment; returns ONLY JSON string."""
+    requirements = list(jd_education_and_certifications or [])
+    sink = partial_sink(partial_results_key, _valid)
+    answered: Dict[int, Dict[str, Any]] = {}
+    if LOCAL_MATCH_ENABLED:
+        answered = match_requirements(requirements, resume_text)
+    if answered:
+        _logger.info(f"ResumeEducationEval matched locally count={len(answered)} of={len(requirements)}")
+        if sink:
+            for item in answered.values():
+                sink("education_certification_matching", item)
+    remaining = [r for i, r in enumerate(requirements) if i not in answered]
+    scored: List[Optional[Dict[str, Any]]] = []
+    missing: List[str] = []
+    if remaining:
 
+        def evaluate(reqs: List[str]) -> List[Any]:
+            text = _evaluate_with_model(reqs, resume_text, sink)
+            try:
+                out = extract_json(text)
+                # A re-ask answers its requirements afresh, gaps included
+                missing[:] = [m for m in missing if m not in reqs]
+                missing.extend((out.get("gaps") or {}).get("missing_requirements") or [])
+                return out.get("education_certification_matching") or []
+            except (ValueError, AttributeError):
+                _logger.error(f"ResumeEducationEval model output not JSON: {text[:200]}")
+                return []
+
+        scored, stats = complete_items(
+            remaining, evaluate(remaining), "requirement", ITEM_MODEL, evaluate, unscored=_unscored
+        )
+        if stats["missing"] or stats["invalid"]:
+            _logger.info(
+                f"ResumeEducationEval result check missing={stats['missing']} invalid={stats['invalid']} "
+                f"reasked={stats['reasked']} recovered={stats['recovered']} unscored={stats['unscored']} "
+                f"errors={stats['errors']}"
+            )
+    scored_items = iter(scored)
+    matching = []
+    for i in range(len(requirements)):
+        item = answered.get(i) or next(scored_items)
+        if item:
+            matching.append(item)
+    matched_locally = {item["requirement"] for item in answered.values()}
+    text = json.dumps({
+        "education_certification_matching": matching,
+        "gaps": {"missing_requirements": list(dict.fromkeys(
+            m for m in missing if isinstance(m, str) and m not in matched_locally
+        ))},
+    })
+    _logger.info("ResumeEducationEval output", extra={"len": len(text)})
+    return text
@@ -1,6 +1,20 @@
 from typing import Any, Dict
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {"type": ["string", "null"]},
+        "email": {"type": ["string", "null"]},
+        "phone": {"type": ["string", "null"]},
+        "years_of_experience": {"anyOf": [{"type": "integer", "minimum": 0}, {"type": "string", "enum": ["unknown"]}]},
+    },
+    "required": ["name", "email", "phone", "years_of_experience"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -25,6 +39,7 @@ def create_or_update_gateway_target(
                                 },
                                 "required": ["resume_text"],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                     ]
                 },
@@ -155,3 +155,36 @@ Output
 """
 
 
+
+
+# Fallback used when contact_rules.py resolves name/email/phone locally: only the
+# still-open fields' rules are sent (assembled by tools.py), not RESUME_PI_PROMPT.
+RESUME_PI_FALLBACK_PROMPT = """
+You are a deterministic resume parser. Use only the resume text; never guess.
+The input is one person's resume. Ignore company, team, group and reference contacts.
+Extract only the fields listed below and output ONLY this JSON object, no prose:
+{schema}
+
+Field rules:
+{rules}
+"""
+
+RESUME_PI_FIELD_RULES = {
+    "name": (
+        "name — the candidate's full name (2–4 tokens, each starting with a letter). Prefer the first line or the "
+        "contact header; exclude job titles, corporate suffixes and department names. null if ambiguous."
+    ),
+    "email": (
+        "email — the candidate's primary email, first in reading order within the header/contact block. Normalize "
+        "an obfuscated form (john [at] example [dot] com) only if unambiguous. null if ambiguous."
+    ),
+    "phone": (
+        "phone — the candidate's primary phone as written, keeping any country code; never invent one. null if ambiguous."
+    ),
+    "years_of_experience": (
+        "years_of_experience — integer. If the candidate states total experience, use it (X+ → X, X–Y → Y, "
+        "about X → X). Otherwise sum professional roles in the Experience section (exclude internships, "
+        "part-time, volunteering, coursework; count overlapping months once; assume June when only a year is "
+        "given) and return floor(months / 12). \"unknown\" if dates are too incomplete."
+    ),
+}
@@ -0,0 +1,183 @@
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Local extraction of the fields RESUME_PI_PROMPT describes deterministically. Each
+# extractor returns (value, resolved): resolved=False means the field is ambiguous and
+# should be left to the model; (None, True) means it is safely absent.
+LOCAL_EXTRACTION_ENABLED: bool = os.getenv("PI_LOCAL_EXTRACTION", "true").lower() in ("1", "true", "yes")
+PHONE_FORMAT = os.getenv("PI_PHONE_FORMAT", "as_seen").lower()  # as_seen | e164
+HEADER_LINES = int(os.getenv("PI_HEADER_LINES", "12"))
+
+_EMAIL = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.IGNORECASE)
+_OBFUSCATED_EMAIL = re.compile(
+    r"([A-Z0-9._%+-]+)\s*[\[(]?\s*(?:@|\bat\b)\s*[\])]?\s*([A-Z0-9-]+(?:\s*[\[(]?\s*(?:\.|\bdot\b)\s*[\])]?\s*[A-Z0-9-]+)+)",
+    re.IGNORECASE,
+)
+# Shared mailboxes that belong to a company or team, never to the candidate
+_ROLE_LOCAL_PARTS = {
+    "admin", "careers", "contact", "enquiries", "hello", "help", "hr", "info", "jobs", "mail", "marketing",
+    "no-reply", "noreply", "office", "recruiting", "recruitment", "sales", "support", "talent", "team", "webmaster",
+}
+_PHONE = re.compile(r"(?<![\w+])(\+?\(?\d[\d\s().-]{5,20}\d)(?![\w])")
+_PHONE_LABEL = re.compile(r"\b(?:phone|mobile|mob|cell|tel|telephone|contact)\b", re.IGNORECASE)
+_YEARS_ONLY = re.compile(r"^(?:(?:19|20)\d{2}[\s().-]*)+$")
+_DATE_LIKE = re.compile(r"^\d{1,4}[./-]\d{1,2}[./-]\d{1,4}$|^(?:19|20)\d{2}[./-]\d{1,2}$")
+# Two numbers joined by a spaced dash: date, salary or year ranges ("2019.01 - 2021.12", "120000 - 150000")
+_RANGE_LIKE = re.compile(r"\d\s+[-–—]\s*\d|\d\s*[-–—]\s+\d")
+_ZIP_PLUS4 = re.compile(r"^\d{5}-\d{4}$")
+# Real phone grouping: a +CC/00 prefix, a bracketed area code, or xxx-xxx-xxxx / xxx.xxx.xxxx / xxx xxx xxxx
+_PHONE_GROUPED = re.compile(
+    r"^(?:\+|00)\d"
+    r"|^\(\d{2,5}\)\s?\d{3,4}[\s.-]?\d{3,4}$"
+    r"|^\d{3}([-.\s])\d{3}\1\d{4}$"
+)
+# Local number lengths (national significant number) by calling code, where known
+_NSN_LENGTHS = {"1": (10,), "44": (9, 10), "91": (10,), "61": (9,), "49": tuple(range(6, 12)), "33": (9,), "65": (8,)}
+
+_REFERENCES_HEADER = re.compile(r"^\s*(?:references?|referees?)\s*:?\s*$", re.IGNORECASE)
+_NAME_LABEL = re.compile(r"^\s*(?:full\s+)?name\s*[:\-]\s*(.+)$", re.IGNORECASE)
+_NAME_TOKEN = re.compile(r"^[A-Za-zÀ-ÖØ-öø-ÿ][A-Za-zÀ-ÖØ-öø-ÿ'’-]*\.?$")
+_NOT_NAME_WORDS = {
+    "resume", "curriculum", "vitae", "cv", "profile", "summary", "objective", "experience", "education", "skills",
+    "contact", "engineer", "developer", "manager", "analyst", "consultant", "designer", "architect", "scientist",
+    "senior", "junior", "lead", "director", "intern", "specialist", "administrator", "officer", "associate",
+    "inc", "inc.", "llc", "ltd", "ltd.", "corp", "corp.", "technologies", "solutions", "systems", "group",
+    "department", "team", "university", "college", "school", "street", "road", "avenue",
+    "engineering", "development", "professional", "career", "personal", "details", "information", "work", "history",
+}
+
+
+def _lines_before_references(resume_text: str) -> List[str]:
+    """Resume lines, cut at a References section so referees' contacts are never picked."""
+    lines = resume_text.splitlines()
+    for i, line in enumerate(lines):
+        if _REFERENCES_HEADER.match(line):
+            return lines[:i]
+    return lines
+
+
+def _is_role_address(email: str) -> bool:
+    local = email.split("@", 1)[0].lower()
+    return local in _ROLE_LOCAL_PARTS or local.split(".")[0] in _ROLE_LOCAL_PARTS
+
+
+def _deobfuscate(m: "re.Match[str]") -> str:
+    domain = re.sub(r"\bdot\b", ".", m.group(2), flags=re.IGNORECASE)
+    domain = re.sub(r"[^A-Za-z0-9-]+", ".", domain).strip(".")
+    return f"{m.group(1)}@{domain}".lower()
+
+
+def extract_email(lines: List[str]) -> Tuple[Optional[str], bool]:
+    text = "\n".join(lines)
+    found = [e for e in _EMAIL.findall(text) if not _is_role_address(e)]
+    if found:
+        # First in reading order; the header block comes first anyway
+        return found[0], True
+    if _EMAIL.search(text):
+        # Only role-like local parts: a personal domain (hello@janedoe.dev) may still be the
+        # candidate's own address, so the model decides
+        return None, False
+    # "john [at] example [dot] com" style; a bare " at " also needs a spelled-out "dot"
+    obfuscated = {
+        _deobfuscate(m)
+        for m in _OBFUSCATED_EMAIL.finditer(text)
+        if re.search(r"[\[(]|\bdot\b", m.group(0), re.IGNORECASE)
+    }
+    obfuscated = {e for e in obfuscated if _EMAIL.fullmatch(e) and not _is_role_address(e)}
+    if len(obfuscated) == 1:
+        return obfuscated.pop(), True
+    return None, not obfuscated
+
+
+def normalize_phone(raw: str) -> Optional[str]:
+    """E.164-style `+<digits>` (or bare digits without a country code), None if not a phone."""
+    candidate = raw.strip()
+    if (_YEARS_ONLY.match(candidate) or _DATE_LIKE.match(candidate) or _RANGE_LIKE.search(candidate)
+            or _ZIP_PLUS4.match(candidate)):
+        return None
+    digits = re.sub(r"\D", "", candidate)
+    if candidate.startswith("00"):
+        digits, candidate = digits[2:], "+" + candidate[2:]
+    if not 7 <= len(digits) <= 15:
+        return None
+    if candidate.startswith("+"):
+        for cc_len in (1, 2, 3):
+            lengths = _NSN_LENGTHS.get(digits[:cc_len])
+            if lengths is not None:
+                return f"+{digits}" if len(digits) - cc_len in lengths else None
+        return f"+{digits}"
+    return digits
+
+
+def extract_phone(lines: List[str]) -> Tuple[Optional[str], bool]:
+    """Resolved only for a number on a phone-labelled line or with real phone grouping.
+
+    Any other digit run (an ID, an ungrouped number) leaves the field to the model.
+    """
+    found: List[Tuple[str, str, bool, bool]] = []
+    for line in lines:
+        for m in _PHONE.finditer(line):
+            raw = m.group(1).strip()
+            norm = normalize_phone(raw)
+            if norm:
+                found.append((raw, norm, bool(_PHONE_LABEL.search(line)), bool(_PHONE_GROUPED.match(raw))))
+    if not found:
+        return None, True
+    # Prefer a labelled number, else the first grouped one in reading order
+    chosen = next((f for f in found if f[2]), None) or next((f for f in found if f[3]), None)
+    if chosen is None:
+        return None, False
+    raw, norm = chosen[0], chosen[1]
+    # Same digits seen with a country code elsewhere: use that version
+    for other_raw, other_norm, _, _ in found:
+        if other_norm.startswith("+") and not norm.startswith("+") and other_norm.endswith(norm.lstrip("0")):
+            raw, norm = other_raw, other_norm
+            break
+    if PHONE_FORMAT == "e164":
+        return norm, True
+    return raw, True
+
+
+def _clean_name(candidate: str) -> Optional[str]:
+    text = re.split(r"\s*[|,•·–—]\s*|\s{3,}", candidate.strip())[0].strip()
+    tokens = text.split()
+    if not 2 <= len(tokens) <= 4:
+        return None
+    if any(not _NAME_TOKEN.match(t) for t in tokens):
+        return None
+    if any(t.lower().strip(".") in _NOT_NAME_WORDS for t in tokens):
+        return None
+    return text
+
+
+def _is_contact_line(line: str) -> bool:
+    return bool(_EMAIL.search(line)) or any(normalize_phone(m.group(1)) for m in _PHONE.finditer(line))
+
+
+def extract_name(lines: List[str]) -> Tuple[Optional[str], bool]:
+    """Only the high-confidence patterns: a `Name:` label, or a clean first line directly
+    followed by (or sharing its line with) the email or phone."""
+    header = [line for line in lines[:HEADER_LINES] if line.strip()]
+    for line in header:
+        m = _NAME_LABEL.match(line)
+        if m:
+            name = _clean_name(m.group(1))
+            return (name, True) if name else (None, False)
+    if header:
+        # A clean 2-4 word first line alone may be a title ("Registered Nurse")
+        name = _clean_name(header[0])
+        if name and (_is_contact_line(header[0]) or (len(header) > 1 and _is_contact_line(header[1]))):
+            return name, True
+    return None, False
+
+
+def extract_contacts(resume_text: str) -> Dict[str, Tuple[Any, bool]]:
+    """{field: (value, resolved)} for name, email and phone."""
+    lines = _lines_before_references(resume_text)
+    return {
+        "name": extract_name(lines),
+        "email": extract_email(lines),
+        "phone": extract_phone(lines),
+    }
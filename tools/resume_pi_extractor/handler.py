@@ -1,13 +1,17 @@
 from typing import Any, Dict
-import json
 
 from strands import Agent
 
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from json_repair import extract_json
 from logging_config import get_logger
+from result_check import ResultModel
 from tools import resume_pi_extractor
 
 
 _logger = get_logger(__name__)
+# Typed view of the result returned through the gateway; violations are logged, numbers coerced
+RESULT_MODEL = ResultModel(OUTPUT_SCHEMA)
 
 
 def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
@@ -22,9 +26,12 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
     text = "".join(text_chunks).strip()
     _logger.info("ResumePI output text: %s", text)
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        result, errors = RESULT_MODEL.validate(extract_json(text))
+    except ValueError:
         _logger.error("Tool text not JSON: %s", text[:500])
         return {"error": "Tool returned non-JSON output"}
+    if errors:
+        _logger.warning("ResumePI result does not match OUTPUT_SCHEMA: %s", errors[:5])
+    return result
 
 
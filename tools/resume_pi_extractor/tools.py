@@ -1,62 +1,114 @@
-from typing import Any
+from typing import Any, Dict, List
 import json
-import os
+import time
 
-import boto3
 from strands import tool
 
-from constants import RESUME_PI_PROMPT
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from bedrock_runtime import DEFAULT_MODEL_ID, invoke_messages
+from constants import RESUME_PI_FALLBACK_PROMPT, RESUME_PI_FIELD_RULES, RESUME_PI_PROMPT
+from contact_rules import HEADER_LINES, LOCAL_EXTRACTION_ENABLED, extract_contacts
+from json_repair import extract_json
 from logging_config import get_logger
+from prompt_cache import text_block
+from result_cache import cached_call
+from timeline import build_timeline, summarize_roles, years_of_experience
 
 
 _logger = get_logger(__name__)
 
+PI_FIELDS = ("name", "email", "phone", "years_of_experience")
+
+
+def _fallback_prompt(fields: List[str]) -> str:
+    schema = "{\n" + ",\n".join(
+        f'  "{f}": <integer | "unknown">' if f == "years_of_experience" else f'  "{f}": "<string or null>"'
+        for f in fields
+    ) + "\n}"
+    rules = "\n".join(f"- {RESUME_PI_FIELD_RULES[f]}" for f in fields)
+    return RESUME_PI_FALLBACK_PROMPT.format(schema=schema, rules=rules)
+
+
+def _fallback_schema(fields: List[str]) -> Dict[str, Any]:
+    """OUTPUT_SCHEMA restricted to the fields the fallback prompt asks for."""
+    return {
+        **OUTPUT_SCHEMA,
+        "properties": {f: OUTPUT_SCHEMA["properties"][f] for f in fields},
+        "required": list(fields),
+    }
+
+
+def _parse_object(text: str) -> Dict[str, Any]:
+    try:
+        data = extract_json(text)
+    except ValueError:
+        _logger.error(f"ResumePI fallback output not JSON: {text[:200]}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _full_prompt_call(resume_text: str) -> str:
+    content = [
+        text_block(RESUME_PI_PROMPT.strip(), cache=True),
+        text_block(f"resume_text:\n{resume_text}"),
+    ]
+    return cached_call(
+        "resume_pi_extractor",
+        RESUME_PI_PROMPT,
+        DEFAULT_MODEL_ID,
+        {"resume_text": resume_text},
+        lambda: invoke_messages(content, label="ResumePI", max_tokens=4000, output_schema=OUTPUT_SCHEMA),
+    )
+
 
 @tool(name="resume_pi_extractor")
 def resume_pi_extractor(resume_text: str) -> str:
     """Extracts name, email, phone, and years_of_experience; returns ONLY JSON string."""
-    region = os.getenv("BEDROCK_REGION", os.getenv("AWS_REGION", "us-east-1"))
-    model_id = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20240620-v1:0")
-    client = boto3.client("bedrock-runtime", region_name=region)
-
-    body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 4000,
-        "temperature": 0,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": RESUME_PI_PROMPT.strip()},
-                    {"type": "text", "text": f"resume_text:\n{resume_text}"},
-                ],
-            }
-        ],
-    }
+    if not LOCAL_EXTRACTION_ENABLED:
+        text = _full_prompt_call(resume_text)
+        _logger.info("ResumePI output", extra={"len": len(text)})
+        return text
 
-    resp = client.invoke_model(
-        modelId=model_id,
-        accept="application/json",
-        contentType="application/json",
-        body=json.dumps(body),
+    t0 = time.perf_counter()
+    local = extract_contacts(resume_text)
+    result: Dict[str, Any] = {f: value for f, (value, resolved) in local.items() if resolved}
+    timeline = build_timeline(resume_text)
+    years = years_of_experience(timeline)
+    if years is not None:
+        result["years_of_experience"] = years
+    _logger.info(
+        f"ResumePI timeline total_months={timeline['total_months']} claim={timeline['explicit_claim']} "
+        f"roles={json.dumps(summarize_roles(timeline))}"
+    )
+    open_fields = [f for f in PI_FIELDS if f not in result]
+    _logger.info(
+        f"ResumePI local fields={sorted(result)} open={open_fields} us={(time.perf_counter() - t0) * 1e6:.0f}"
     )
-    raw = resp["body"].read()
-    if not raw:
-        raise RuntimeError("Empty response body from Bedrock")
-    try:
-        payload_out = json.loads(raw)
-    except json.JSONDecodeError as e:
-        _logger.error("Failed to parse Bedrock response: %s", raw)
-        raise
-    contents = []
-    output_obj = payload_out.get("output")
-    if isinstance(output_obj, dict):
-        contents = output_obj.get("content", []) or []
-    elif isinstance(payload_out.get("content"), list):
-        contents = payload_out.get("content", [])
-    text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict) and c.get("type") == "text"]
-    text = "".join(text_chunks).strip()
-    _logger.info("ResumePI output", extra={"len": len(text)})
-    return text
 
+    if open_fields:
+        prompt = _fallback_prompt(open_fields)
+        # Contact fields live in the header; only years needs the whole resume
+        excerpt = resume_text
+        if "years_of_experience" not in open_fields:
+            excerpt = "\n".join(resume_text.splitlines()[: HEADER_LINES * 2])
+        content = [
+            text_block(prompt.strip()),
+            text_block(f"resume_text:\n{excerpt}"),
+        ]
+        text = cached_call(
+            "resume_pi_extractor",
+            prompt,
+            DEFAULT_MODEL_ID,
+            {"resume_text": excerpt, "fields": open_fields},
+            lambda: invoke_messages(
+                content, label="ResumePI", max_tokens=300, output_schema=_fallback_schema(open_fields)
+            ),
+        )
+        model_out = _parse_object(text)
+        for f in open_fields:
+            default = "unknown" if f == "years_of_experience" else None
+            result[f] = model_out.get(f, default)
 
+    out = json.dumps({f: result.get(f) for f in PI_FIELDS})
+    _logger.info("ResumePI output", extra={"len": len(out)})
+    return out
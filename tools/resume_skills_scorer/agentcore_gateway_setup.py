@@ -1,6 +1,42 @@
 from typing import Any, Dict
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "skills": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "skill": {"type": "string"},
+                    "score": {"type": "integer", "minimum": 0, "maximum": 10},
+                    "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+                    "justification": {"type": "string"},
+                    "resume_evidence": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "source": {"type": "string", "enum": ["applied", "validated", "keyword"]},
+                                "excerpt": {"type": "string"},
+                            },
+                            "required": ["source", "excerpt"],
+                        },
+                    },
+                    "jd_context_used": {"type": "string"},
+                    "notes": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["skill", "score", "confidence", "justification", "resume_evidence", "jd_context_used", "notes"],
+            },
+        },
+    },
+    "required": ["skills"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -34,9 +70,24 @@ def create_or_update_gateway_target(
                                             "required": ["skill", "jd_context"],
                                         },
                                     },
+                                    "partial_results_key": {"type": "string"},
+                                    "evidence_pack": {
+                                        "type": "array",
+                                        "items": {
+                                            "type": "object",
+                                            "properties": {
+                                                "skill": {"type": "string"},
+                                                "found": {"type": "boolean"},
+                                                "occurrences": {"type": "integer"},
+                                                "lines": {"type": "array", "items": {"type": "object"}},
+                                            },
+                                            "required": ["skill", "lines"],
+                                        },
+                                    },
                                 },
                                 "required": ["resume_text", "skills_with_context"],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                     ]
                 },
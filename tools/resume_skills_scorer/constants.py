@@ -175,3 +175,31 @@ GUARDRAILS
 """
 
 
+
+
+# Replaces resume_text when the agent sends an evidence pack (see its skill_index.py)
+EVIDENCE_PACK_NOTE = """
+resume_text is replaced by evidence_pack: for each skill, the verbatim resume lines containing the skill
+name, one of its aliases ("via": "alias") or a one-hop associated technology ("via": "associated"), with
+1-based line numbers and character offsets. found=true means the exact skill or an alias occurs (FOUND);
+associated-only hits follow the SEMANTIC SKILL ASSOCIATION rules. Lines with different line numbers are
+distinct resume locations. Take excerpts only from these lines. Score and return ONLY the skills present in
+evidence_pack; the others are scored separately from the full resume.
+"""
+
+# Appended when a full-resume call scores only some of the job's skills (skills without evidence
+# lines, re-asks); skills_with_context stays the whole job list so the cached prefix is shared
+SCORE_ONLY_NOTE = """
+Score and return ONLY the skills named in score_only; the other skills of skills_with_context are scored
+separately.
+"""
+
+
+# Appended when line_refs.py is enabled: evidence is cited by line id and rebuilt by the tool
+LINE_REFS_NOTE = """
+EVIDENCE BY LINE ID: resume_text is given as numbered lines "[12] ..." (long lines are split into
+sentences "[12.1] ... [12.2] ..."); evidence_pack lines carry their "line" number. In resume_evidence do
+not copy text: replace "excerpt" with "lines", the ids of the 1–2 lines or sentences holding the evidence,
+e.g. {"source": "applied", "lines": ["12", "14.2"]}. Cite only ids you were shown; the verbatim excerpt
+is rebuilt from them.
+"""
@@ -1,13 +1,17 @@
 from typing import Any, Dict, List
-import json
 
 from strands import Agent
 
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from json_repair import extract_json
 from logging_config import get_logger
+from result_check import ResultModel
 from tools import resume_skills_scorer
 
 
 _logger = get_logger(__name__)
+# Typed view of the result returned through the gateway; violations are logged, numbers coerced
+RESULT_MODEL = ResultModel(OUTPUT_SCHEMA)
 
 
 def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
@@ -17,11 +21,19 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
         return {"error": "Missing or invalid 'resume_text' (str) or 'skills_with_context' (list)"}
 
     agent = Agent(tools=[resume_skills_scorer])
-    result = agent.tool.resume_skills_scorer(resume_text=resume_text, skills_with_context=skills_with_context)
+    result = agent.tool.resume_skills_scorer(
+        resume_text=resume_text,
+        skills_with_context=skills_with_context,
+        partial_results_key=(event or {}).get("partial_results_key"),
+        evidence_pack=(event or {}).get("evidence_pack"),
+    )
     contents = result.get("content", [])
     text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict)]
     text = "".join(text_chunks).strip()
     _logger.info("ResumeSkillsScorer output text: %s", text)
-    return json.loads(text)
+    result, errors = RESULT_MODEL.validate(extract_json(text))
+    if errors:
+        _logger.warning("ResumeSkillsScorer result does not match OUTPUT_SCHEMA: %s", errors[:5])
+    return result
 
 
@@ -0,0 +1,124 @@
+import os
+import re
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+# Evidence by reference: the model cites resume line ids ("lines": ["12", "14.2"]) instead of
+# copying excerpts, and the tool rebuilds each excerpt from the cited lines of the original text.
+LINE_REFS_ENABLED: bool = os.getenv("EVIDENCE_LINE_REFS", "true").lower() in ("1", "true", "yes")
+# Lines longer than this are numbered per sentence ("12.1", "12.2") so a citation stays short
+UNIT_CHARS: int = int(os.getenv("EVIDENCE_LINE_REFS_UNIT_CHARS", "240"))
+
+_BULLET = re.compile(r"^[•·▪◦*\-–]\s+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=\S)")
+_REF = re.compile(r"^\[?L?(\d+(?:\.\d+)?)\]?$", re.IGNORECASE)
+EXCERPT_JOIN = " ... "
+
+
+def resume_units(resume_text: str) -> Dict[str, str]:
+    """Citable units of the resume in reading order: id -> verbatim text.
+
+    Non-empty lines are numbered 1-based like the resume's own lines; a line longer than
+    UNIT_CHARS is also split into sentences "<line>.<k>" (the line id still cites all of it).
+    """
+    units: Dict[str, str] = {}
+    for line_no, raw in enumerate(resume_text.splitlines(), start=1):
+        line = _BULLET.sub("", raw.strip())
+        if not line:
+            continue
+        units[str(line_no)] = line
+        if len(line) > UNIT_CHARS:
+            sentences = [s for s in _SENTENCE_END.split(line) if s.strip()]
+            if len(sentences) > 1:
+                for k, sentence in enumerate(sentences, start=1):
+                    units[f"{line_no}.{k}"] = sentence.strip()
+    return units
+
+
+def numbered(units: Dict[str, str]) -> str:
+    """Resume text as the model sees it: "[id] text" per line; a split line is "[12.1] ... [12.2] ..."."""
+    out = []
+    for ref, text in units.items():
+        sub = ref.partition(".")[2]
+        if sub == "1":
+            out[-1] = f"[{ref}] {text}"
+        elif sub:
+            out[-1] += f" [{ref}] {text}"
+        else:
+            out.append(f"[{ref}] {text}")
+    return "\n".join(out)
+
+
+def line_refs(entries: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+    """Citable text per line number from {"line", "text"} entries (evidence pack lines, passages).
+
+    Bullets are stripped as in resume_units, so excerpts read the same on both paths.
+    """
+    refs: Dict[str, str] = {}
+    for entry in entries:
+        if isinstance(entry, dict) and entry.get("line") is not None and entry.get("text"):
+            ref = str(entry["line"])
+            text = _BULLET.sub("", entry["text"].strip())
+            if text:
+                refs[ref] = f"{refs[ref]} {text}" if ref in refs else text
+    return refs
+
+
+def cite_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Output schema with every evidence "excerpt" property replaced by cited "lines" ids."""
+    out: Dict[str, Any] = {}
+    for key, value in schema.items():
+        if key == "properties" and isinstance(value, dict) and "excerpt" in value:
+            out[key] = {**{k: v for k, v in value.items() if k != "excerpt"},
+                        "lines": {"type": "array", "items": {"type": "string"}}}
+        elif key == "required" and isinstance(value, list):
+            out[key] = ["lines" if k == "excerpt" else k for k in value]
+        elif isinstance(value, dict):
+            out[key] = cite_schema(value)
+        elif isinstance(value, list):
+            out[key] = [cite_schema(v) if isinstance(v, dict) else v for v in value]
+        else:
+            out[key] = value
+    return out
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def resolve_evidence(item: Dict[str, Any], refs: Dict[str, str], haystack: str) -> Tuple[int, int]:
+    """Rebuild the excerpts of `item`'s resume_evidence from cited line ids, in place.
+
+    Ids not in `refs` are dropped, as are excerpts the model wrote out that do not occur in
+    the resume (`haystack` is the normalize()d resume text). Returns (resolved, dropped).
+    """
+    evidence = item.get("resume_evidence")
+    if not isinstance(evidence, list):
+        return 0, 0
+    kept, resolved, dropped = [], 0, 0
+    for entry in evidence:
+        if not isinstance(entry, dict):
+            dropped += 1
+            continue
+        cited = entry.pop("lines", None)
+        if cited is not None:
+            texts = [refs[r] for r in (_ref(c) for c in (cited if isinstance(cited, list) else [cited])) if r in refs]
+            if not texts:
+                dropped += 1
+                continue
+            entry["excerpt"] = EXCERPT_JOIN.join(texts)
+            resolved += 1
+        elif not (isinstance(entry.get("excerpt"), str) and normalize(entry["excerpt"]) in haystack):
+            dropped += 1
+            continue
+        kept.append(entry)
+    item["resume_evidence"] = kept
+    if dropped and not kept and evidence:
+        notes = item.get("notes") if isinstance(item.get("notes"), list) else []
+        item["notes"] = notes + ["cited evidence not found in resume"]
+    return resolved, dropped
+
+
+def _ref(value: Any) -> Optional[str]:
+    m = _REF.match(str(value).strip())
+    return m.group(1) if m else None
@@ -1,68 +1,287 @@
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 import json
-import os
 
-import boto3
 from strands import tool
 
-from constants import RESUME_SKILLS_SCORER_PROMPT
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from bedrock_runtime import invoke_messages, resolve_model_id
+from compact_io import COMPACT_OUTPUT_ENABLED, OutputCodec, input_text
+from constants import EVIDENCE_PACK_NOTE, LINE_REFS_NOTE, RESUME_SKILLS_SCORER_PROMPT, SCORE_ONLY_NOTE
+from json_repair import extract_json
+from line_refs import LINE_REFS_ENABLED, cite_schema, line_refs, normalize, numbered, resolve_evidence, resume_units
 from logging_config import get_logger
+from partial_results import partial_sink
+from prompt_cache import text_block
+from result_cache import cached_call
+from result_check import ResultModel, complete_items
 
 
 _logger = get_logger(__name__)
 
+MODEL_ID = resolve_model_id("RESUME_SKILLS_SCORER_MODEL_ID")
+
+# Short output keys; jd_context_used is a copy of the input, so the model leaves it out
+OUTPUT_CODEC = OutputCodec(
+    {
+        "skills": "k", "skill": "s", "score": "sc", "confidence": "c", "justification": "j",
+        "resume_evidence": "e", "source": "t", "excerpt": "x", "lines": "l", "notes": "n",
+    },
+    omit=("jd_context_used",),
+)
+OUTPUT_NOTE = OUTPUT_CODEC.note() if COMPACT_OUTPUT_ENABLED else ""
+PLAIN_CODEC = OutputCodec({})
+ITEM_MODEL = ResultModel(OUTPUT_SCHEMA).items("skills")
+
+
+def _valid(item: Any) -> bool:
+    """Partial results keep valid items only; invalid ones are re-asked."""
+    return not ITEM_MODEL.validate(item)[1]
+
+
+def _unscored(skills_with_context: List[Dict[str, str]]) -> Callable[[str], Dict[str, Any]]:
+    """Placeholder for a skill still missing or invalid after the re-ask, so it stays visible downstream."""
+    contexts = {s.get("skill"): s.get("jd_context", "") for s in skills_with_context}
+
+    def placeholder(skill: str) -> Dict[str, Any]:
+        return {
+            "skill": skill,
+            "score": 0,
+            "confidence": 0.0,
+            "justification": "Not scored: model output missing or invalid after re-ask.",
+            "resume_evidence": [],
+            "jd_context_used": contexts.get(skill, ""),
+            "notes": ["unscored"],
+            "unscored": True,
+        }
+
+    return placeholder
+
+
+def _invoke(
+    content: List[Dict[str, Any]],
+    prompt: str,
+    inputs: Dict[str, Any],
+    skills_with_context: List[Dict[str, str]],
+    sink: Optional[Callable[[Optional[str], Any], None]],
+    refs_for: Optional[Callable[[Dict[str, Any]], Dict[str, str]]] = None,
+    resume_text: str = "",
+) -> str:
+    """Model call through the result cache, returning the full output schema.
+
+    With `refs_for` (the citable lines for a scored item) the model cites evidence by line id
+    and the excerpts are rebuilt from `resume_text`.
+    """
+    note = "\n".join(n.strip() for n in (LINE_REFS_NOTE if refs_for else "", OUTPUT_NOTE) if n)
+    if not note:
+        return cached_call(
+            "resume_skills_scorer", prompt, MODEL_ID, inputs,
+            lambda: invoke_messages(
+                content, label="ResumeSkillsScorer", model_id=MODEL_ID, on_element=sink, output_schema=OUTPUT_SCHEMA
+            ),
+        )
+    codec = OUTPUT_CODEC if OUTPUT_NOTE else PLAIN_CODEC
+    # The schema the model answers in: line ids instead of excerpts, short keys
+    schema = codec.schema(cite_schema(OUTPUT_SCHEMA) if refs_for else OUTPUT_SCHEMA)
+    contexts = {s.get("skill"): s.get("jd_context", "") for s in skills_with_context}
+    haystack = normalize(resume_text) if refs_for else ""
+    counts = [0, 0]
+
+    def finish(item: Dict[str, Any], count: bool = False) -> None:
+        item.setdefault("jd_context_used", contexts.get(item.get("skill"), ""))
+        if refs_for:
+            resolved, dropped = resolve_evidence(item, refs_for(item), haystack)
+            if count:
+                counts[0] += resolved
+                counts[1] += dropped
+
+    on_element = codec.wrap_sink(sink, finish)
+    text = cached_call(
+        "resume_skills_scorer", prompt + note, MODEL_ID, inputs,
+        lambda: invoke_messages(
+            content + [text_block(note)],
+            label="ResumeSkillsScorer",
+            model_id=MODEL_ID,
+            on_element=on_element,
+            output_schema=schema,
+        ),
+    )
+    text = codec.expand_text(text, lambda item: finish(item, count=True))
+    if refs_for:
+        _logger.info(f"ResumeSkillsScorer evidence refs resolved={counts[0]} dropped={counts[1]}")
+    return text
+
+
+def _items(text: str) -> List[Any]:
+    try:
+        return extract_json(text).get("skills") or []
+    except (ValueError, AttributeError):
+        _logger.error(f"ResumeSkillsScorer model output not JSON: {text[:200]}")
+        return []
+
+
+def _log_check(stats: Dict[str, Any]) -> None:
+    if stats["missing"] or stats["invalid"]:
+        _logger.info(
+            f"ResumeSkillsScorer result check missing={stats['missing']} invalid={stats['invalid']} "
+            f"reasked={stats['reasked']} recovered={stats['recovered']} unscored={stats['unscored']} "
+            f"errors={stats['errors']}"
+        )
+
+
+def _score_pack(
+    resume_text: str,
+    skills_with_context: List[Dict[str, str]],
+    with_evidence: List[Dict[str, Any]],
+    sink: Optional[Callable[[Optional[str], Any], None]],
+) -> List[Any]:
+    """One model call over the evidence pack lines of `with_evidence`; the scored items.
+
+    `skills_with_context` is always the job's full list (the cached job block).
+    """
+    job_in = {"skills_with_context": skills_with_context}
+    payload_in = {"evidence_pack": with_evidence}
+    content = [
+        text_block(RESUME_SKILLS_SCORER_PROMPT.strip(), cache=True),
+        text_block(f"Job input JSON:\n{json.dumps(job_in)}", cache=True),
+        text_block(f"{EVIDENCE_PACK_NOTE.strip()}\n{input_text('Input', payload_in)}"),
+    ]
+    # An item may cite the lines shown for its own skill, or any other pack line
+    shown = line_refs(line for e in with_evidence for line in e["lines"])
+    own = {e.get("skill"): line_refs(e["lines"]) for e in with_evidence}
+
+    def pack_refs(item: Dict[str, Any]) -> Dict[str, str]:
+        return {**shown, **own.get(item.get("skill"), {})}
+
+    return _items(_invoke(
+        content,
+        RESUME_SKILLS_SCORER_PROMPT + EVIDENCE_PACK_NOTE,
+        {**job_in, **payload_in},
+        skills_with_context,
+        sink,
+        pack_refs if LINE_REFS_ENABLED else None,
+        resume_text,
+    ))
+
+
+def _score_evidence_pack(
+    resume_text: str,
+    skills_with_context: List[Dict[str, str]],
+    evidence_pack: List[Dict[str, Any]],
+    partial_results_key: Optional[str],
+) -> str:
+    """Score from per-skill evidence lines.
+
+    Skills without any line (worded differently in the resume, or "Communication skills") are
+    scored by the model from the full resume.
+    """
+    lines_by_skill = {e.get("skill"): e for e in evidence_pack if isinstance(e, dict)}
+    with_evidence = [e for e in evidence_pack if isinstance(e, dict) and e.get("lines")]
+    unmatched = [s for s in skills_with_context if not (lines_by_skill.get(s.get("skill")) or {}).get("lines")]
+    sink = partial_sink(partial_results_key, _valid)
+
+    scored: Dict[str, Any] = {}
+    if with_evidence:
+        names = [e.get("skill") for e in with_evidence]
+
+        def reask(skills: List[str]) -> List[Any]:
+            pack = [e for e in with_evidence if e.get("skill") in skills]
+            return _score_pack(resume_text, skills_with_context, pack, sink)
+
+        items, stats = complete_items(
+            names, _score_pack(resume_text, skills_with_context, with_evidence, sink), "skill", ITEM_MODEL, reask,
+            leftovers=False, unscored=_unscored(skills_with_context),
+        )
+        _log_check(stats)
+        scored = {name: item for name, item in zip(names, items) if item}
+    if unmatched:
+        scored.update(_score_full(resume_text, skills_with_context, sink, [s.get("skill") for s in unmatched]))
+    _logger.info(
+        f"ResumeSkillsScorer evidence pack skills_with_evidence={len(with_evidence)} full_resume={len(unmatched)}"
+    )
+    skills = [scored.get(s.get("skill")) for s in skills_with_context]
+    return json.dumps({"skills": [item for item in skills if item]})
+
+
+def _score_resume(
+    resume_text: str,
+    skills_with_context: List[Dict[str, str]],
+    sink: Optional[Callable[[Optional[str], Any], None]],
+    only: Optional[List[str]] = None,
+) -> List[Any]:
+    """One model call over the full resume; the scored items (only the skills named in `only`, if given)."""
+    # Job-scoped inputs form a second cacheable prefix shared by every candidate of the job
+    job_in = {"skills_with_context": skills_with_context}
+    units = resume_units(resume_text) if LINE_REFS_ENABLED else {}
+    payload_in: Dict[str, Any] = {"resume_text": numbered(units) if units else resume_text}
+    note = ""
+    if only is not None:
+        # The subset goes in the uncached candidate block, not the job block
+        payload_in["score_only"] = only
+        note = SCORE_ONLY_NOTE
+
+    content = [
+        text_block(RESUME_SKILLS_SCORER_PROMPT.strip(), cache=True),
+        text_block(f"Job input JSON:\n{json.dumps(job_in)}", cache=True),
+        text_block(f"{note.strip()}\n{input_text('Input', payload_in)}" if note else input_text("Input", payload_in)),
+    ]
+    return _items(_invoke(
+        content,
+        RESUME_SKILLS_SCORER_PROMPT + note,
+        {**job_in, **payload_in},
+        skills_with_context,
+        sink,
+        (lambda item: units) if units else None,
+        resume_text,
+    ))
+
+
+def _score_full(
+    resume_text: str,
+    skills_with_context: List[Dict[str, str]],
+    sink: Optional[Callable[[Optional[str], Any], None]],
+    only: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Validated items scored from the full resume (re-asking for failed ones), by skill.
+
+    With `only`, just those skills are scored; `skills_with_context` stays the job's full list.
+    """
+    names = only if only is not None else [s.get("skill") for s in skills_with_context]
+
+    def reask(skills: List[str]) -> List[Any]:
+        return _score_resume(resume_text, skills_with_context, sink, skills)
+
+    items, stats = complete_items(
+        names, _score_resume(resume_text, skills_with_context, sink, only), "skill", ITEM_MODEL, reask,
+        leftovers=only is None, unscored=_unscored(skills_with_context),
+    )
+    _log_check(stats)
+    return {name: item for name, item in zip(names, items) if item}
+
 
 @tool(name="resume_skills_scorer")
-def resume_skills_scorer(resume_text: str, skills_with_context: List[Dict[str, str]]) -> str:
+def resume_skills_scorer(
+    resume_text: str,
+    skills_with_context: List[Dict[str, str]],
+    partial_results_key: Optional[str] = None,
+    evidence_pack: Optional[List[Dict[str, Any]]] = None,
+) -> str:
     """Scores required skills against a resume; returns ONLY JSON string.
 
     Args:
         resume_text: Full resume text.
         skills_with_context: List of {"skill": str, "jd_context": str}.
+        partial_results_key: Optional key under which scored skills are written as they stream.
+        evidence_pack: Optional per-skill resume lines located by the agent's skill index; when given
+            the model sees these lines instead of resume_text (except for skills without lines).
     """
-    region = os.getenv("BEDROCK_REGION", os.getenv("AWS_REGION", "us-east-1"))
-    model_id = (
-        os.getenv("RESUME_SKILLS_SCORER_MODEL_ID")
-        or os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20240620-v1:0")
-    )
-    client = boto3.client("bedrock-runtime", region_name=region)
-
-    payload_in = {
-        "resume_text": resume_text,
-        "skills_with_context": skills_with_context or [],
-    }
-
-    body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 40000,
-        "temperature": 0,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": RESUME_SKILLS_SCORER_PROMPT.strip()},
-                    {"type": "text", "text": f"Input JSON:\n{json.dumps(payload_in)}"},
-                ],
-            }
-        ],
-    }
-
-    resp = client.invoke_model(
-        modelId=model_id,
-        accept="application/json",
-        contentType="application/json",
-        body=json.dumps(body),
-    )
-    payload_out = json.loads(resp["body"].read())
-    contents = []
-    output_obj = payload_out.get("output")
-    if isinstance(output_obj, dict):
-        contents = output_obj.get("content", []) or []
-    elif isinstance(payload_out.get("content"), list):
-        contents = payload_out.get("content", [])
-    text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict) and c.get("type") == "text"]
-    text = "".join(text_chunks).strip()
+    if evidence_pack:
+        text = _score_evidence_pack(resume_text or "", skills_with_context or [], evidence_pack, partial_results_key)
+        _logger.info("ResumeSkillsScorer output", extra={"len": len(text)})
+        return text
+
+    skills = skills_with_context or []
+    scored = _score_full(resume_text or "", skills, partial_sink(partial_results_key, _valid))
+    items = [scored.get(s.get("skill")) for s in skills]
+    text = json.dumps({"skills": [item for item in items if item]})
     _logger.info("ResumeSkillsScorer output", extra={"len": len(text)})
     return text
-
-
@@ -1,6 +1,18 @@
 from typing import Any, Dict
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "sparse_resume": {"type": "boolean"},
+        "reason": {"type": "string"},
+    },
+    "required": ["sparse_resume", "reason"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -25,6 +37,7 @@ def create_or_update_gateway_target(
                                 },
                                 "required": ["resume_text"],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                     ]
                 },
@@ -1,13 +1,17 @@
 from typing import Any, Dict
-import json
 
 from strands import Agent
 
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from json_repair import extract_json
 from logging_config import get_logger
+from result_check import ResultModel
 from tools import resume_sparse_checker
 
 
 _logger = get_logger(__name__)
+# Typed view of the result returned through the gateway; violations are logged, numbers coerced
+RESULT_MODEL = ResultModel(OUTPUT_SCHEMA)
 
 
 def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
@@ -21,6 +25,9 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
     text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict)]
     text = "".join(text_chunks).strip()
     _logger.info("ResumeSparseChecker output text: %s", text)
-    return json.loads(text)
+    result, errors = RESULT_MODEL.validate(extract_json(text))
+    if errors:
+        _logger.warning("ResumeSparseChecker result does not match OUTPUT_SCHEMA: %s", errors[:5])
+    return result
 
 
@@ -0,0 +1,32 @@
+import logging
+import os
+from typing import Any, Dict
+
+
+# Bedrock prompt caching: static prompt text (and job-scoped inputs) are sent as
+# separate content blocks marked as cache checkpoints so repeated calls reuse the
+# cached prefix. Disable for models that do not support prompt caching.
+PROMPT_CACHE_ENABLED: bool = os.getenv("BEDROCK_PROMPT_CACHE", "true").lower() in ("1", "true", "yes")
+
+
+def text_block(text: str, cache: bool = False) -> Dict[str, Any]:
+    """Build a Messages API text block; mark it as a cache checkpoint when `cache` is set."""
+    block: Dict[str, Any] = {"type": "text", "text": text}
+    if cache and PROMPT_CACHE_ENABLED:
+        block["cache_control"] = {"type": "ephemeral"}
+    return block
+
+
+def log_usage(logger: logging.Logger, label: str, payload: Dict[str, Any]) -> None:
+    """Log token usage including cache read/write counts from a Bedrock response payload."""
+    usage = payload.get("usage") if isinstance(payload, dict) else None
+    if not isinstance(usage, dict):
+        return
+    logger.info(
+        "%s usage input_tokens=%s output_tokens=%s cache_read_tokens=%s cache_write_tokens=%s",
+        label,
+        usage.get("input_tokens", 0),
+        usage.get("output_tokens", 0),
+        usage.get("cache_read_input_tokens", 0),
+        usage.get("cache_creation_input_tokens", 0),
+    )
@@ -0,0 +1,119 @@
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+
+# The indicators of RESUME_SPARSE_CHECK_PROMPT, checked deterministically. Clear-cut
+# resumes (none fired, or at least SPARSE_RULES_MIN_FIRED fired) are answered here;
+# anything in between still goes to the model.
+PRECHECK_ENABLED: bool = os.getenv("SPARSE_PRECHECK", "true").lower() in ("1", "true", "yes")
+MIN_FIRED_FOR_SPARSE = int(os.getenv("SPARSE_RULES_MIN_FIRED", "3"))
+
+INDICATORS = (
+    "no_experience_section",
+    "no_companies_or_dates",
+    "only_profile_sections",
+    "few_action_bullets",
+    "no_applied_verbs",
+)
+
+_EXPERIENCE_HEADERS = re.compile(
+    r"^(?:professional |work |relevant |employment |career )?"
+    r"(?:experience|experiences|employment(?: history)?|work history|career history|positions held)$"
+)
+_PROFILE_HEADERS = re.compile(
+    r"^(?:professional |career )?(?:summary|profile|objective|about me|skills|technical skills|key skills|core competencies|"
+    r"competencies|education|academic background|certifications?|certificates|languages|interests|hobbies|contact|"
+    r"contact information|references|awards|achievements)$"
+)
+_OTHER_WORK_HEADERS = re.compile(r"^(?:projects|key projects|personal projects|internships?|freelance|volunteer(?:ing| experience)?)$")
+
+_MONTHS = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = re.compile(
+    rf"\b{_MONTHS}\s*'?\d{{2,4}}\b"
+    r"|\b(?:0?[1-9]|1[0-2])[/.-](?:19|20)\d{2}\b"
+    r"|\b(?:19|20)\d{2}\s*(?:-|–|—|to)\s*(?:(?:19|20)\d{2}|present|current|now|date)\b",
+    re.IGNORECASE,
+)
+_COMPANY = re.compile(
+    r"\b[A-Z][\w&.-]*(?:\s+[A-Z][\w&.-]*)*\s+(?:Inc|LLC|Ltd|Limited|Corp|Corporation|Co|Company|GmbH|AG|PLC|Pvt|"
+    r"Technologies|Solutions|Systems|Labs|Group|Consulting|Bank|Partners)\b\.?"
+)
+_BULLET = re.compile(r"^\s*(?:[•·▪◦●○■□►▸‣\-–—*+]|\d{1,2}[.)])\s+(\S.*)$")
+_APPLIED_VERBS = (
+    "built", "developed", "designed", "implemented", "managed", "optimized", "optimised", "led", "created",
+    "delivered", "launched", "migrated", "automated", "architected", "deployed", "maintained", "improved",
+    "reduced", "increased", "integrated", "engineered", "established", "coordinated", "analyzed", "analysed",
+    "refactored", "supported", "owned", "drove", "mentored", "scaled", "wrote", "tested", "configured",
+)
+_APPLIED_VERB = re.compile(r"\b(?:" + "|".join(_APPLIED_VERBS) + r")\b", re.IGNORECASE)
+
+
+def _header(line: str) -> Optional[str]:
+    """Normalized section name if the line looks like a header, else None."""
+    text = line.strip().strip(":#*=_-–— ").strip()
+    if not text or len(text) > 40 or len(text.split()) > 4:
+        return None
+    if not (line.rstrip().endswith(":") or text.isupper() or text.istitle() or line.lstrip().startswith("#")):
+        return None
+    return re.sub(r"\s+", " ", text.lower().replace("&", "and"))
+
+
+def indicators(resume_text: str) -> Dict[str, Any]:
+    """Evaluate every sparse indicator; returns the fired flags and the counts behind them."""
+    lines = resume_text.splitlines()
+    headers: List[str] = [h for h in (_header(line) for line in lines) if h]
+    has_experience = any(_EXPERIENCE_HEADERS.match(h) for h in headers)
+    work_sections = has_experience or any(_OTHER_WORK_HEADERS.match(h) for h in headers)
+    profile_only = not work_sections and any(_PROFILE_HEADERS.match(h) for h in headers)
+    dates = len(_DATE.findall(resume_text))
+    companies = len(_COMPANY.findall(resume_text))
+    action_bullets = 0
+    for line in lines:
+        m = _BULLET.match(line)
+        if m and len(m.group(1).split()) >= 4 and _APPLIED_VERB.search(m.group(1)):
+            action_bullets += 1
+    verbs = len(_APPLIED_VERB.findall(resume_text))
+    fired = {
+        "no_experience_section": not has_experience,
+        "no_companies_or_dates": dates == 0 and companies == 0,
+        "only_profile_sections": profile_only,
+        "few_action_bullets": action_bullets < 3,
+        "no_applied_verbs": verbs == 0,
+    }
+    return {
+        "fired": fired,
+        "count": sum(fired.values()),
+        "headers": headers,
+        "dates": dates,
+        "companies": companies,
+        "action_bullets": action_bullets,
+        "applied_verbs": verbs,
+    }
+
+
+def _sparse_reason(fired: Dict[str, bool]) -> str:
+    phrases = {
+        "no_experience_section": "no experience section",
+        "no_companies_or_dates": "no company names or dates",
+        "only_profile_sections": "only skills/summary/education",
+        "few_action_bullets": "fewer than 3 action bullets",
+        "no_applied_verbs": "no applied work verbs",
+    }
+    listed = [phrases[k] for k in INDICATORS if fired[k]]
+    return (", ".join(listed[:4]) + ".").capitalize()
+
+
+def precheck(resume_text: str) -> Optional[Dict[str, Any]]:
+    """The tool's JSON answer for a clear-cut resume, or None when the model should decide."""
+    if not PRECHECK_ENABLED:
+        return None
+    ev = indicators(resume_text)
+    if ev["count"] == 0:
+        return {
+            "sparse_resume": False,
+            "reason": f"Experience section with dated roles and {ev['action_bullets']} applied action bullets.",
+        }
+    if ev["count"] >= MIN_FIRED_FOR_SPARSE:
+        return {"sparse_resume": True, "reason": _sparse_reason(ev["fired"])}
+    return None
@@ -1,12 +1,16 @@
 from typing import Any
 import json
-import os
+import time
 
-import boto3
 from strands import tool
 
+from agentcore_gateway_setup import OUTPUT_SCHEMA
+from bedrock_runtime import DEFAULT_MODEL_ID, invoke_messages
 from constants import RESUME_SPARSE_CHECK_PROMPT
 from logging_config import get_logger
+from prompt_cache import text_block
+from result_cache import cached_call
+from sparse_rules import precheck
 
 
 _logger = get_logger(__name__)
@@ -15,41 +19,25 @@ _logger = get_logger(__name__)
 @tool(name="resume_sparse_checker")
 def resume_sparse_checker(resume_text: str) -> str:
     """Checks if a resume is sparse; returns ONLY JSON string with fields sparse_resume and reason."""
-    region = os.getenv("BEDROCK_REGION", os.getenv("AWS_REGION", "us-east-1"))
-    model_id = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20240620-v1:0")
-    client = boto3.client("bedrock-runtime", region_name=region)
-
-    body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 4000,
-        "temperature": 0,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": RESUME_SPARSE_CHECK_PROMPT.strip()},
-                    {"type": "text", "text": f"resume_text:\n{resume_text}"},
-                ],
-            }
-        ],
-    }
-
-    resp = client.invoke_model(
-        modelId=model_id,
-        accept="application/json",
-        contentType="application/json",
-        body=json.dumps(body),
+    t0 = time.perf_counter()
+    decided = precheck(resume_text)
+    if decided is not None:
+        _logger.info(
+            f"ResumeSparseChecker decided by rules sparse={decided['sparse_resume']} "
+            f"us={(time.perf_counter() - t0) * 1e6:.0f}"
+        )
+        return json.dumps(decided)
+    _logger.info(f"ResumeSparseChecker borderline, calling model rules_us={(time.perf_counter() - t0) * 1e6:.0f}")
+    content = [
+        text_block(RESUME_SPARSE_CHECK_PROMPT.strip(), cache=True),
+        text_block(f"resume_text:\n{resume_text}"),
+    ]
+    text = cached_call(
+        "resume_sparse_checker",
+        RESUME_SPARSE_CHECK_PROMPT,
+        DEFAULT_MODEL_ID,
+        {"resume_text": resume_text},
+        lambda: invoke_messages(content, label="ResumeSparseChecker", max_tokens=4000, output_schema=OUTPUT_SCHEMA),
     )
-    payload_out = json.loads(resp["body"].read())
-    contents = []
-    output_obj = payload_out.get("output")
-    if isinstance(output_obj, dict):
-        contents = output_obj.get("content", []) or []
-    elif isinstance(payload_out.get("content"), list):
-        contents = payload_out.get("content", [])
-    text_chunks = [c.get("text", "") for c in contents if isinstance(c, dict) and c.get("type") == "text"]
-    text = "".join(text_chunks).strip()
     _logger.info("ResumeSparseChecker output", extra={"len": len(text)})
     return text
-
-
@@ -1,6 +1,20 @@
 from typing import Any, Dict
 
 
+# Shape of the tool's JSON result: registered as the MCP tool's outputSchema and sent to Bedrock
+# as the schema of the forced result tool (bedrock_runtime.invoke_messages output_schema).
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "match_score": {"type": "number", "minimum": 0, "maximum": 10},
+        "strengths": {"type": "array", "items": {"type": "string"}},
+        "gaps": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["summary", "match_score", "strengths", "gaps"],
+}
+
+
 def create_or_update_gateway_target(
     gateway_client: Any,
     gateway_id: str,
@@ -29,6 +43,7 @@ def create_or_update_gateway_target(
                                 },
                                 "required": ["jd_text", "resume_text"],
                             },
+                            "outputSchema": OUTPUT_SCHEMA,
                         }
                     ]
                 },
@@ -0,0 +1,165 @@
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Re-ask the model for only the items of a list result that are missing or fail validation,
+# instead of failing (or retrying) the whole call
+REASK_ENABLED: bool = os.getenv("RESULT_REASK", "true").lower() in ("1", "true", "yes")
+
+_TYPES = {"object": dict, "array": list, "string": str, "boolean": bool, "null": type(None)}
+_INTEGER = re.compile(r"^-?\d+$")
+_NUMBER = re.compile(r"^-?\d+(?:\.\d+)?$")
+
+Check = Callable[[Any, str], Tuple[Any, List[str]]]
+
+
+def _coerce(value: Any, allowed: Tuple[str, ...]) -> Tuple[Any, bool]:
+    """`value` as one of the `allowed` JSON types: lossless number fixes only ("7", 7.0 -> 7)."""
+    for name in allowed:
+        if name in ("integer", "number"):
+            if isinstance(value, bool):
+                continue
+            if isinstance(value, int) or (name == "number" and isinstance(value, float)):
+                return value, True
+            if name == "integer" and isinstance(value, float) and value.is_integer():
+                return int(value), True
+            if isinstance(value, str) and (_INTEGER if name == "integer" else _NUMBER).match(value.strip()):
+                return (int if name == "integer" else float)(value.strip()), True
+        elif isinstance(value, _TYPES[name]):
+            return value, True
+    return value, False
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    """Checker for one schema node, built once: (value, path) -> (coerced value, errors)."""
+    if "anyOf" in schema:
+        options = [_compile(s) for s in schema["anyOf"]]
+
+        def any_of(value: Any, path: str) -> Tuple[Any, List[str]]:
+            first: List[str] = []
+            for option in options:
+                out, errors = option(value, path)
+                if not errors:
+                    return out, []
+                first = first or errors
+            return value, first
+
+        return any_of
+
+    types = schema.get("type")
+    allowed = tuple(types) if isinstance(types, list) else (types,) if types else ()
+    enum = schema.get("enum")
+    low, high = schema.get("minimum"), schema.get("maximum")
+    required = schema.get("required") or []
+    properties = {k: _compile(v) for k, v in (schema.get("properties") or {}).items()}
+    items = _compile(schema["items"]) if "items" in schema else None
+
+    def check(value: Any, path: str) -> Tuple[Any, List[str]]:
+        if allowed:
+            value, ok = _coerce(value, allowed)
+            if not ok:
+                return value, [f"{path}: expected {'|'.join(allowed)}, got {type(value).__name__}"]
+        errors: List[str] = []
+        if enum is not None and value not in enum:
+            errors.append(f"{path}: {value!r} is not one of {enum}")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if (low is not None and value < low) or (high is not None and value > high):
+                errors.append(f"{path}: {value} is outside [{low}, {high}]")
+        if isinstance(value, dict) and (properties or required):
+            value = dict(value)
+            errors += [f"{path}.{k}: missing" for k in required if k not in value]
+            for key, sub in properties.items():
+                if key in value:
+                    value[key], sub_errors = sub(value[key], f"{path}.{key}")
+                    errors += sub_errors
+        if isinstance(value, list) and items is not None:
+            checked = [items(v, f"{path}[{i}]") for i, v in enumerate(value)]
+            value = [v for v, _ in checked]
+            errors += [e for _, sub_errors in checked for e in sub_errors]
+        return value, errors
+
+    return check
+
+
+class ResultModel:
+    """Typed model of a tool result, compiled once from its JSON schema (OUTPUT_SCHEMA).
+
+    validate() returns the value with lossless number coercions applied and the list of
+    violations (type, required, enum, minimum/maximum), each prefixed with its JSON path.
+    """
+
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        self.schema = schema
+        self._check = _compile(schema)
+
+    def validate(self, value: Any) -> Tuple[Any, List[str]]:
+        return self._check(value, "$")
+
+    def items(self, key: str) -> "ResultModel":
+        """Model of one element of the result's list `key`."""
+        return ResultModel(self.schema["properties"][key]["items"])
+
+
+def align(
+    expected: Sequence[str], items: Sequence[Any], key: str, leftovers: bool = True
+) -> List[Optional[Dict[str, Any]]]:
+    """Result items in the order of `expected`, matched on their `key` field.
+
+    With `leftovers`, items whose key matches nothing expected (the model reworded it) fill
+    the unmatched slots in order.
+    """
+    dicts = [item for item in items if isinstance(item, dict)]
+    by_key: Dict[Any, Dict[str, Any]] = {}
+    for item in dicts:
+        by_key.setdefault(item.get(key), item)
+    wanted = set(expected)
+    rest = iter([item for item in dicts if item.get(key) not in wanted] if leftovers else [])
+    return [by_key.get(value) or next(rest, None) for value in expected]
+
+
+def complete_items(
+    expected: Sequence[str],
+    items: Sequence[Any],
+    key: str,
+    model: ResultModel,
+    reask: Callable[[List[str]], Sequence[Any]],
+    leftovers: bool = True,
+    unscored: Optional[Callable[[str], Dict[str, Any]]] = None,
+) -> Tuple[List[Optional[Dict[str, Any]]], Dict[str, Any]]:
+    """Validated items aligned with `expected`, re-asking once for the missing or invalid ones.
+
+    `reask(values)` runs a follow-up model call for only those expected values and returns its
+    items. Slots still missing or invalid after it are filled with `unscored(value)`, a placeholder
+    marked as unscored (None without it). Returns (items, stats) with the
+    missing/invalid/reasked/recovered/unscored counts and the first few violations.
+    """
+    out: List[Optional[Dict[str, Any]]] = [None] * len(expected)
+    failed: List[int] = []
+    stats: Dict[str, Any] = {"missing": 0, "invalid": 0, "reasked": 0, "recovered": 0, "unscored": 0, "errors": []}
+    for i, item in enumerate(align(expected, items, key, leftovers)):
+        if item is None:
+            stats["missing"] += 1
+        else:
+            item, errors = model.validate(item)
+            if not errors:
+                out[i] = item
+                continue
+            stats["invalid"] += 1
+            stats["errors"] += errors[: 5 - len(stats["errors"])]
+        failed.append(i)
+    if failed and REASK_ENABLED:
+        values = [expected[i] for i in failed]
+        stats["reasked"] = len(values)
+        for i, item in zip(failed, align(values, reask(values), key, leftovers)):
+            if item is not None:
+                item, errors = model.validate(item)
+                if not errors:
+                    out[i] = item
+                    stats["recovered"] += 1
+    if unscored is not None:
+        for i in failed:
+            if out[i] is None:
+                out[i] = unscored(expected[i])
+                stats["unscored"] += 1
+    return out, stats
@@ -0,0 +1,20 @@
+import { NextResponse } from "next/server";
+import { getPartialResults } from "@/lib/partialResultsRepo";
+
+// Evaluation fields the resume agent streams under `<candidate id>#<field>`, and their list key
+const FIELDS = {
+  skills_eval: "skills",
+  desired_exp_eval: "experiences",
+  education_eval: "education_certification_matching",
+} as const;
+
+/** Items scored so far for a candidate that is still processing, shaped like the final fields. */
+export async function GET(_req: Request, { params }: { params: { id: string } }) {
+  const rows = await getPartialResults(Object.keys(FIELDS).map((field) => `${params.id}#${field}`));
+  const body: Record<string, any> = {};
+  for (const [field, listKey] of Object.entries(FIELDS)) {
+    const items = rows[`${params.id}#${field}`];
+    if (items?.length) body[field] = { [listKey]: items };
+  }
+  return NextResponse.json(body);
+}
@@ -10,9 +10,28 @@ async function fetchCandidate(id: string) {
   return await res.json();
 }
 
+async function fetchPartial(id: string) {
+  const res = await fetch(`/api/candidates/${id}/partial`, { cache: "no-store" });
+  if (!res.ok) return {};
+  return await res.json();
+}
+
 export default function CandidateDetailPage() {
   const params = useParams<{ id: string }>();
-  const { data, isLoading, error } = useQuery({ queryKey: ["candidate", params.id], queryFn: () => fetchCandidate(params.id) });
+  const { data: candidate, isLoading, error } = useQuery({
+    queryKey: ["candidate", params.id],
+    queryFn: () => fetchCandidate(params.id),
+    refetchInterval: (query) => (query.state.data?.status === "processing" ? 3000 : false),
+  });
+  const processing = candidate?.status === "processing";
+  const { data: partial } = useQuery({
+    queryKey: ["candidate-partial", params.id],
+    queryFn: () => fetchPartial(params.id),
+    enabled: processing,
+    refetchInterval: processing ? 2000 : false,
+  });
+  // While the agent runs, show the items scored so far in place of the previous evaluation
+  const data = processing && partial ? { ...candidate, ...partial } : candidate;
   const [tab, setTab] = useState<"summary" | "skills" | "desired" | "education" | "resume">("summary");
 
   const matchScoreRaw = typeof data?.resume_summary?.match_score === "number" ? data.resume_summary.match_score : undefined;
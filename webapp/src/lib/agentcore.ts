@@ -26,6 +26,70 @@ type ResumeProcessOutput = {
   status?: string;
 };
 
+/** Per-node timings and critical path of the agent's tool pipeline (pipeline.py `report()`). */
+export type PipelineTiming = {
+  total_ms: number;
+  critical_path: string[];
+  nodes: Record<string, { ok: boolean; attempts: number; start_ms: number; end_ms: number; duration_ms: number }>;
+};
+
+/** One framed event from a streaming (`stream: true`) agent invocation. */
+export type AgentStreamEvent =
+  | { type: "tool"; id: string; tool: string; field?: string; result?: any; error?: string; elapsed_ms: number }
+  | { type: "summary"; id: string; updated: boolean; completed: string[]; errors: Record<string, string>; elapsed_ms: number; timing: PipelineTiming }
+  | { type: "error"; id: string; error: string };
+
+// The runtime sends generator output as server-sent events: one `data: <json>` line per event.
+async function* readAgentStream(body: any): AsyncGenerator<AgentStreamEvent> {
+  if (!body) return;
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for await (const chunk of body as AsyncIterable<Uint8Array>) {
+    buffer += decoder.decode(chunk, { stream: true });
+    let nl: number;
+    while ((nl = buffer.indexOf("\n")) >= 0) {
+      const line = buffer.slice(0, nl).trim();
+      buffer = buffer.slice(nl + 1);
+      if (line.startsWith("data:")) yield JSON.parse(line.slice(5).trim()) as AgentStreamEvent;
+    }
+  }
+  const rest = buffer.trim();
+  if (rest.startsWith("data:")) yield JSON.parse(rest.slice(5).trim()) as AgentStreamEvent;
+}
+
+async function* streamAgentCore(label: string, arn: string | undefined, payloadObj: Record<string, unknown>): AsyncGenerator<AgentStreamEvent> {
+  const env = getEnv();
+  if (!arn) throw new Error(`${label} AgentCore runtime ARN not configured`);
+  const client = new BedrockAgentCoreClient({ region: env.AWS_REGION });
+  const cmd = new InvokeAgentRuntimeCommand({
+    agentRuntimeArn: arn,
+    runtimeSessionId: nanoid(40),
+    qualifier: "DEFAULT",
+    payload: new TextEncoder().encode(JSON.stringify({ ...payloadObj, stream: true })),
+  });
+  try {
+    console.info(`[AgentCore][${label}] Stream request`, { arn, region: env.AWS_REGION, payload: payloadObj });
+    const resp = await client.send(cmd);
+    for await (const event of readAgentStream(resp.response)) {
+      console.info(`[AgentCore][${label}] Stream event`, { type: event.type, tool: (event as any).tool });
+      yield event;
+    }
+  } catch (err: any) {
+    console.error(`[AgentCore][${label}] Stream error`, { message: err?.message, stack: err?.stack });
+    throw err;
+  }
+}
+
+/** Streams per-tool results for one JD as each tool finishes, then a summary event. */
+export function streamJdProcess(jobId: string): AsyncGenerator<AgentStreamEvent> {
+  return streamAgentCore("JD", getEnv().JD_AGENT_RUNTIME_ARN, { jd_id: String(jobId) });
+}
+
+/** Streams per-tool results for one candidate as each tool finishes, then a summary event. */
+export function streamResumeProcess(candidateId: string): AsyncGenerator<AgentStreamEvent> {
+  return streamAgentCore("Resume", getEnv().RESUME_AGENT_RUNTIME_ARN, { id: String(candidateId) });
+}
+
 async function callJdAgentCore(jobId: string): Promise<JdProcessOutput> {
   const env = getEnv();
   if (!env.JD_AGENT_RUNTIME_ARN) throw new Error("JD AgentCore runtime ARN not configured");
@@ -9,6 +9,8 @@ const EnvSchema = z.object({
   DYNAMO_TABLE_USERS: z.string().default("users"),
   DYNAMO_TABLE_JOBS: z.string().default("jobs"),
   DYNAMO_TABLE_CANDIDATES: z.string().default("candidates"),
+  // The tools' PARTIAL_RESULTS_TABLE (unset = no partial results while a candidate is processing)
+  DYNAMO_TABLE_PARTIAL_RESULTS: z.string().optional(),
 
   JWT_SECRET: z.string().min(5, "JWT_SECRET should be reasonably long").default("qwerty123"),
 
@@ -40,6 +42,7 @@ export function getEnv(): AppEnv {
     DYNAMO_TABLE_USERS: process.env.DYNAMO_TABLE_USERS,
     DYNAMO_TABLE_JOBS: process.env.DYNAMO_TABLE_JOBS,
     DYNAMO_TABLE_CANDIDATES: process.env.DYNAMO_TABLE_CANDIDATES,
+    DYNAMO_TABLE_PARTIAL_RESULTS: process.env.DYNAMO_TABLE_PARTIAL_RESULTS,
 
     JWT_SECRET: process.env.JWT_SECRET,
 
@@ -69,6 +72,7 @@ export const tables = {
   users: () => getEnv().DYNAMO_TABLE_USERS,
   jobs: () => getEnv().DYNAMO_TABLE_JOBS,
   candidates: () => getEnv().DYNAMO_TABLE_CANDIDATES,
+  partialResults: () => getEnv().DYNAMO_TABLE_PARTIAL_RESULTS,
 };
 
 
@@ -0,0 +1,18 @@
+import { BatchGetCommand } from "@aws-sdk/lib-dynamodb";
+import { getDynamoDbDocumentClient } from "./dynamodb";
+import { tables } from "./env";
+
+/** Items the list tools have streamed so far, per partial_results_key; {} when the table is not configured. */
+export async function getPartialResults(keys: string[]): Promise<Record<string, any[]>> {
+  const table = tables.partialResults();
+  if (!table || !keys.length) return {};
+  const ddb = getDynamoDbDocumentClient();
+  const res = await ddb.send(
+    new BatchGetCommand({ RequestItems: { [table]: { Keys: keys.map((partial_key) => ({ partial_key })) } } }),
+  );
+  const out: Record<string, any[]> = {};
+  for (const row of res.Responses?.[table] || []) {
+    out[row.partial_key] = Array.isArray(row.items) ? row.items : [];
+  }
+  return out;
+}